@@ -14,6 +14,7 @@ warn(deprecation_msg, FutureWarning, stacklevel=2)
 
 from _icepyx_version import version as __version__
 
+from icepyx.core.catalog import GranuleCatalog
 from icepyx.core.query import GenQuery, Query
 from icepyx.core.read import Read
 from icepyx.core.variables import Variables
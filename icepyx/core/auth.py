@@ -1,7 +1,13 @@
 import copy
 import datetime
+import threading
 
 import earthaccess
+import s3fs
+
+# s3 credentials expire after one hour. They are replaced five minutes early,
+# so they do not expire while a file is being read or downloaded.
+S3_CREDENTIALS_REFRESH = datetime.timedelta(minutes=55)
 
 
 class AuthenticationError(Exception):
@@ -10,6 +16,49 @@ class AuthenticationError(Exception):
     """
 
 
+class _S3Access:
+    """
+    The s3 credentials and filesystem for an Earthdata user, which can be shared by
+    every object authenticated as that user and used from several threads at once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._credentials = None
+        self._initial_ts = None
+        self._filesystem = None
+
+    def _current_credentials(self, auth):
+        # must be called while holding the lock
+        if self._credentials is None or (
+            datetime.datetime.now() - self._initial_ts >= S3_CREDENTIALS_REFRESH
+        ):
+            self._credentials = auth.get_s3_credentials(daac="NSIDC")
+            self._initial_ts = datetime.datetime.now()
+            self._filesystem = None
+        return self._credentials
+
+    def credentials(self, auth):
+        with self._lock:
+            return self._current_credentials(auth)
+
+    def filesystem(self, auth):
+        with self._lock:
+            creds = self._current_credentials(auth)
+            if self._filesystem is None:
+                self._filesystem = s3fs.S3FileSystem(
+                    key=creds["accessKeyId"],
+                    secret=creds["secretAccessKey"],
+                    token=creds["sessionToken"],
+                )
+            return self._filesystem
+
+
+# s3 access for each Earthdata username
+_s3_access = {}
+_s3_access_lock = threading.Lock()
+
+
 class EarthdataAuthMixin:
     """
     This mixin class generates the needed authentication sessions and tokens,
@@ -48,8 +97,8 @@ class EarthdataAuthMixin:
         # initialization of session and s3 creds is not allowed because those are generated
         # from the auth object
         self._session = None
-        self._s3login_credentials = None
-        self._s3_initial_ts = None  # timer for 1h expiration on s3 credentials
+        # s3 credentials and filesystem, if they cannot be shared by username
+        self._s3_access = None
 
     def __str__(self) -> str:
         if self.session:
@@ -86,25 +135,39 @@ class EarthdataAuthMixin:
             self._session = self.auth.get_session()
         return self._session
 
+    @property
+    def _s3(self):
+        """
+        The s3 access shared by every object logged in as the same Earthdata user.
+        """
+        username = getattr(self.auth, "username", None)
+        with _s3_access_lock:
+            if username is None:
+                if self._s3_access is None:
+                    self._s3_access = _S3Access()
+                return self._s3_access
+            return _s3_access.setdefault(username, _S3Access())
+
     @property
     def s3login_credentials(self):
         """
         A dictionary which stores login credentials for AWS s3 access.
         This property is accessed if using AWS cloud data.
 
-        Because s3 tokens are only good for one hour, this function will automatically check if an
-        hour has elapsed since the last token use and generate a new token if necessary.
+        Because s3 tokens are only good for one hour, this function will automatically check if
+        the token is about to expire and generate a new token if necessary.
+        The credentials are shared by all objects logged in as the same Earthdata user.
         """
+        return self._s3.credentials(self.auth)
 
-        def set_s3_creds():
-            """Store s3login creds from `auth`and reset the last updated timestamp"""
-            self._s3login_credentials = self.auth.get_s3_credentials(daac="NSIDC")
-            self._s3_initial_ts = datetime.datetime.now()
-
-        # Only generate s3login_credentials the first time credentials are accessed, or if an hour
-        # has passed since the last login
-        if self._s3login_credentials is None or (
-            datetime.datetime.now() - self._s3_initial_ts
-        ) >= datetime.timedelta(hours=1):
-            set_s3_creds()
-        return self._s3login_credentials
+    @property
+    def s3fs(self):
+        """
+        An s3fs filesystem for reading NSIDC data in AWS s3 (e.g. with `s3fs.open`).
+
+        The filesystem is created once from `s3login_credentials` (and again when they are
+        refreshed), and is shared by all objects logged in as the same Earthdata user,
+        so files can be opened without creating a new session or fetching new credentials.
+        It can be used from several threads at once.
+        """
+        return self._s3.filesystem(self.auth)
@@ -0,0 +1,346 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import xarray as xr
+
+# default number of seconds before a cached value expires (one week)
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+# default disk space (in bytes) used by a DatasetCache (10 GiB)
+DEFAULT_DATASET_CACHE_SIZE = 10 * 1024**3
+
+
+def cache_dir():
+    """
+    Return the directory icepyx stores cached values in.
+
+    The location is set by the $ICEPYX_CACHE_DIR environment variable.
+    If it is not set, the `icepyx` directory in the user's cache directory
+    ($XDG_CACHE_HOME, or ~/.cache) is used.
+
+    Examples
+    --------
+    >>> cache_dir() # doctest: +SKIP
+    '/home/user/.cache/icepyx'
+    """
+
+    if os.environ.get("ICEPYX_CACHE_DIR"):
+        return os.path.expanduser(os.environ["ICEPYX_CACHE_DIR"])
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+    return os.path.join(os.path.expanduser(xdg_cache), "icepyx")
+
+
+def _read_ttl(env_var, default):
+    try:
+        return float(os.environ[env_var])
+    except KeyError:
+        return default
+    except ValueError:
+        raise ValueError(
+            f"The {env_var} environment variable must be a number of seconds"
+        )
+
+
+def default_ttl():
+    """
+    Return the default number of seconds cached values are valid for.
+
+    The default is set by the $ICEPYX_CACHE_TTL environment variable (in seconds),
+    or is one week if it is not set. A value of 0 disables all caching.
+    """
+
+    return _read_ttl("ICEPYX_CACHE_TTL", DEFAULT_TTL)
+
+
+def ttl_setting(env_var, default):
+    """
+    Return the number of seconds values of a particular kind are cached for,
+    so that different kinds of values (e.g. responses from different web services)
+    can expire at different rates.
+
+    Parameters
+    ----------
+    env_var : string
+        Name of the environment variable that sets the number of seconds.
+    default : float
+        Number of seconds to use if the environment variable is not set.
+
+    Returns
+    -------
+    float
+        0 (i.e. not cached) if caching is disabled through $ICEPYX_CACHE_TTL.
+    """
+
+    if default_ttl() == 0:
+        return 0
+    return _read_ttl(env_var, default)
+
+
+class FileCache:
+    """
+    A simple on-disk cache of JSON-serializable values, shared between Python sessions
+    (and processes) on the same machine.
+
+    Each value is stored as a JSON file in a namespace subdirectory of `cache_dir()`.
+    The cache is only an optimization: values that cannot be read (e.g. they are
+    missing, expired, or corrupted) are treated as not cached, and values that
+    cannot be written are skipped.
+
+    Parameters
+    ----------
+    namespace : string
+        Name of the subdirectory the values are stored in (e.g. "variables").
+    ttl : float, default None
+        Number of seconds a value is valid for after it is stored.
+        If None, `default_ttl()` is used. A ttl of 0 disables the cache.
+
+    Examples
+    --------
+    >>> cache = FileCache("variables") # doctest: +SKIP
+    >>> cache.set("ATL06_006", ["orbit_info/sc_orient"]) # doctest: +SKIP
+    >>> cache.get("ATL06_006") # doctest: +SKIP
+    ['orbit_info/sc_orient']
+    """
+
+    def __init__(self, namespace, ttl=None):
+        self._dir = os.path.join(cache_dir(), namespace)
+        self._ttl = default_ttl() if ttl is None else ttl
+
+    @property
+    def enabled(self):
+        """
+        Whether values are stored and retrieved (i.e. the ttl is greater than 0).
+        """
+        return self._ttl > 0
+
+    def _path(self, key):
+        return os.path.join(
+            self._dir, hashlib.sha256(str(key).encode()).hexdigest() + ".json"
+        )
+
+    def get(self, key):
+        """
+        Return the value stored for a key, or None if there is no valid cached value.
+
+        Parameters
+        ----------
+        key : string
+            Key the value was stored under.
+        """
+
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self._ttl:
+                return None
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # guard against (unlikely) hash collisions
+        if not isinstance(entry, dict) or entry.get("key") != str(key):
+            return None
+        return entry.get("value")
+
+    def set(self, key, value):
+        """
+        Store a JSON-serializable value under a key.
+
+        Parameters
+        ----------
+        key : string
+            Key to store the value under.
+        value : JSON-serializable object
+            Value to store.
+        """
+
+        if not self.enabled:
+            return
+
+        try:
+            os.makedirs(self._dir, exist_ok=True)
+            # write to a temporary file and move it into place, so other processes
+            # never read a partially written value
+            fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"key": str(key), "value": value}, f)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def clear(self):
+        """
+        Remove all of the values stored in this cache's namespace.
+        """
+
+        try:
+            filenames = os.listdir(self._dir)
+        except OSError:
+            return
+        for filename in filenames:
+            if filename.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self._dir, filename))
+                except OSError:
+                    pass
+
+
+class DatasetCache:
+    """
+    An on-disk cache of Xarray Datasets (e.g. granules converted by `Read.load`),
+    shared between Python sessions (and processes) on the same machine.
+
+    Each Dataset is stored as a netCDF file with contiguous (uncompressed) arrays
+    in a namespace subdirectory of `cache_dir()`, so it can be read back much faster
+    than it can be recreated. When the files take up more than `max_bytes`,
+    the least recently used Datasets are removed.
+    As with `FileCache`, Datasets that cannot be read are treated as not cached,
+    and Datasets that cannot be written are skipped.
+
+    Parameters
+    ----------
+    namespace : string, default "datasets"
+        Name of the subdirectory the Datasets are stored in.
+    max_bytes : int, default DEFAULT_DATASET_CACHE_SIZE
+        Disk space the cached Datasets may use, in bytes.
+
+    Examples
+    --------
+    >>> cache = DatasetCache(max_bytes=50 * 1024**3) # doctest: +SKIP
+    >>> ds = reader.load(cache=cache) # doctest: +SKIP
+    """
+
+    def __init__(self, namespace="datasets", max_bytes=DEFAULT_DATASET_CACHE_SIZE):
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise ValueError("max_bytes must be a non-negative integer")
+        self._dir = os.path.join(cache_dir(), namespace)
+        self.max_bytes = max_bytes
+
+    def __repr__(self):
+        return f"DatasetCache({self._dir!r}, max_bytes={self.max_bytes})"
+
+    def _path(self, key):
+        return os.path.join(
+            self._dir, hashlib.sha256(str(key).encode()).hexdigest() + ".nc"
+        )
+
+    def get(self, key, chunks=None):
+        """
+        Return the Dataset stored for a key, or None if there is no readable cached Dataset.
+
+        Parameters
+        ----------
+        key : string
+            Key the Dataset was stored under.
+        chunks : int, str, or dict, default None
+            Dask chunk sizes to open the Dataset with, as accepted by
+            `xarray.open_dataset`. If None, the Dataset is read into memory.
+            Otherwise the cached file stays open until the Dataset is closed.
+        """
+
+        path = self._path(key)
+        try:
+            ds = xr.open_dataset(path, engine="h5netcdf", chunks=chunks)
+            if chunks is None:
+                with ds:
+                    ds.load()
+            # mark the Dataset as recently used
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return ds.drop_encoding()
+
+    def set(self, key, ds):
+        """
+        Store a Dataset under a key, then remove the least recently used Datasets
+        if the cache is larger than `max_bytes`.
+
+        Parameters
+        ----------
+        key : string
+            Key to store the Dataset under.
+        ds : Xarray Dataset
+            Dataset to store.
+        """
+
+        try:
+            os.makedirs(self._dir, exist_ok=True)
+            # write to a temporary file and move it into place, so other processes
+            # never read a partially written Dataset
+            fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+            os.close(fd)
+            try:
+                ds.drop_encoding().to_netcdf(tmp_path, engine="h5netcdf")
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError):
+            return
+        self._evict()
+
+    def _evict(self):
+        """
+        Remove the least recently used Datasets until the cache fits within `max_bytes`.
+        """
+
+        entries = []
+        with os.scandir(self._dir) as it:
+            for entry in it:
+                if entry.name.endswith(".nc"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    @property
+    def size(self):
+        """
+        Disk space used by the cached Datasets, in bytes.
+        """
+
+        try:
+            with os.scandir(self._dir) as it:
+                return sum(
+                    entry.stat().st_size for entry in it if entry.name.endswith(".nc")
+                )
+        except OSError:
+            return 0
+
+    def clear(self):
+        """
+        Remove all of the Datasets stored in this cache's namespace.
+        """
+
+        try:
+            filenames = os.listdir(self._dir)
+        except OSError:
+            return
+        for filename in filenames:
+            if filename.endswith(".nc"):
+                try:
+                    os.remove(os.path.join(self._dir, filename))
+                except OSError:
+                    pass
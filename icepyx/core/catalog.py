@@ -0,0 +1,484 @@
+from concurrent.futures import ProcessPoolExecutor
+import datetime as dt
+import fnmatch
+import os
+import sqlite3
+import warnings
+
+import h5py
+import numpy as np
+import shapely
+
+import icepyx.core.is2ref as is2ref
+import icepyx.core.spatial as spat
+import icepyx.core.temporal as tp
+
+# maximum number of points read from each ground track to make its footprint,
+# and the tolerance (in degrees) its footprint is simplified with
+FOOTPRINT_POINTS = 500
+FOOTPRINT_TOLERANCE = 0.01
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS granules (
+    path TEXT PRIMARY KEY,
+    product TEXT,
+    version TEXT,
+    cycle INTEGER,
+    rgt INTEGER,
+    region INTEGER,
+    start_time REAL,
+    end_time REAL,
+    mtime INTEGER,
+    size INTEGER,
+    inode INTEGER
+);
+CREATE INDEX IF NOT EXISTS granules_product ON granules (product, version);
+CREATE TABLE IF NOT EXISTS footprints (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL REFERENCES granules (path) ON DELETE CASCADE,
+    beam TEXT,
+    geometry BLOB
+);
+CREATE INDEX IF NOT EXISTS footprints_path ON footprints (path);
+CREATE VIRTUAL TABLE IF NOT EXISTS footprint_bounds USING rtree (
+    id, min_lon, max_lon, min_lat, max_lat
+);
+"""
+
+# number of granules added to the database in each transaction while scanning
+SCAN_BATCH_SIZE = 500
+
+# latitude and longitude variable names, in the order they are looked for
+_LAT_LON_NAMES = [("latitude", "longitude"), ("lat_ph", "lon_ph"), ("lat", "lon")]
+
+
+def _to_timestamp(value):
+    """
+    Convert a UTC date string (e.g. "2019-02-26T00:55:26.000000Z") or a (naive UTC)
+    datetime to seconds since 1970-01-01.
+    """
+    if isinstance(value, bytes):
+        value = value.decode()
+    if isinstance(value, str):
+        value = dt.datetime.fromisoformat(value.strip().rstrip("Z"))
+    return value.replace(tzinfo=dt.timezone.utc).timestamp()
+
+
+def _read_scalar(h5f, path):
+    """
+    Return the first value of a dataset in an open file, or None if it does not exist.
+    """
+    if path not in h5f:
+        return None
+    return np.asarray(h5f[path][()]).ravel()[0]
+
+
+def _track_footprint(track):
+    """
+    Make a simplified line through the locations in a ground track group,
+    from at most `FOOTPRINT_POINTS` of its points. Returns None if the group
+    has no latitude and longitude variables.
+    """
+
+    found = []
+
+    def find_lat_lon(name, node):
+        if not isinstance(node, h5py.Group):
+            return None
+        for lat_name, lon_name in _LAT_LON_NAMES:
+            if lat_name in node and lon_name in node:
+                found.append((node[lat_name], node[lon_name]))
+                return True
+        return None
+
+    if find_lat_lon("", track) is None:
+        track.visititems(find_lat_lon)
+    if not found:
+        return None
+
+    lat_ds, lon_ds = found[0]
+    step = max(1, int(np.ceil(lat_ds.shape[0] / FOOTPRINT_POINTS)))
+    lat = np.asarray(lat_ds[::step], dtype=float)
+    lon = np.asarray(lon_ds[::step], dtype=float)
+    valid = np.isfinite(lat) & np.isfinite(lon) & (np.abs(lat) <= 90)
+    valid &= np.abs(lon) <= 360
+    lat, lon = lat[valid], lon[valid]
+    if lat.size == 0:
+        return None
+
+    # keep tracks crossing the antimeridian continuous by using longitudes in [0, 360)
+    if np.ptp(lon) > 180:
+        lon = lon % 360
+
+    if lat.size == 1:
+        return shapely.Point(lon[0], lat[0])
+    return shapely.LineString(np.column_stack([lon, lat])).simplify(FOOTPRINT_TOLERANCE)
+
+
+def _granule_record(path):
+    """
+    Read the metadata and ground track footprints of a granule file.
+
+    Returns
+    -------
+    record : dict
+        The granule's path, product, version, cycle, rgt, region,
+        start_time and end_time (seconds since 1970-01-01), which are None if unknown.
+    footprints : list of tuples
+        Beam (ground track) name and shapely geometry of each ground track.
+    """
+
+    record = dict.fromkeys(
+        ["product", "version", "cycle", "rgt", "region", "start_time", "end_time"]
+    )
+    record["path"] = path
+
+    # see is2ref._GRANULE_FILENAME_RX for the parameter definitions
+    match = is2ref._GRANULE_FILENAME_RX.search(os.path.basename(path))
+    parsed = is2ref._parse_granule_filename(path)
+    if match is not None and parsed is not None:
+        record["product"], record["version"] = parsed
+        record["rgt"], record["cycle"], record["region"] = (
+            int(match.group(i)) for i in (9, 10, 11)
+        )
+
+    footprints = []
+    with h5py.File(path, "r") as h5f:
+        if record["product"] is None:
+            record["product"] = is2ref._read_product_attr(h5f)
+            record["version"] = is2ref._read_version_attr(h5f)
+        if record["cycle"] is None:
+            cycle = _read_scalar(h5f, "orbit_info/cycle_number")
+            record["cycle"] = None if cycle is None else int(cycle)
+        if record["rgt"] is None:
+            rgt = _read_scalar(h5f, "orbit_info/rgt")
+            record["rgt"] = None if rgt is None else int(rgt)
+
+        for key, var in [
+            ("start_time", "ancillary_data/data_start_utc"),
+            ("end_time", "ancillary_data/data_end_utc"),
+        ]:
+            value = _read_scalar(h5f, var)
+            if value is not None:
+                record[key] = _to_timestamp(value)
+
+        beams: list[str] = sorted(
+            str(name) for name in h5f if str(name).startswith(("gt", "pt"))
+        )
+        for beam in beams:
+            if isinstance(h5f[beam], h5py.Group):
+                footprint = _track_footprint(h5f[beam])
+                if footprint is not None:
+                    footprints.append((beam, footprint))
+
+    return record, footprints
+
+
+def _fingerprint(stat):
+    """
+    Values identifying a version of a file: its modification time (ns), size, and inode.
+    """
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _try_granule_record(path):
+    """
+    Return `_granule_record(path)`, or None if the file cannot be read as a granule.
+    """
+    try:
+        return _granule_record(path)
+    except (OSError, KeyError, AssertionError, ValueError):
+        return None
+
+
+class GranuleCatalog:
+    """
+    A persistent local catalog of ICESat-2 granule files, stored in a SQLite database,
+    for selecting the files covering a spatial extent and/or date range
+    without opening them.
+
+    For each granule file the catalog records the product, version, cycle, rgt, region,
+    time span, and a simplified footprint of each ground track (in a spatial index).
+    Files are added to the catalog by scanning directories with `scan`; only files that
+    are new or changed since they were cataloged are opened (in parallel processes),
+    so a directory tree can be rescanned cheaply to keep the catalog up to date.
+
+    Parameters
+    ----------
+    db_path : string
+        Path to the SQLite database file. It is created if it does not exist.
+
+    Examples
+    --------
+    >>> catalog = ipx.GranuleCatalog('/path/to/catalog.db') # doctest: +SKIP
+    >>> catalog.scan('/path/to/data/') # doctest: +SKIP
+    >>> catalog.query([-55, 68, -48, 71], ['2019-02-20','2019-02-28']) # doctest: +SKIP
+    ['/path/to/data/processed_ATL06_20190221121851_08410203_006_01.h5']
+
+    The files can be read directly with a Read object:
+
+    >>> reader = ipx.Read(catalog, spatial_extent=[-55, 68, -48, 71]) # doctest: +SKIP
+    """
+
+    def __init__(self, db_path):
+        self._db_path = db_path
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def __repr__(self):
+        return f"GranuleCatalog({self._db_path!r}, {len(self)} granules)"
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM granules").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Close the connection to the catalog database.
+        """
+        self._conn.close()
+
+    @property
+    def files(self):
+        """
+        Return the paths of all of the files in the catalog.
+        """
+        return [
+            row[0]
+            for row in self._conn.execute("SELECT path FROM granules ORDER BY path")
+        ]
+
+    def scan(self, directory, pattern="*.h5", workers=None):
+        """
+        Update the catalog with the granule files in a directory (and its subdirectories).
+
+        Each file's modification time, size, and inode are recorded with its metadata,
+        so rescanning a directory only opens the files that are new or have changed
+        since they were cataloged. Cataloged files in the directory that no longer
+        exist are removed from the catalog.
+
+        Parameters
+        ----------
+        directory : string
+            Directory to search for granule files.
+        pattern : string, default "*.h5"
+            Glob-style pattern the file names must match.
+        workers : int, default None
+            Number of processes to read the new or changed files with.
+            If None, one process per CPU is used. If 1, the files are read in this process.
+
+        Returns
+        -------
+        dict
+            Number of files "added", "updated", and "removed" (and "failed",
+            for files that could not be read as granules).
+        """
+
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError("workers must be a positive integer or None")
+
+        directory = os.path.abspath(directory)
+        found = {}
+        for dirpath, _, filenames in os.walk(directory):
+            for fn in filenames:
+                if fnmatch.fnmatch(fn, pattern):
+                    path = os.path.join(dirpath, fn)
+                    found[path] = _fingerprint(os.stat(path))
+
+        known = {
+            row[0]: tuple(row[1:])
+            for row in self._conn.execute(
+                "SELECT path, mtime, size, inode FROM granules"
+            )
+            if row[0].startswith(os.path.join(directory, ""))
+        }
+
+        removed = [path for path in known if path not in found]
+        to_read = sorted(path for path, fp in found.items() if known.get(path) != fp)
+
+        with self._conn:
+            for path in removed:
+                self._remove(path)
+
+        if workers == 1 or len(to_read) < 2:
+            results = map(_try_granule_record, to_read)
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            results = pool.map(
+                _try_granule_record,
+                to_read,
+                chunksize=max(
+                    1, len(to_read) // (4 * (workers or os.cpu_count() or 1))
+                ),
+            )
+
+        failed = []
+        try:
+            # commit in batches, so an interrupted scan keeps most of its progress
+            batch = []
+            for path, result in zip(to_read, results):
+                if result is None:
+                    failed.append(path)
+                    continue
+                record, footprints = result
+                record.update(zip(["mtime", "size", "inode"], found[path]))
+                batch.append((record, footprints))
+                if len(batch) == SCAN_BATCH_SIZE:
+                    self._add_all(batch)
+                    batch = []
+            self._add_all(batch)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        if failed:
+            warnings.warn(
+                f"{len(failed)} files could not be read as granules and were not "
+                f"cataloged: {failed}",
+                UserWarning,
+                stacklevel=2,
+            )
+
+        n_read = len(to_read) - len(failed)
+        n_updated = sum(path in known for path in to_read if path not in failed)
+        return {
+            "added": n_read - n_updated,
+            "updated": n_updated,
+            "removed": len(removed),
+            "failed": len(failed),
+        }
+
+    def _remove(self, path):
+        """
+        Delete a granule and its footprints (within a transaction).
+        """
+        # the spatial index is not linked to the footprints table, so is cleared first
+        self._conn.execute(
+            "DELETE FROM footprint_bounds WHERE id IN "
+            "(SELECT id FROM footprints WHERE path = ?)",
+            (path,),
+        )
+        self._conn.execute("DELETE FROM granules WHERE path = ?", (path,))
+
+    def _add_all(self, granules):
+        """
+        Insert the metadata and footprints of granules (replacing any existing entries)
+        in one transaction.
+        """
+        with self._conn:
+            for record, footprints in granules:
+                self._remove(record["path"])
+                self._conn.execute(
+                    "INSERT INTO granules (path, product, version, cycle, rgt, region, "
+                    "start_time, end_time, mtime, size, inode) VALUES (:path, "
+                    ":product, :version, :cycle, :rgt, :region, :start_time, "
+                    ":end_time, :mtime, :size, :inode)",
+                    record,
+                )
+                for beam, footprint in footprints:
+                    cursor = self._conn.execute(
+                        "INSERT INTO footprints (path, beam, geometry) VALUES (?, ?, ?)",
+                        (record["path"], beam, shapely.to_wkb(footprint)),
+                    )
+                    min_lon, min_lat, max_lon, max_lat = footprint.bounds
+                    self._conn.execute(
+                        "INSERT INTO footprint_bounds VALUES (?, ?, ?, ?, ?)",
+                        (cursor.lastrowid, min_lon, max_lon, min_lat, max_lat),
+                    )
+
+    def query(self, spatial_extent=None, date_range=None, product=None, version=None):
+        """
+        Find the granule files in the catalog that match all of the given criteria.
+
+        Granules without a footprint (e.g. gridded products) or time span
+        cannot be ruled out, so they match any spatial extent or date range.
+
+        Parameters
+        ----------
+        spatial_extent : Spatial object, list of coordinates, or string, default None
+            Spatial extent of interest, as a Spatial object or any input accepted by one
+            (bounding box, polygon, or geospatial polygon file).
+        date_range : Temporal object, list, or dict, default None
+            Date range of interest, as a Temporal object or any `date_range` input
+            accepted by one.
+        product : string, default None
+            ICESat-2 data product ID, e.g. "ATL06".
+        version : string, default None
+            Product version, e.g. "006".
+
+        Returns
+        -------
+        list of strings
+            Paths of the matching files, sorted.
+        """
+
+        conditions = []
+        params = []
+        if product is not None:
+            conditions.append("product = ?")
+            params.append(is2ref._validate_product(product))
+        if version is not None:
+            conditions.append("version = ?")
+            params.append(f"{int(version):03d}")
+        if date_range is not None:
+            if not isinstance(date_range, tp.Temporal):
+                date_range = tp.Temporal(date_range)
+            conditions.append("(end_time IS NULL OR end_time >= ?)")
+            conditions.append("(start_time IS NULL OR start_time <= ?)")
+            params.extend(
+                [_to_timestamp(date_range.start), _to_timestamp(date_range.end)]
+            )
+
+        sql = "SELECT path FROM granules"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        paths = {row[0] for row in self._conn.execute(sql, params)}
+
+        if spatial_extent is not None:
+            paths &= self._intersecting(spatial_extent)
+
+        return sorted(paths)
+
+    def _intersecting(self, spatial_extent):
+        """
+        Return the paths of the granules with a ground track intersecting the spatial
+        extent, or with no footprints.
+        """
+
+        if not isinstance(spatial_extent, spat.Spatial):
+            spatial_extent = spat.Spatial(spatial_extent)
+        region = shapely.union_all(spatial_extent.extent_as_gdf.geometry)
+        # footprints crossing the antimeridian are stored with longitudes in [0, 360),
+        # and regions crossing it may be given that way too
+        regions = [
+            shapely.affinity.translate(region, xoff=xoff) for xoff in (-360, 0, 360)
+        ]
+
+        paths = {
+            row[0]
+            for row in self._conn.execute(
+                "SELECT path FROM granules WHERE path NOT IN "
+                "(SELECT path FROM footprints)"
+            )
+        }
+        for reg in regions:
+            min_lon, min_lat, max_lon, max_lat = reg.bounds
+            rows = self._conn.execute(
+                "SELECT footprints.path, footprints.geometry FROM footprint_bounds "
+                "JOIN footprints ON footprints.id = footprint_bounds.id "
+                "WHERE max_lon >= ? AND min_lon <= ? AND max_lat >= ? AND min_lat <= ?",
+                (min_lon, max_lon, min_lat, max_lat),
+            )
+            for path, geometry in rows:
+                if path not in paths and shapely.from_wkb(geometry).intersects(reg):
+                    paths.add(path)
+
+        return paths
@@ -53,3 +53,9 @@ class ExhaustiveTypeGuardException(TypeGuardException):
     Used exclusively in cases where the typechecker needs a typeguard to tell it that a
     check is exhaustive.
     """
+
+
+class DownloadError(Exception):
+    """
+    Raised when a downloaded file is incomplete or corrupted.
+    """
@@ -1,22 +1,27 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-import io
 import json
 import os
 import pprint
-import re
+import threading
 import time
 from xml.etree import ElementTree as ET
 import zipfile
 
 import numpy as np
+import pandas as pd
 import requests
 from requests.compat import unquote
+import shapely
 
 import icepyx.core.APIformatting as apifmt
 from icepyx.core.auth import EarthdataAuthMixin
+from icepyx.core.cache import FileCache, ttl_setting
 import icepyx.core.exceptions
+from icepyx.core.exceptions import DownloadError
+import icepyx.core.is2ref as is2ref
 from icepyx.core.types import (
     CMRParams,
     EGIRequiredParamsDownload,
@@ -24,6 +29,226 @@ from icepyx.core.types import (
 )
 from icepyx.core.urls import DOWNLOAD_BASE_URL, GRANULE_SEARCH_BASE_URL, ORDER_BASE_URL
 
+# number of seconds to wait between the first order status requests, the factor the
+# wait grows by for each request while the order is processing, and the longest wait
+ORDER_POLL_DELAY = 5
+ORDER_POLL_BACKOFF = 1.5
+ORDER_POLL_MAX_DELAY = 60
+# maximum number of orders whose status is requested at the same time
+ORDER_POLL_WORKERS = 8
+# default number of orders downloaded at the same time, and the number of bytes
+# read from each download at a time
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_CHUNK_SIZE = 1024**2
+# number of times a dropped or corrupted download is resumed or restarted
+DOWNLOAD_RETRIES = 3
+# name of the file (in the download directory) the state of each order's download
+# is saved to
+DOWNLOAD_JOURNAL = ".icepyx_downloads.json"
+# number of bytes in each ranged request of an s3 download, and the default number of
+# requests made at the same time
+S3_PART_SIZE = 8 * 1024**2
+S3_DOWNLOAD_WORKERS = 16
+# relative difference allowed between the size of a complete (not subsetted) granule
+# on disk and its size in CMR (which may be rounded, or in MB rather than MiB)
+LOCAL_SIZE_TOLERANCE = 0.05
+
+
+def _parse_cmr_polygons(polygons):
+    """
+    Convert the polygons of a CMR granule entry into a single shapely geometry.
+
+    CMR polygons are lists of rings (the first being the exterior), each stored as a
+    string of space separated "latitude longitude" pairs.
+    """
+    geoms = []
+    for rings in polygons:
+        coords = [
+            np.array(ring.split(), dtype=float).reshape(-1, 2)[:, ::-1]
+            for ring in rings
+        ]
+        geoms.append(shapely.Polygon(coords[0], holes=coords[1:]))
+
+    if not geoms:
+        return None
+    elif len(geoms) == 1:
+        return geoms[0]
+    else:
+        return shapely.MultiPolygon(geoms)
+
+
+def _get_links(gran, prefix):
+    """
+    Get the links to data files (h5 or nc) starting with prefix from a CMR granule entry.
+    """
+    return [
+        link["href"]
+        for link in gran.get("links", [])
+        if link["href"].startswith(prefix) and link["href"].endswith((".h5", "nc"))
+    ]
+
+
+def _get_link(gran, prefix):
+    """
+    Get the first link to a data file (h5 or nc) starting with prefix from a CMR granule entry.
+    """
+    links = _get_links(gran, prefix)
+    return links[0] if links else None
+
+
+def _catalog_from_json(grans) -> pd.DataFrame:
+    """
+    Normalize a list of CMR granule json dictionaries into a table with one row per granule.
+
+    Parameters
+    ----------
+    grans : list of dictionaries
+        List of input granule json dictionaries. Must have key "producer_granule_id".
+
+    Returns
+    -------
+    pandas.DataFrame
+        With columns:
+        id (producer granule id), size (MB), cycle, rgt, region (granule region),
+        start_time, end_time, s3_url, https_url, s3_urls, and footprint
+        (shapely geometry). s3_url and https_url are the first link of each kind
+        to a data file of the granule, and s3_urls is a list of all of its s3 links.
+        Values missing from the granule dictionaries (or file names) are null.
+    """
+    ids = pd.Series([gran["producer_granule_id"] for gran in grans], dtype=object)
+    # see is2ref._GRANULE_FILENAME_RX for the parameter definitions
+    fields = ids.str.extract(is2ref._GRANULE_FILENAME_RX)
+
+    def column(key):
+        return [gran.get(key) for gran in grans]
+
+    return pd.DataFrame(
+        {
+            "id": ids,
+            "size": pd.to_numeric(pd.Series(column("granule_size"), dtype=object)),
+            "cycle": pd.to_numeric(fields[9]).astype("Int64"),
+            "rgt": pd.to_numeric(fields[8]).astype("Int64"),
+            "region": pd.to_numeric(fields[10]).astype("Int64"),
+            "start_time": pd.to_datetime(column("time_start"), utc=True),
+            "end_time": pd.to_datetime(column("time_end"), utc=True),
+            "s3_url": pd.Series(
+                [_get_link(gran, "s3") for gran in grans], dtype=object
+            ),
+            "https_url": pd.Series(
+                [_get_link(gran, "https") for gran in grans], dtype=object
+            ),
+            "s3_urls": pd.Series(
+                [_get_links(gran, "s3") for gran in grans], dtype=object
+            ),
+            "footprint": pd.Series(
+                [_parse_cmr_polygons(gran.get("polygons", [])) for gran in grans],
+                dtype=object,
+            ),
+        }
+    )
+
+
+def _as_catalog(grans):
+    """
+    Return the granule table for a list of CMR granule json dictionaries,
+    or the input if it already is one.
+    """
+    if isinstance(grans, pd.DataFrame):
+        return grans
+    return _catalog_from_json(grans)
+
+
+def _footprints_intersecting(footprints, region):
+    """
+    Return a boolean array of whether each granule footprint intersects the region.
+
+    The footprints are bulk-loaded into a spatial index, so each is only compared
+    exactly with the region if its bounding box overlaps the region's.
+    Granules without a footprint (None) cannot be ruled out, so they are kept.
+    """
+    footprints = np.asarray(footprints, dtype=object)
+    has_footprint = np.array([fp is not None for fp in footprints], dtype=bool)
+    keep = ~has_footprint
+
+    # regions crossing the antimeridian are given with longitudes in [0, 360],
+    # while CMR footprints use [-180, 180]
+    if region.bounds[2] > 180:
+        region = shapely.union_all(
+            [region, shapely.affinity.translate(region, xoff=-360)]
+        )
+
+    if has_footprint.any():
+        tree = shapely.STRtree(footprints[has_footprint])
+        hits = tree.query(region, predicate="intersects")
+        keep[np.flatnonzero(has_footprint)[hits]] = True
+
+    return keep
+
+
+def _local_granules(path):
+    """
+    Find the granules already stored in a directory (or any of its subdirectories).
+
+    Returns
+    -------
+    dict
+        The size (in bytes) of each granule file, keyed by its producer granule id.
+        Granules subset by NSIDC (whose file names start with "processed_") have a
+        size of None, since their size cannot be compared with the full granule's.
+    """
+    local = {}
+    for dirpath, _, filenames in os.walk(path):
+        for fn in filenames:
+            if is2ref._parse_granule_filename(fn) is None:
+                continue
+            if fn.startswith("processed_"):
+                local[fn.removeprefix("processed_")] = None
+            elif fn not in local:
+                local[fn] = os.path.getsize(os.path.join(dirpath, fn))
+    return local
+
+
+def _write_journal(fn, content):
+    """
+    Save a JSON-serializable record of progress to a file. The file is replaced
+    in one step, so it is never left partially written.
+    """
+    tmp_fn = f"{fn}.tmp"
+    with open(tmp_fn, "w") as fid:
+        json.dump(content, fid)
+    os.replace(tmp_fn, fn)
+
+
+def _write_order_journal(order_fn, orderIDs, order_status):
+    """
+    Save the IDs of the completed orders and the status of every submitted order,
+    so orders are not resubmitted (and can be downloaded) if the session ends.
+    """
+    _write_journal(order_fn, {"orderIDs": list(orderIDs), "orders": dict(order_status)})
+
+
+class _BandwidthLimiter:
+    """
+    Limit the combined rate of the downloads that share this object
+    (from any number of threads) to an average number of bytes per second.
+    """
+
+    def __init__(self, rate):
+        self._rate = rate
+        self._lock = threading.Lock()
+        self._next_time = time.monotonic()
+
+    def wait(self, nbytes):
+        """
+        Wait until nbytes more can be transferred without exceeding the rate.
+        """
+        with self._lock:
+            now = time.monotonic()
+            # each transfer is given the next free interval of time at the rate
+            self._next_time = max(self._next_time, now) + nbytes / self._rate
+            delay = self._next_time - now
+        time.sleep(delay)
+
 
 def info(grans):
     """
@@ -31,19 +256,24 @@ def info(grans):
     query object. Granule info may be from a list of those available
     from NSIDC (for ordering/download) or a list of granules present on the
     file system.
+
+    Parameters
+    ----------
+    grans : list of dictionaries or pandas.DataFrame
+        List of input granule json dictionaries, or the equivalent granule
+        table (see `Granules.catalog`).
     """
     assert len(grans) > 0, "Your data object has no granules associated with it"
     gran_info = {}
     gran_info.update({"Number of available granules": len(grans)})
 
-    gran_sizes = [float(gran["granule_size"]) for gran in grans]
+    gran_sizes = _as_catalog(grans)["size"].to_numpy(dtype=float)
     gran_info.update({"Average size of granules (MB)": np.mean(gran_sizes)})
-    gran_info.update({"Total size of all granules (MB)": sum(gran_sizes)})
+    gran_info.update({"Total size of all granules (MB)": float(np.sum(gran_sizes))})
 
     return gran_info
 
 
-# DevNote: currently this fn is not tested
 # DevNote: could add flag to separate ascending and descending orbits based on ATL03 granule region
 def gran_IDs(grans, ids=False, cycles=False, tracks=False, dates=False, cloud=False):
     """
@@ -54,8 +284,9 @@ def gran_IDs(grans, ids=False, cycles=False, tracks=False, dates=False, cloud=Fa
 
     Parameters
     ----------
-    grans : list of dictionaries
-        List of input granule json dictionaries. Must have key "producer_granule_id"
+    grans : list of dictionaries or pandas.DataFrame
+        List of input granule json dictionaries (which must have key "producer_granule_id"),
+        or the equivalent granule table (see `Granules.catalog`).
     ids: boolean, default True
         Return a list of the available granule IDs for the granule dictionary
     cycles : boolean, default False
@@ -66,86 +297,148 @@ def gran_IDs(grans, ids=False, cycles=False, tracks=False, dates=False, cloud=Fa
         Return a list of the available dates for the granule dictionary.
     cloud : boolean, default False
         Return a a list of AWS s3 urls for the available granules in the granule dictionary.
+
+    Examples
+    --------
+    >>> gran_IDs([{"producer_granule_id": "ATL06_20190221121851_08410203_006_01.h5"}],
+    ...     ids=True, cycles=True, tracks=True, dates=True)
+    [['ATL06_20190221121851_08410203_006_01.h5'], ['02'], ['0841'], ['2019-02-21']]
     """
     assert len(grans) > 0, "Your data object has no granules associated with it"
-    # regular expression for extracting parameters from file names
-    rx = re.compile(
-        r"(ATL\d{2})(-\d{2})?_(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})"
-        r"(\d{2})_(\d{4})(\d{2})(\d{2})_(\d{3})_(\d{2})(.*?).(.*?)$"
-    )
-    gran_ids = []
-    gran_cycles = []
-    gran_tracks = []
-    gran_dates = []
-    gran_s3urls = []
-    for gran in grans:
-        producer_granule_id = gran["producer_granule_id"]
-        gran_ids.append(producer_granule_id)
-
-        if cloud is True:
-            try:
-                for link in gran["links"]:
-                    href = link["href"]
-                    if href.startswith("s3") and href.endswith((".h5", "nc")):
-                        gran_s3urls.append(href)
-            except KeyError:
-                pass
-
-        if any(param is True for param in [cycles, tracks, dates]):
-            # PRD: ICESat-2 product
-            # HEM: Sea Ice Hemisphere flag
-            # YY,MM,DD,HH,MN,SS: Year, Month, Day, Hour, Minute, Second
-            # TRK: Reference Ground Track (RGT)
-            # CYCL: Orbital Cycle
-            # GRAN: Granule region (1-14)
-            # RL: Data Release
-            # VERS: Product Version
-            # AUX: Auxiliary flags
-            # SFX: Suffix (h5)
-            (
-                PRD,
-                HEM,
-                YY,
-                MM,
-                DD,
-                HH,
-                MN,
-                SS,
-                TRK,
-                CYCL,
-                GRAN,
-                RL,
-                VERS,
-                AUX,
-                SFX,
-            ) = rx.findall(producer_granule_id).pop()
-            gran_cycles.append(CYCL)
-            gran_tracks.append(TRK)
-            gran_dates.append(
-                str(datetime.datetime(year=int(YY), month=int(MM), day=int(DD)).date())
-            )
+    catalog = _as_catalog(grans)
 
     # list of granule parameters
     gran_list = []
     # granule IDs
     if ids:
-        gran_list.append(gran_ids)
+        gran_list.append(catalog["id"].tolist())
     # orbital cycles
     if cycles:
-        gran_list.append(gran_cycles)
+        gran_list.append(catalog["cycle"].map("{:02d}".format).tolist())
     # reference ground tracks (RGTs)
     if tracks:
-        gran_list.append(gran_tracks)
+        gran_list.append(catalog["rgt"].map("{:04d}".format).tolist())
     # granule date
     if dates:
-        gran_list.append(gran_dates)
+        # see is2ref._GRANULE_FILENAME_RX for the parameter definitions
+        fields = catalog["id"].str.extract(is2ref._GRANULE_FILENAME_RX)
+        gran_list.append((fields[2] + "-" + fields[3] + "-" + fields[4]).tolist())
     # AWS s3 url
     if cloud:
-        gran_list.append(gran_s3urls)
+        # every s3 object of each granule, not only the first (s3_url)
+        gran_list.append([url for urls in catalog["s3_urls"] for url in urls])
     # return the list of granule parameters
     return gran_list
 
 
+def _search_cmr(params):
+    """
+    Run a CMR granule search, paging through all of the results.
+
+    Parameters
+    ----------
+    params : dict
+        CMR search parameters (see `Granules.get_avail`).
+
+    Returns
+    -------
+    list of granule json dictionaries
+    """
+
+    results_list = []
+
+    headers = {"Accept": "application/json", "Client-Id": "icepyx"}
+    # note we should also check for errors whenever we ping NSIDC-API -
+    # make a function to check for errors
+
+    cmr_search_after = None
+
+    while True:
+        if cmr_search_after is not None:
+            headers["CMR-Search-After"] = cmr_search_after
+
+        response = requests.get(
+            GRANULE_SEARCH_BASE_URL,
+            headers=headers,
+            params=apifmt.to_string(params),
+        )
+
+        try:
+            cmr_search_after = response.headers["CMR-Search-After"]
+        except KeyError:
+            cmr_search_after = None
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            if (
+                b"errors" in response.content
+            ):  # If CMR returns a bad status with extra information, display that
+                raise icepyx.core.exceptions.NsidcQueryError(
+                    response.json()["errors"]
+                )  # exception chaining will display original exception too
+            else:  # If no 'errors' key, just reraise original exception
+                raise e
+
+        results = json.loads(response.content)
+        if not results["feed"]["entry"]:
+            assert len(results_list) == int(response.headers["CMR-Hits"]), (
+                "Search failure - unexpected number of results"
+            )
+            break
+
+        # Collect results
+        results_list.extend(results["feed"]["entry"])
+
+    return results_list
+
+
+def _split_temporal(temporal, n_windows):
+    """
+    Split a CMR temporal search range into consecutive, non-overlapping windows.
+
+    Parameters
+    ----------
+    temporal : str
+        CMR temporal search value, formatted as "start,end"
+        (e.g. '2019-02-20T00:00:00Z,2019-02-28T23:59:59Z').
+    n_windows : int
+        Number of windows to split the range into.
+        Fewer windows are returned for ranges of fewer seconds.
+
+    Returns
+    -------
+    list of str
+        CMR temporal search values for each window, in order.
+        If the range cannot be split, a list containing only the input range.
+
+    Examples
+    --------
+    >>> _split_temporal('2019-02-20T00:00:00Z,2019-02-21T23:59:59Z', 2)
+    ['2019-02-20T00:00:00Z,2019-02-20T23:59:59Z', '2019-02-21T00:00:00Z,2019-02-21T23:59:59Z']
+    """
+
+    fmt = "%Y-%m-%dT%H:%M:%SZ"
+    try:
+        start, end = (datetime.datetime.strptime(t, fmt) for t in temporal.split(","))
+    except (AttributeError, ValueError):
+        return [temporal]
+
+    # CMR temporal ranges include both ends, so windows are split on whole seconds
+    n_seconds = int((end - start).total_seconds()) + 1
+    n_windows = max(1, min(n_windows, n_seconds))
+    bounds = [
+        start + datetime.timedelta(seconds=n_seconds * i // n_windows)
+        for i in range(n_windows + 1)
+    ]
+
+    return [
+        f"{bounds[i].strftime(fmt)},"
+        f"{(bounds[i + 1] - datetime.timedelta(seconds=1)).strftime(fmt)}"
+        for i in range(n_windows)
+    ]
+
+
 # DevGoal: this will be a great way/place to manage data from the local file system
 # where the user already has downloaded data!
 # DevNote: currently this class is not tested
@@ -175,6 +468,46 @@ class Granules(EarthdataAuthMixin):
         # self.files = files
         # session = session
 
+    # ----------------------------------------------------------------------
+    # Properties
+
+    @property
+    def avail(self):
+        """
+        List of the available granules (as CMR granule json dictionaries)
+        found by `get_avail`.
+        """
+        return self._avail
+
+    @avail.setter
+    def avail(self, value):
+        self._avail = value
+        self._catalog = None
+
+    @property
+    def catalog(self) -> pd.DataFrame:
+        """
+        Table of the available granules, with one row per granule and columns
+        for the fields parsed from their metadata:
+        id (producer granule id), size (MB), cycle, rgt, region (granule region),
+        start_time, end_time, s3_url, https_url, s3_urls (all of the granule's
+        s3 links), and footprint (shapely geometry).
+
+        The table is built once from `avail`, so summaries and filters of the
+        granules can be computed as column operations.
+
+        Examples
+        --------
+        >>> reg_a = ipx.Query('ATL06',[-55, 68, -48, 71],['2019-02-20','2019-02-28']) # doctest: +SKIP
+        >>> reg_a.avail_granules() # doctest: +SKIP
+        >>> reg_a.granules.catalog.groupby("cycle")["size"].sum() # doctest: +SKIP
+        """
+        catalog = getattr(self, "_catalog", None)
+        if catalog is None:
+            catalog = _catalog_from_json(self.avail)
+            self._catalog = catalog
+        return catalog
+
     # ----------------------------------------------------------------------
     # Methods
 
@@ -183,6 +516,8 @@ class Granules(EarthdataAuthMixin):
         CMRparams: CMRParams,
         reqparams: EGIRequiredParamsSearch,
         cloud: bool = False,
+        workers: int | None = None,
+        refresh: bool = False,
     ):
         """
         Get a list of available granules for the query object's parameters.
@@ -200,12 +535,24 @@ class Granules(EarthdataAuthMixin):
 
             .. deprecated:: 1.2
                 This parameter is ignored.
+        workers :
+            Number of searches to run concurrently.
+            If greater than 1, the temporal range of the search is split into this many
+            consecutive windows, which are searched at the same time and combined
+            (in order, without duplicates). The result is the same as a single search.
+            If None or 1, or there is no temporal range, a single search is run.
+        refresh :
+            Ignore any cached results and search CMR again.
 
         Notes
         -----
         This function is used by ``query.Query.avail_granules()``, which automatically
         feeds in the required parameters.
 
+        Search results are only cached on disk (see `icepyx.core.cache`) if the
+        $ICEPYX_CMR_GRANULES_TTL environment variable is set to the number of seconds
+        they should be reused for, since new granules are continually published.
+
         See Also
         --------
         APIformatting.Parameters
@@ -216,12 +563,8 @@ class Granules(EarthdataAuthMixin):
             "Missing required input parameter dictionaries"
         )
 
-        # if not hasattr(self, 'avail'):
-        self.avail = []
-
-        headers = {"Accept": "application/json", "Client-Id": "icepyx"}
-        # note we should also check for errors whenever we ping NSIDC-API -
-        # make a function to check for errors
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError("workers must be a positive integer or None")
 
         params = apifmt.combine_params(
             CMRparams,
@@ -229,49 +572,142 @@ class Granules(EarthdataAuthMixin):
             {"provider": "NSIDC_CPRD"},
         )
 
-        cmr_search_after = None
+        cache = FileCache("cmr_granules", ttl=ttl_setting("ICEPYX_CMR_GRANULES_TTL", 0))
+        cache_key = f"{GRANULE_SEARCH_BASE_URL}?{apifmt.to_string(params)}"
+        cached_avail = None if refresh else cache.get(cache_key)
 
-        while True:
-            if cmr_search_after is not None:
-                headers["CMR-Search-After"] = cmr_search_after
+        windows = None
+        if workers is not None and workers > 1 and "temporal" in params:
+            windows = _split_temporal(params["temporal"], workers)
 
-            response = requests.get(
-                GRANULE_SEARCH_BASE_URL,
-                headers=headers,
-                params=apifmt.to_string(params),
-            )
-
-            try:
-                cmr_search_after = response.headers["CMR-Search-After"]
-            except KeyError:
-                cmr_search_after = None
-
-            try:
-                response.raise_for_status()
-            except requests.HTTPError as e:
-                if (
-                    b"errors" in response.content
-                ):  # If CMR returns a bad status with extra information, display that
-                    raise icepyx.core.exceptions.NsidcQueryError(
-                        response.json()["errors"]
-                    )  # exception chaining will display original exception too
-                else:  # If no 'errors' key, just reraise original exception
-                    raise e
-
-            results = json.loads(response.content)
-            if not results["feed"]["entry"]:
-                assert len(self.avail) == int(response.headers["CMR-Hits"]), (
-                    "Search failure - unexpected number of results"
+        if cached_avail is not None:
+            self.avail = cached_avail
+        elif not windows or len(windows) == 1:
+            self.avail = _search_cmr(params)
+        else:
+            # the windows are independent searches, so run them concurrently
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                window_results = list(
+                    pool.map(
+                        lambda window: _search_cmr({**params, "temporal": window}),
+                        windows,
+                    )
                 )
-                break
 
-            # Collect results
-            self.avail.extend(results["feed"]["entry"])
+            # granules spanning the edge of a window are returned by both windows;
+            # keep the first, so the granules stay in the order of the full search
+            self.avail = []
+            gran_ids = set()
+            for results in window_results:
+                for gran in results:
+                    if gran["producer_granule_id"] not in gran_ids:
+                        gran_ids.add(gran["producer_granule_id"])
+                        self.avail.append(gran)
 
         assert len(self.avail) > 0, (
             "Your search returned no results; try different search parameters"
         )
 
+        if cached_avail is None:
+            cache.set(cache_key, self.avail)
+
+    def filter_by_footprint(self, spatial_extent):
+        """
+        Remove the available granules whose footprint does not intersect the
+        spatial extent.
+
+        CMR searches match granules against their (coarse) bounding polygons, so some
+        of the granules found by `get_avail` contain no data within the spatial extent.
+        This refinement compares each granule's footprint polygons with the spatial
+        extent itself, so these false positives are not ordered or downloaded.
+
+        Parameters
+        ----------
+        spatial_extent : Spatial object or shapely geometry
+            Spatial extent of interest (longitude, latitude coordinates).
+
+        Returns
+        -------
+        int
+            Number of granules removed from `avail`.
+
+        See Also
+        --------
+        query.Query.avail_granules
+        """
+
+        if hasattr(spatial_extent, "extent_as_gdf"):
+            region = shapely.union_all(spatial_extent.extent_as_gdf.geometry)
+        else:
+            region = spatial_extent
+
+        keep = _footprints_intersecting(self.catalog["footprint"], region)
+        n_removed = int((~keep).sum())
+
+        if n_removed > 0:
+            catalog = self.catalog[keep].reset_index(drop=True)
+            self.avail = [gran for gran, k in zip(self.avail, keep) if k]
+            self._catalog = catalog
+            print(
+                f"Removed {n_removed} of {len(keep)} granules whose footprint does "
+                "not intersect the spatial extent."
+            )
+
+        return n_removed
+
+    def remove_existing(self, path):
+        """
+        Remove the available granules that are already stored in a directory,
+        so only the missing granules are ordered or downloaded.
+
+        Granules are matched by their producer granule id (which includes the
+        product version), ignoring the "processed_" prefix of granules subset by NSIDC.
+        Complete granules must also match the size given by CMR, so partially
+        written files are downloaded again.
+
+        Parameters
+        ----------
+        path : string
+            Directory (including its subdirectories) to look for the granules in.
+
+        Returns
+        -------
+        list of strings
+            The producer granule ids of the granules that were removed from `avail`.
+
+        See Also
+        --------
+        query.Query.download_granules
+        """
+
+        local = _local_granules(path)
+        catalog = self.catalog
+
+        def exists(gran_id, size_mb):
+            if gran_id not in local:
+                return False
+            nbytes = local[gran_id]
+            if nbytes is None or pd.isna(size_mb):
+                return True
+            return abs(nbytes / 1024**2 - size_mb) <= LOCAL_SIZE_TOLERANCE * size_mb
+
+        keep = np.array(
+            [
+                not exists(gran_id, size_mb)
+                for gran_id, size_mb in zip(catalog["id"], catalog["size"])
+            ],
+            dtype=bool,
+        )
+        skipped = catalog["id"][~keep].tolist()
+
+        if skipped:
+            self.avail = [gran for gran, k in zip(self.avail, keep) if k]
+            self._catalog = catalog[keep].reset_index(drop=True)
+            print(f"Skipping {len(skipped)} of {len(keep)} granules already in {path}:")
+            pprint.pprint(skipped)
+
+        return skipped
+
     # DevNote: currently, default subsetting DOES NOT include variable subsetting,
     # only spatial and temporal
     # DevGoal: add kwargs to allow subsetting and more control over request options.
@@ -319,6 +755,11 @@ class Granules(EarthdataAuthMixin):
         This function is used by query.Query.order_granules(), which automatically
         feeds in the required parameters.
 
+        All of the order pages are submitted before their status is checked, so NSIDC
+        processes them at the same time. The status of each submitted order is saved
+        to the `.order_restart` file (along with the completed orderIDs) as it changes,
+        so orders are not lost if the session ends while they are processing.
+
         See Also
         --------
         query.Query.order_granules
@@ -349,6 +790,14 @@ class Granules(EarthdataAuthMixin):
         else:
             pagenums = range(1, total_pages + 1)
 
+        if not hasattr(self, "orderIDs"):
+            self.orderIDs = []
+        if not hasattr(self, "_order_status"):
+            self._order_status = {}
+
+        # submit every page before waiting for any of them, so NSIDC processes
+        # the orders at the same time
+        submitted = []
         for page_num in pagenums:
             print(
                 "Data request ",
@@ -389,105 +838,133 @@ class Granules(EarthdataAuthMixin):
                 orderlist.append(order.text)
             orderID = orderlist[0]
             print("order ID: ", orderID)
-
-            # Create status URL
-            statusURL = f"{ORDER_BASE_URL}/{orderID}"
             if verbose is True:
-                print("status URL: ", statusURL)
-
-            # Find order status
-            request_response = self.session.get(statusURL)
-            if verbose is True:
-                print(
-                    "HTTP response from order response URL: ",
-                    request_response.status_code,
-                )
-
-            # Raise bad request: Loop will stop for bad response code.
-            request_response.raise_for_status()
-            request_root = ET.fromstring(request_response.content)
-            statuslist = []
-            for status in request_root.findall("./requestStatus/"):
-                statuslist.append(status.text)
-            status = statuslist[0]
-            print("Initial status of your order request at NSIDC is: ", status)
-
-            loop_root = None
-            # If status is already finished without going into pending/processing
-            if status.startswith("complete"):
-                loop_response = self.session.get(statusURL)
-                loop_root = ET.fromstring(loop_response.content)
-
-            # Continue loop while request is still processing
-            while status == "pending" or status == "processing":
-                print(
-                    "Your order status is still ",
-                    status,
-                    " at NSIDC. Please continue waiting... this may take a few moments.",
+                print("status URL: ", f"{ORDER_BASE_URL}/{orderID}")
+
+            submitted.append(orderID)
+            self._order_status[orderID] = "submitted"
+            _write_order_journal(order_fn, self.orderIDs, self._order_status)
+
+        # Poll the status of all of the outstanding orders at once
+        journal_lock = threading.Lock()
+
+        def update_status(orderID, status):
+            with journal_lock:
+                self._order_status[orderID] = status
+                _write_order_journal(order_fn, self.orderIDs, self._order_status)
+
+        if submitted:
+            with ThreadPoolExecutor(
+                max_workers=min(len(submitted), ORDER_POLL_WORKERS)
+            ) as pool:
+                results = list(
+                    pool.map(
+                        lambda orderID: self._wait_for_order(
+                            orderID, update_status, verbose
+                        ),
+                        submitted,
+                    )
                 )
-                # print('Status is not complete. Trying again')
-                time.sleep(10)
-                loop_response = self.session.get(statusURL)
-
-                # Raise bad request: Loop will stop for bad response code.
-                loop_response.raise_for_status()
-                loop_root = ET.fromstring(loop_response.content)
-
-                # find status
-                statuslist = []
-                for status in loop_root.findall("./requestStatus/"):
-                    statuslist.append(status.text)
-                status = statuslist[0]
-                # print('Retry request status is: ', status)
-                if status == "pending" or status == "processing":
-                    continue
-
-            if not isinstance(loop_root, ET.Element):
-                # The typechecker needs help knowing that at this point loop_root is
-                # set, as it can't tell that the conditionals above are supposed to be
-                # exhaustive.
-                raise icepyx.core.exceptions.ExhaustiveTypeGuardException
+        else:
+            results = []
 
+        for orderID, (status, loop_root) in zip(submitted, results):
             # Order can either complete, complete_with_errors, or fail:
             # Provide complete_with_errors error message:
             if status == "complete_with_errors" or status == "failed":
                 messagelist = []
                 for message in loop_root.findall("./processInfo/"):
                     messagelist.append(message.text)
-                print("Your order is: ", status)
+                print("Your order", orderID, "is: ", status)
                 print("NSIDC provided these error messages:")
                 pprint.pprint(messagelist)
 
             if status == "complete" or status == "complete_with_errors":
-                print("Your order is:", status)
+                print("Your order", orderID, "is:", status)
                 messagelist = []
                 for message in loop_root.findall("./processInfo/info"):
                     messagelist.append(message.text)
                 if messagelist != []:
                     print("NSIDC returned these messages")
                     pprint.pprint(messagelist)
-                if not hasattr(self, "orderIDs"):
-                    self.orderIDs = []
 
                 self.orderIDs.append(orderID)
             else:
                 print("Request failed.")
 
-            # DevGoal: save orderIDs more frequently than just at the end for large orders
-            # (e.g. for len(reqparams['page_num']) > 5 or 10 or something)
-            # Save orderIDs to file to avoid resubmitting order in case kernel breaks down.
-            # save orderIDs for every 5 orders when more than 10 orders are submitted.
-            if reqparams["page_num"] >= 10:
-                with open(order_fn, "w") as fid:
-                    json.dump({"orderIDs": self.orderIDs}, fid)
-
         # --- Output the final orderIDs
-        with open(order_fn, "w") as fid:
-            json.dump({"orderIDs": self.orderIDs}, fid)
+        _write_order_journal(order_fn, self.orderIDs, self._order_status)
 
         return self.orderIDs
 
-    def download(self, verbose, path, restart=False):
+    def _wait_for_order(self, orderID, on_status_change, verbose=False):
+        """
+        Poll the status of a submitted order until NSIDC has finished processing it.
+
+        The time between status requests starts at `ORDER_POLL_DELAY` seconds and
+        grows by `ORDER_POLL_BACKOFF` (up to `ORDER_POLL_MAX_DELAY`) while the order is
+        still pending or processing, since large orders can take a long time.
+
+        Parameters
+        ----------
+        orderID : string
+            ID of the order, as returned when it was submitted.
+        on_status_change : callable
+            Function called with the order ID and status each time the status changes.
+        verbose : boolean, default False
+            Print out all feedback available from the order process.
+
+        Returns
+        -------
+        tuple
+            The final status and the root element of the final status XML response.
+        """
+
+        statusURL = f"{ORDER_BASE_URL}/{orderID}"
+        delay = ORDER_POLL_DELAY
+        prev_status = None
+
+        while True:
+            request_response = self.session.get(statusURL)
+            if verbose is True:
+                print(
+                    "HTTP response from order response URL: ",
+                    request_response.status_code,
+                )
+
+            # Raise bad request: Loop will stop for bad response code.
+            request_response.raise_for_status()
+            request_root = ET.fromstring(request_response.content)
+            statuslist = []
+            for status in request_root.findall("./requestStatus/"):
+                statuslist.append(status.text)
+            status = statuslist[0]
+
+            if status != prev_status:
+                if prev_status is None:
+                    print(
+                        "Initial status of your order request",
+                        orderID,
+                        "at NSIDC is: ",
+                        status,
+                    )
+                on_status_change(orderID, status)
+                prev_status = status
+
+            if status != "pending" and status != "processing":
+                return status, request_root
+
+            print(
+                "Your order",
+                orderID,
+                "status is still ",
+                status,
+                " at NSIDC. Please continue waiting... this may take a few moments.",
+            )
+            time.sleep(delay)
+            delay = min(delay * ORDER_POLL_BACKOFF, ORDER_POLL_MAX_DELAY)
+
+    def download(self, verbose, path, restart=False, workers=None, max_bandwidth=None):
         """
         Downloads the data for the object's orderIDs, which are generated by ordering data
         from the NSIDC.
@@ -504,12 +981,25 @@ class Granules(EarthdataAuthMixin):
             If the kernel has been restarted, but you successfully
             completed your order, you will need to re-initialize your query class object
             and can then skip immediately to the download_granules method with restart=True.
+        workers : int, default None
+            Number of orders to download at the same time.
+            If None, `DOWNLOAD_WORKERS` orders are downloaded at once.
+        max_bandwidth : float, default None
+            Maximum combined download rate of all of the orders, in MB per second.
+            If None, the download rate is not limited.
 
         Notes
         -----
         This function is used by query.Query.download_granules(), which automatically
         feeds in the required parameters.
 
+        Each order's zip file is streamed to a `.zip.part` file in `path` in chunks
+        (rather than held in memory) and then verified and extracted, so orders larger
+        than the available memory can be downloaded. Interrupted downloads resume from
+        the end of the `.part` file. The state of each order's download is saved to the
+        `DOWNLOAD_JOURNAL` file in `path`, which restart=True uses to skip the orders
+        that were already downloaded.
+
         See Also
         --------
         query.Query.download_granules
@@ -519,6 +1009,11 @@ class Granules(EarthdataAuthMixin):
             Unzip the downloaded granules.
         """
 
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError("workers must be a positive integer or None")
+        if max_bandwidth is not None and max_bandwidth <= 0:
+            raise ValueError("max_bandwidth must be a positive number or None")
+
         # DevNote: this will replace any existing orderIDs with the saved list
         # (could create confusion depending on whether download was interrupted or kernel restarted)
         order_fn = ".order_restart"
@@ -535,59 +1030,276 @@ class Granules(EarthdataAuthMixin):
         # DevNote: Temporary. Hard code the orderID info files here.
         # order_fn should be consistent with place_order.
 
-        downid_fn = ".download_ID"
-
-        i_order = 0
+        # state of each order's download, kept with the downloaded files
+        os.makedirs(path, exist_ok=True)
+        download_fn = os.path.join(path, DOWNLOAD_JOURNAL)
+        download_status = {}
+        if os.path.exists(download_fn):
+            with open(download_fn, "r") as fid:
+                download_status = json.load(fid)["orders"]
 
         if restart:
             print("Restarting download ... ")
 
-            # --- update the starting point of download list
-            if os.path.exists(downid_fn):
-                order_start = str(int(np.loadtxt(downid_fn)))
-                i_order = self.orderIDs.index(order_start) + 1
+            # --- skip the orders that were already downloaded
+            orders = [
+                order
+                for order in self.orderIDs
+                if download_status.get(order) != "downloaded"
+            ]
+        else:
+            orders = list(self.orderIDs)
+
+        limiter = (
+            _BandwidthLimiter(max_bandwidth * 1024**2)
+            if max_bandwidth is not None
+            else None
+        )
+        journal_lock = threading.Lock()
+
+        def update_status(order, status):
+            with journal_lock:
+                download_status[order] = status
+                _write_journal(download_fn, {"orders": download_status})
 
-        for order in self.orderIDs[i_order:]:
+        def download_order(order):
             downloadURL = f"{DOWNLOAD_BASE_URL}/{order}.zip"
             # DevGoal: get the download_url from the granules
+            # partially downloaded files are kept, so the download can be resumed
+            part_fn = os.path.join(path, f"{order}.zip.part")
 
             if verbose is True:
                 print("Zip download URL: ", downloadURL)
             print("Beginning download of zipped output...")
 
             try:
-                zip_response = self.session.get(downloadURL)
-                # Raise bad request: Loop will stop for bad response code.
-                zip_response.raise_for_status()
+                self._download_file(downloadURL, part_fn, limiter)
                 print(
                     "Data request",
                     order,
                     "of ",
-                    len(self.orderIDs[i_order:]),
+                    len(orders),
                     " order(s) is downloaded.",
                 )
-            except requests.HTTPError:
+            except (requests.RequestException, DownloadError) as e:
                 print(
                     "Unable to download ", order, ". Check granule order for messages."
                 )
+                if verbose is True:
+                    print(e)
+                update_status(order, "failed")
             # DevGoal: move this option back out to the is2class level
             # and implement it in an alternate way?
             #         #Note: extract the data to save it locally
             else:
-                with zipfile.ZipFile(io.BytesIO(zip_response.content)) as z:
+                with zipfile.ZipFile(part_fn) as z:
                     for zfile in z.filelist:
                         # Remove the subfolder name from the filepath
                         zfile.filename = os.path.basename(zfile.filename)
                         z.extract(member=zfile, path=path)
+                os.remove(part_fn)
+                update_status(order, "downloaded")
+
+        with ThreadPoolExecutor(max_workers=workers or DOWNLOAD_WORKERS) as pool:
+            # list() re-raises any unexpected error from the downloads
+            list(pool.map(download_order, orders))
+
+        # remove the orderID and download state files at the end,
+        # unless some orders still need to be downloaded (with restart=True)
+        if all(download_status.get(order) == "downloaded" for order in self.orderIDs):
+            if os.path.exists(order_fn):
+                os.remove(order_fn)
+            if os.path.exists(download_fn):
+                os.remove(download_fn)
+            print("Download complete")
+        else:
+            print(
+                "Some orders could not be downloaded. "
+                "Run the download again with restart=True to retry them."
+            )
 
-            # update the current finished order id and save to file
-            with open(downid_fn, "w") as fid:
-                fid.write(order)
+    def download_s3(self, path, workers=None):
+        """
+        Download the available granules directly from the NSIDC s3 bucket,
+        without placing an order.
 
-        # remove orderID and download id files at the end
-        if os.path.exists(order_fn):
-            os.remove(order_fn)
-        if os.path.exists(downid_fn):
-            os.remove(downid_fn)
+        Each granule is split into parts of `S3_PART_SIZE` bytes, and the parts of
+        all of the granules are fetched concurrently with ranged requests (through the
+        shared `s3fs` filesystem) and written into place in the granule files.
+        This requires access to the data in the cloud (i.e. running in AWS us-west-2).
+
+        Parameters
+        ----------
+        path : string
+            String with complete path to desired download directory and location.
+        workers : int, default None
+            Number of parts to download at the same time.
+            If None, `S3_DOWNLOAD_WORKERS` parts are downloaded at once.
+
+        Returns
+        -------
+        list of strings
+            Paths of the downloaded granule files.
+
+        Notes
+        -----
+        Granules whose file is already in `path` (with the size of the s3 object)
+        are not downloaded again. Files are written to a `.part` file and only
+        renamed once they are complete.
+
+        See Also
+        --------
+        query.Query.download_granules
+        """
+
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError("workers must be a positive integer or None")
+
+        urls = [url for url in self.catalog["s3_url"] if url is not None]
+        n_missing = len(self.catalog) - len(urls)
+        if n_missing > 0:
+            print(f"{n_missing} granules are not available in the cloud.")
+
+        os.makedirs(path, exist_ok=True)
+        filenames = [os.path.join(path, os.path.basename(url)) for url in urls]
+
+        with ThreadPoolExecutor(max_workers=workers or S3_DOWNLOAD_WORKERS) as pool:
+            sizes = list(pool.map(self._s3_size, urls))
+
+            parts = []
+            n_grans = 0
+            for url, fn, size in zip(urls, filenames, sizes):
+                if os.path.exists(fn) and os.path.getsize(fn) == size:
+                    continue
+                n_grans += 1
+                # allocate the whole file, so the parts can be written in any order
+                with open(f"{fn}.part", "wb") as f:
+                    f.truncate(size)
+                parts.extend(
+                    (url, f"{fn}.part", start, min(start + S3_PART_SIZE, size))
+                    for start in range(0, size, S3_PART_SIZE)
+                )
+
+            print(
+                "Beginning download of",
+                n_grans,
+                "granules in",
+                len(parts),
+                "parts from s3...",
+            )
+            # list() re-raises any error from the downloads
+            list(pool.map(lambda part: self._download_s3_part(*part), parts))
+
+        for fn, size in zip(filenames, sizes):
+            if os.path.exists(f"{fn}.part"):
+                if os.path.getsize(f"{fn}.part") != size:
+                    raise DownloadError(f"The download of {fn} is incomplete")
+                os.replace(f"{fn}.part", fn)
 
         print("Download complete")
+        return filenames
+
+    def _s3_size(self, url) -> int:
+        """
+        Return the size (in bytes) of an s3 object.
+        """
+        size = self.s3fs.size(url)
+        if size is None:
+            raise DownloadError(f"Could not get the size of {url}")
+        return size
+
+    def _download_s3_part(self, url, part_fn, start, end):
+        """
+        Copy bytes start to end (exclusive) of an s3 object into the same place in part_fn.
+        """
+        data = self.s3fs.cat_file(url, start=start, end=end)
+        if not isinstance(data, bytes):
+            raise DownloadError(f"Received unexpected data from {url}")
+        if len(data) != end - start:
+            raise DownloadError(
+                f"Received {len(data)} of the {end - start} bytes requested from {url}"
+            )
+        with open(part_fn, "r+b") as f:
+            f.seek(start)
+            f.write(data)
+
+    def _download_file(self, url, part_fn, limiter=None):
+        """
+        Download a file in chunks to part_fn, resuming from the end of part_fn
+        if it was already partly downloaded.
+
+        Dropped connections are resumed (up to `DOWNLOAD_RETRIES` times) with HTTP
+        range requests. The file is checked against the size given by the server
+        and, since NSIDC orders are zip files, the CRC of each file in it.
+        Corrupted files are removed and downloaded again.
+
+        Parameters
+        ----------
+        url : string
+            URL of the file to download.
+        part_fn : string
+            File to write the download to.
+        limiter : _BandwidthLimiter, default None
+            Limits the download rate (shared with any other downloads).
+        """
+
+        for attempt in range(DOWNLOAD_RETRIES + 1):
+            try:
+                self._resume_download(url, part_fn, limiter)
+
+                try:
+                    with zipfile.ZipFile(part_fn) as z:
+                        bad_file = z.testzip()
+                except zipfile.BadZipFile:
+                    bad_file = part_fn
+                if bad_file is not None:
+                    os.remove(part_fn)
+                    raise DownloadError(f"The download of {url} is corrupted")
+                return
+            except (
+                requests.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+                DownloadError,
+            ):
+                if attempt == DOWNLOAD_RETRIES:
+                    raise
+
+    def _resume_download(self, url, part_fn, limiter=None):
+        """
+        Request the part of a file not yet in part_fn and append it.
+        Raises a DownloadError if part_fn is not the size of the complete file afterwards.
+        """
+
+        offset = os.path.getsize(part_fn) if os.path.exists(part_fn) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset > 0 else {}
+
+        with self.session.get(url, stream=True, headers=headers) as response:
+            # the partial file already holds the complete file
+            if offset > 0 and response.status_code == 416:
+                return
+
+            # Raise bad request: Loop will stop for bad response code.
+            response.raise_for_status()
+
+            if response.status_code == 206:
+                # e.g. "bytes 100-999/1000"
+                total = response.headers.get("Content-Range", "").rpartition("/")[2]
+                mode = "ab"
+            else:
+                # the server sent the whole file
+                total = response.headers.get("Content-Length", "")
+                if response.headers.get("Content-Encoding", "identity") != "identity":
+                    total = ""
+                mode = "wb"
+
+            with open(part_fn, mode) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    if limiter is not None:
+                        limiter.wait(len(chunk))
+
+        size = os.path.getsize(part_fn)
+        if total.isdigit() and size != int(total):
+            if size > int(total):
+                os.remove(part_fn)
+            raise DownloadError(f"Downloaded {size} of the {total} bytes of {url}")
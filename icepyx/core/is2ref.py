@@ -1,4 +1,6 @@
 import json
+import os
+import re
 import warnings
 from xml.etree import ElementTree as ET
 
@@ -7,10 +9,28 @@ import h5py
 import numpy as np
 import requests
 
+import icepyx.core.APIformatting as apifmt
+from icepyx.core.cache import FileCache, ttl_setting
 from icepyx.core.urls import COLLECTION_SEARCH_BASE_URL, EGI_BASE_URL
 
 # ICESat-2 specific reference functions
 
+# regular expression for extracting parameters from granule file names
+# PRD: ICESat-2 product
+# HEM: Sea Ice Hemisphere flag
+# YY,MM,DD,HH,MN,SS: Year, Month, Day, Hour, Minute, Second
+# TRK: Reference Ground Track (RGT)
+# CYCL: Orbital Cycle
+# GRAN: Granule region (1-14)
+# RL: Data Release
+# VERS: Product Version
+# AUX: Auxiliary flags
+# SFX: Suffix (h5)
+_GRANULE_FILENAME_RX = re.compile(
+    r"(ATL\d{2})(-\d{2})?_(\d{4})(\d{2})(\d{2})(\d{2})(\d{2})"
+    r"(\d{2})_(\d{4})(\d{2})(\d{2})_(\d{3})_(\d{2})(.*?).(.*?)$"
+)
+
 
 def _validate_product(product):
     """
@@ -73,17 +93,37 @@ def _validate_OA_product(product):
 
 
 # DevNote: test for this function is commented out; dates in some of the values were causing the test to fail...
-def about_product(prod):
+def about_product(prod, refresh=False):
     """
     Ping Earthdata to get metadata about the product of interest (the collection).
 
+    Responses are cached on disk (see `icepyx.core.cache`) for one day,
+    or the number of seconds set by the $ICEPYX_CMR_COLLECTIONS_TTL environment variable.
+
+    Parameters
+    ----------
+    prod : string
+        ICESat-2 product short name (e.g. 'ATL06').
+    refresh : boolean, default False
+        Ignore any cached response and get the metadata from Earthdata.
+
     See Also
     --------
     query.Query.product_all_info
     """
 
-    response = requests.get(COLLECTION_SEARCH_BASE_URL, params={"short_name": prod})
-    results = json.loads(response.content)
+    params = {"short_name": prod}
+    cache = FileCache(
+        "cmr_collections", ttl=ttl_setting("ICEPYX_CMR_COLLECTIONS_TTL", 24 * 60 * 60)
+    )
+    cache_key = f"{COLLECTION_SEARCH_BASE_URL}?{apifmt.to_string(params)}"
+
+    results = None if refresh else cache.get(cache_key)
+    if results is None:
+        response = requests.get(COLLECTION_SEARCH_BASE_URL, params=params)
+        results = json.loads(response.content)
+        if response.ok:
+            cache.set(cache_key, results)
     return results
 
 
@@ -350,7 +390,74 @@ def latest_version(product):
     return max([entry["version_id"] for entry in _about_product["feed"]["entry"]])
 
 
-def extract_product(filepath, auth=None):
+def _parse_granule_filename(filepath):
+    """
+    Get the product and version of a granule from its file name, without opening the file.
+
+    Only standard ICESat-2 granule file names (e.g. ATL06_20190226005526_09100205_006_02.h5,
+    optionally with a prefix such as "processed_") can be parsed.
+
+    Parameters
+    ----------
+    filepath : string
+        Local or s3 location of a file.
+
+    Returns
+    -------
+    tuple of strings or None
+        The (product, version) of the granule,
+        or None if they could not be parsed from the file name.
+
+    Examples
+    --------
+    >>> _parse_granule_filename("/data/processed_ATL06_20190226005526_09100205_006_02.h5")
+    ('ATL06', '006')
+    >>> _parse_granule_filename("/data/ATL14_A1_0325_100m_004_05.nc") is None
+    True
+    """
+
+    match = _GRANULE_FILENAME_RX.search(os.path.basename(filepath))
+    if match is None:
+        return None
+
+    try:
+        product = _validate_product(match.group(1))
+    except AssertionError:
+        return None
+
+    return product, match.group(12)
+
+
+def _read_product_attr(h5f):
+    """
+    Read and validate the product from the metadata of an open h5py file.
+    Raises a KeyError if the file has no product metadata.
+    """
+    product = h5f.attrs["short_name"]
+    if isinstance(product, bytes):
+        # For most products the short name is stored in a bytes string
+        product = product.decode()
+    elif isinstance(product, np.ndarray):
+        # ATL14 saves the short_name as an array ['ATL14']
+        product = product[0]
+    return _validate_product(product)
+
+
+def _read_version_attr(h5f):
+    """
+    Read the version from the metadata of an open h5py file.
+    Raises a KeyError if the file has no version metadata.
+    """
+    version = h5f["METADATA"]["DatasetIdentification"].attrs["VersionID"]
+    if isinstance(version, np.ndarray):
+        # ATL14 stores the version as an array ['00x']
+        version = version[0]
+    if isinstance(version, bytes):
+        version = version.decode()
+    return version
+
+
+def extract_product(filepath, auth=None, s3fs=None):
     """
     Read the product type from the metadata of the file. Valid for local or s3 files, but must
     provide an auth object if reading from s3. Return the product as a string.
@@ -361,31 +468,28 @@ def extract_product(filepath, auth=None):
         local or remote location of a file. Could be a local string or an s3 filepath
     auth: earthaccess.auth.Auth, default None
         An earthaccess authentication object. Optional, but necessary if accessing data in an
-        s3 bucket.
+        s3 bucket (unless s3fs is given).
+    s3fs: s3fs.S3FileSystem, default None
+        An authenticated filesystem to open s3 files with
+        (e.g. `EarthdataAuthMixin.s3fs`), so a new one does not need to be created.
     """
     # Generate a file reader object relevant for the file location
     if filepath.startswith("s3"):
-        if not auth:
-            raise AttributeError(
-                "Must provide credentials to `auth` if accessing s3 data"
-            )
+        if s3fs is None:
+            if not auth:
+                raise AttributeError(
+                    "Must provide credentials to `auth` if accessing s3 data"
+                )
+            s3fs = earthaccess.get_s3fs_session(daac="NSIDC")
         # Read the s3 file
-        s3 = earthaccess.get_s3fs_session(daac="NSIDC")
-        f = h5py.File(s3.open(filepath, "rb"))
+        f = h5py.File(s3fs.open(filepath, "rb"))
     else:
         # Otherwise assume a local filepath. Read with h5py.
         f = h5py.File(filepath, "r")
 
     # Extract the product information
     try:
-        product = f.attrs["short_name"]
-        if isinstance(product, bytes):
-            # For most products the short name is stored in a bytes string
-            product = product.decode()
-        elif isinstance(product, np.ndarray):
-            # ATL14 saves the short_name as an array ['ATL14']
-            product = product[0]
-        product = _validate_product(product)
+        product = _read_product_attr(f)
     except KeyError as e:
         raise Exception(
             "Unable to parse the product name from file metadata"
@@ -396,7 +500,7 @@ def extract_product(filepath, auth=None):
     return product
 
 
-def extract_version(filepath, auth=None):
+def extract_version(filepath, auth=None, s3fs=None):
     """
     Read the version from the metadata of the file. Valid for local or s3 files, but must
     provide an auth object if reading from s3. Return the version as a string.
@@ -407,30 +511,28 @@ def extract_version(filepath, auth=None):
         local or remote location of a file. Could be a local string or an s3 filepath
     auth: earthaccess.auth.Auth, default None
         An earthaccess authentication object. Optional, but necessary if accessing data in an
-        s3 bucket.
+        s3 bucket (unless s3fs is given).
+    s3fs: s3fs.S3FileSystem, default None
+        An authenticated filesystem to open s3 files with
+        (e.g. `EarthdataAuthMixin.s3fs`), so a new one does not need to be created.
     """
     # Generate a file reader object relevant for the file location
     if filepath.startswith("s3"):
-        if not auth:
-            raise AttributeError(
-                "Must provide credentials to `auth` if accessing s3 data"
-            )
+        if s3fs is None:
+            if not auth:
+                raise AttributeError(
+                    "Must provide credentials to `auth` if accessing s3 data"
+                )
+            s3fs = earthaccess.get_s3fs_session(daac="NSIDC")
         # Read the s3 file
-        s3 = earthaccess.get_s3fs_session(daac="NSIDC")
-        f = h5py.File(s3.open(filepath, "rb"))
+        f = h5py.File(s3fs.open(filepath, "rb"))
     else:
         # Otherwise assume a local filepath. Read with h5py.
         f = h5py.File(filepath, "r")
 
     # Read the version information
     try:
-        version = f["METADATA"]["DatasetIdentification"].attrs["VersionID"]
-        if isinstance(version, np.ndarray):
-            # ATL14 stores the version as an array ['00x']
-            version = version[0]
-        if isinstance(version, bytes):
-            version = version.decode()
-
+        version = _read_version_attr(f)
     except KeyError as e:
         raise Exception(
             "Unable to parse the version from file metadata"
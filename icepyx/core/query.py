@@ -886,7 +886,16 @@ class Query(GenQuery, EarthdataAuthMixin):
     # Methods - Granules (NSIDC-API)
 
     # DevGoal: check to make sure the see also bits of the docstrings work properly in RTD
-    def avail_granules(self, ids=False, cycles=False, tracks=False, cloud=False):
+    def avail_granules(
+        self,
+        ids=False,
+        cycles=False,
+        tracks=False,
+        cloud=False,
+        workers=None,
+        refresh=False,
+        refine_footprints=False,
+    ):
         """
         Obtain information about the available granules for the query
         object's parameters. By default, a complete list of available granules is
@@ -909,6 +918,20 @@ class Query(GenQuery, EarthdataAuthMixin):
             Note: except in rare cases while data is in the process of being appended to,
             data available in the cloud and for download via on-premesis will be identical.
 
+        workers : int, default None
+            Number of concurrent searches to split the search for granules into
+            (by date range), which can speed up searches returning many granules.
+            See `granules.Granules.get_avail`.
+
+        refresh : boolean, default False
+            Search for the available granules again, even if they were already found
+            (or cached, see `granules.Granules.get_avail`).
+
+        refine_footprints : boolean, default False
+            Remove the granules whose footprint does not intersect the spatial extent
+            (CMR searches only match granules against their coarse bounding polygons).
+            See `granules.Granules.filter_by_footprint`.
+
         Examples
         --------
         >>> reg_a = ipx.Query('ATL06',[-55, 68, -48, 71],['2019-02-20','2019-02-28'])
@@ -929,27 +952,37 @@ class Query(GenQuery, EarthdataAuthMixin):
         #         REFACTOR: add test to make sure there's a session
         if not hasattr(self, "_granules"):
             self.granules
-        try:
-            self.granules.avail
-        except AttributeError:
-            self.granules.get_avail(self.CMRparams, self.reqparams)
+        if refresh or not hasattr(self.granules, "avail"):
+            self.granules.get_avail(
+                self.CMRparams, self.reqparams, workers=workers, refresh=refresh
+            )
+        if refine_footprints:
+            self.granules.filter_by_footprint(self._spatial)
 
         if ids or cycles or tracks or cloud:
             # list of outputs in order of ids, cycles, tracks, cloud
             return granules.gran_IDs(
-                self.granules.avail,
+                self.granules.catalog,
                 ids=ids,
                 cycles=cycles,
                 tracks=tracks,
                 cloud=cloud,
             )
         else:
-            return granules.info(self.granules.avail)
+            return granules.info(self.granules.catalog)
 
     # DevGoal: display output to indicate number of granules successfully ordered (and number of errors)
     # DevGoal: deal with subset=True for variables now, and make sure that if a variable subset
     # Coverage kwarg is input it's successfully passed through all other functions even if this is the only one run.
-    def order_granules(self, verbose=False, subset=True, email=False, **kwargs):
+    def order_granules(
+        self,
+        verbose=False,
+        subset=True,
+        email=False,
+        refine_footprints=False,
+        skip_existing=None,
+        **kwargs,
+    ):
         """
         Place an order for the available granules for the query object.
 
@@ -967,6 +1000,15 @@ class Query(GenQuery, EarthdataAuthMixin):
         email: boolean, default False
             Have NSIDC auto-send order status email updates to indicate order status as pending/completed.
             The emails are sent to the account associated with your Earthdata account.
+        refine_footprints : boolean, default False
+            Only order the granules whose footprint intersects the spatial extent
+            (see `avail_granules`). If any granules are removed, the remaining granules
+            are ordered by name (one order per granule).
+        skip_existing : string, default None
+            Path to a directory of previously downloaded granules. Only the granules
+            not already in the directory are ordered (by name, one order per granule),
+            and the skipped granules are reported.
+            See `granules.Granules.remove_existing`.
         **kwargs : key-value pairs
             Additional parameters to be passed to the subsetter.
             By default temporal and spatial subset keys are passed.
@@ -1020,10 +1062,28 @@ class Query(GenQuery, EarthdataAuthMixin):
         if not hasattr(self, "_granules"):
             self.granules
 
-        # Place multiple orders, one per granule, if readable_granule_name is used.
+        gran_name_list = None
         if "readable_granule_name[]" in self.CMRparams:
             gran_name_list = self.CMRparams["readable_granule_name[]"]
-            tempCMRparams = self.CMRparams
+        elif refine_footprints or skip_existing is not None:
+            # search again, since `avail` may already have been refined
+            self._granules.get_avail(self.CMRparams, self.reqparams)
+            n_removed = 0
+            if refine_footprints:
+                n_removed += self._granules.filter_by_footprint(self._spatial)
+            if skip_existing is not None:
+                n_removed += len(self._granules.remove_existing(skip_existing))
+
+            if len(self._granules.avail) == 0:
+                print("There are no granules left to order.")
+                return
+            elif n_removed > 0:
+                gran_name_list = list(self._granules.catalog["id"])
+
+        # Place multiple orders, one per granule, if readable_granule_name is used.
+        if gran_name_list is not None:
+            # a copy, so the granule names are not added to the query's parameters
+            tempCMRparams = cast(CMRParams, {**self.CMRparams})
             if len(gran_name_list) > 1:
                 print(
                     "NSIDC only allows ordering of one granule by name at a time; your orders will be placed accordingly."
@@ -1051,7 +1111,16 @@ class Query(GenQuery, EarthdataAuthMixin):
 
     # DevGoal: put back in the kwargs here so that people can just call download granules with subset=False!
     def download_granules(
-        self, path, verbose=False, subset=True, restart=False, **kwargs
+        self,
+        path,
+        verbose=False,
+        subset=True,
+        restart=False,
+        workers=None,
+        max_bandwidth=None,
+        skip_existing=False,
+        method="order",
+        **kwargs,
     ):  # , extract=False):
         """
         Downloads the data ordered using order_granules.
@@ -1071,6 +1140,20 @@ class Query(GenQuery, EarthdataAuthMixin):
             granules. This eliminates false-positive granules returned by the metadata-level search)
         restart : boolean, default false
             If previous download was terminated unexpectedly. Run again with restart set to True to continue.
+        workers : int, default None
+            Number of orders to download at the same time (see `granules.Granules.download`).
+        max_bandwidth : float, default None
+            Maximum combined download rate, in MB per second. If None, the rate is not limited.
+        skip_existing : boolean, default False
+            Only order (and download) the granules that are not already in `path`.
+            See `order_granules`.
+        method : string, default "order"
+            How the granules are downloaded. "order" orders them from NSIDC (with any
+            subsetting) and downloads the orders. "s3" copies the complete granules
+            directly from the NSIDC s3 bucket (no subsetting is applied and the order,
+            subset, and restart options are ignored), which requires running in
+            AWS us-west-2. `workers` is then the number of parts of the granules to
+            download at the same time (see `granules.Granules.download_s3`).
         **kwargs : key-value pairs
             Additional parameters to be passed to the subsetter.
             By default temporal and spatial subset keys are passed.
@@ -1098,9 +1181,19 @@ class Query(GenQuery, EarthdataAuthMixin):
         #     os.mkdir(path)
         # os.chdir(path)
 
+        if method not in ["order", "s3"]:
+            raise ValueError("method must be 'order' or 's3'")
+
         if not hasattr(self, "_granules"):
             self.granules
 
+        if method == "s3":
+            self.avail_granules()
+            if skip_existing:
+                self._granules.remove_existing(path)
+            self._granules.download_s3(path, workers=workers)
+            return
+
         if restart is True:
             pass
         else:
@@ -1108,9 +1201,23 @@ class Query(GenQuery, EarthdataAuthMixin):
                 not hasattr(self._granules, "orderIDs")
                 or len(self._granules.orderIDs) == 0
             ):
-                self.order_granules(verbose=verbose, subset=subset, **kwargs)
-
-        self._granules.download(verbose, path, restart=restart)
+                self.order_granules(
+                    verbose=verbose,
+                    subset=subset,
+                    skip_existing=path if skip_existing else None,
+                    **kwargs,
+                )
+                # every granule is already in path
+                if skip_existing and len(self._granules.avail) == 0:
+                    return
+
+        self._granules.download(
+            verbose,
+            path,
+            restart=restart,
+            workers=workers,
+            max_bandwidth=max_bandwidth,
+        )
 
     # DevGoal: add testing? What do we test, and how, given this is a visualization.
     # DevGoal(long term): modify this to accept additional inputs, etc.
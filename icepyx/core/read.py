@@ -1,16 +1,44 @@
+import functools
 import glob
+import json
 import os
 import sys
 import warnings
 
+from _icepyx_version import version as icepyx_version
 import earthaccess
+import fsspec
+import geopandas as gpd
+import h5py
 import numpy as np
+import pandas as pd
+import shapely
 import xarray as xr
 
 from icepyx.core.auth import EarthdataAuthMixin
+from icepyx.core.cache import DatasetCache
+from icepyx.core.catalog import _LAT_LON_NAMES, GranuleCatalog
 import icepyx.core.is2ref as is2ref
+import icepyx.core.spatial as spat
+import icepyx.core.temporal as tp
 from icepyx.core.variables import Variables as Variables
-from icepyx.core.variables import list_of_dict_vals
+from icepyx.core.variables import _PathIndex, list_of_dict_vals
+
+# Level 3b gridded (netcdf) products
+_GRIDDED_PRODUCTS = [
+    "ATL14",
+    "ATL15",
+    "ATL16",
+    "ATL17",
+    "ATL18",
+    "ATL19",
+    "ATL20",
+    "ATL21",
+    "ATL23",
+]
+
+# number of observations per chunk of each variable in Zarr stores written by Read.to_zarr
+ZARR_CHUNK_SIZE = 100_000
 
 
 def _make_np_datetime(df, keyword):
@@ -99,10 +127,15 @@ def _get_track_type_str(grp_path) -> (str, str, str):
     return track_str, spot_dim_name, spot_var_name
 
 
-def _parse_source(data_source, glob_kwargs={}) -> list:
+def _parse_source(
+    data_source, glob_kwargs={}, spatial_extent=None, date_range=None
+) -> list:
     """
     Parse the user's data_source input based on type.
 
+    spatial_extent and date_range are only used to select the files
+    of a GranuleCatalog (see `catalog.GranuleCatalog.query`).
+
     Returns
     -------
     filelist : list of str
@@ -111,7 +144,11 @@ def _parse_source(data_source, glob_kwargs={}) -> list:
 
     from pathlib import Path
 
-    if isinstance(data_source, list):
+    if isinstance(data_source, GranuleCatalog):
+        filelist = data_source.query(
+            spatial_extent=spatial_extent, date_range=date_range
+        )
+    elif isinstance(data_source, list):
         assert [isinstance(f, (str, Path)) for f in data_source]
         # if data_source is a list pass that directly to _filelist
         filelist = data_source
@@ -146,6 +183,493 @@ def _parse_source(data_source, glob_kwargs={}) -> list:
     return filelist
 
 
+def _get_pool_executor(executor) -> type:
+    """
+    Get the concurrent.futures executor class used to read multiple granules at once.
+
+    Parameters
+    ----------
+    executor : str
+        The type of worker pool. One of "process" or "thread".
+
+    Returns
+    -------
+    concurrent.futures.Executor subclass
+    """
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    executors = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+    try:
+        return executors[executor]
+    except KeyError:
+        raise ValueError(
+            f"Invalid executor: {executor}. Please select from this list: "
+            + ", ".join(executors.keys())
+        )
+
+
+def _get_subset(spatial_extent=None, date_range=None):
+    """
+    Create the spatial and/or temporal filters applied to each ground track while
+    the granules are being read.
+
+    Parameters
+    ----------
+    spatial_extent : Spatial object, list of coordinates, or string, default None
+        Spatial extent of interest, as a Spatial object or any input accepted by one
+        (bounding box, polygon, or geospatial polygon file).
+    date_range : Temporal object, list, or dict, default None
+        Date range of interest, as a Temporal object or any `date_range` input
+        accepted by one.
+
+    Returns
+    -------
+    dict or None
+        Dictionary with a "region" (shapely geometry) and/or "time_range"
+        (start and end as numpy datetime64) entry, or None if no filters were given.
+    """
+
+    subset = {}
+
+    if spatial_extent is not None:
+        if not isinstance(spatial_extent, spat.Spatial):
+            spatial_extent = spat.Spatial(spatial_extent)
+        subset["region"] = shapely.union_all(spatial_extent.extent_as_gdf.geometry)
+
+    if date_range is not None:
+        if not isinstance(date_range, tp.Temporal):
+            date_range = tp.Temporal(date_range)
+        subset["time_range"] = (
+            np.datetime64(date_range.start, "ns"),
+            np.datetime64(date_range.end, "ns"),
+        )
+
+    return subset or None
+
+
+def _subset_indexer(ds, subset):
+    """
+    Find the along-track indices of a ground track group within the spatial
+    and/or temporal extent of interest.
+
+    Only the latitude, longitude, and delta_time variables are read to do so.
+    Filters are only applied to groups containing the variables they need.
+
+    Parameters
+    ----------
+    ds : Xarray Dataset
+        Ground track group, as returned by `Read._read_single_grp`.
+    subset : dict
+        Filters, as returned by `_get_subset`.
+
+    Returns
+    -------
+    slice, numpy array, or None
+        The along-track (delta_time) indices to keep, as a slice if they are contiguous
+        (so only that hyperslab of each variable is read) or as an array otherwise.
+        None if the group could not be filtered and should be kept whole.
+    """
+
+    if "delta_time" not in ds.dims:
+        return None
+
+    mask = None
+
+    if "region" in subset:
+        for lat_name, lon_name in _LAT_LON_NAMES:
+            if lat_name in ds.variables and lon_name in ds.variables:
+                lat = ds[lat_name].values
+                lon = ds[lon_name].values
+                # regions crossing the dateline are given in 0-360 degree longitudes
+                if subset["region"].bounds[2] > 180:
+                    lon = np.where(lon < 0, lon + 360, lon)
+                mask = shapely.intersects_xy(subset["region"], lon, lat)
+                break
+
+    if "time_range" in subset:
+        delta_time = ds.delta_time.values
+        if not np.issubdtype(delta_time.dtype, np.datetime64):
+            # undecoded delta_times are seconds since the ATLAS SDP epoch
+            delta_time = np.datetime64("2018-01-01", "ns") + (delta_time * 1e9).astype(
+                "timedelta64[ns]"
+            )
+        start, end = subset["time_range"]
+        in_time = (delta_time >= start) & (delta_time <= end)
+        mask = in_time if mask is None else mask & in_time
+
+    if mask is None:
+        return None
+
+    idx = np.flatnonzero(mask)
+    if idx.size == 0:
+        return slice(0, 0)
+    elif idx.size == idx[-1] + 1 - idx[0]:
+        return slice(idx[0], idx[-1] + 1)
+    else:
+        return idx
+
+
+def _close_all(closers):
+    """
+    Call each of a list of close functions (e.g. to close all of the files
+    backing a lazily loaded Dataset).
+    """
+    for close in closers:
+        close()
+
+
+def _conversion_cache_key(product, file, groups_list, subset=None, s3fs=None):
+    """
+    Create the key a granule's Dataset is cached under (see `cache.DatasetCache`).
+
+    The key identifies the version of the file (by its modification time and size,
+    or s3 ETag), the wanted variables, the spatial/temporal subset,
+    and the icepyx version, so a cached Dataset is only reused if it would be
+    recreated identically.
+    """
+
+    if file.startswith("s3"):
+        if s3fs is None:
+            s3fs = earthaccess.get_s3fs_session(daac="NSIDC")
+        info = s3fs.info(file)
+        fingerprint = [info.get("ETag") or str(info.get("LastModified")), info["size"]]
+    else:
+        stat = os.stat(file)
+        fingerprint = [stat.st_mtime_ns, stat.st_size]
+
+    if subset is not None:
+        subset = {
+            "region": shapely.to_wkt(subset["region"]) if "region" in subset else None,
+            "time_range": [str(t) for t in subset.get("time_range", [])],
+        }
+
+    return json.dumps(
+        [icepyx_version, product, file, fingerprint, sorted(groups_list), subset]
+    )
+
+
+def _load_single_file(
+    product, file, groups_list, chunks=None, subset=None, s3fs=None, cache=None
+):
+    """
+    Open a single local or s3 file and create its Xarray Dataset.
+
+    This is a module-level function so that only the arguments it needs
+    (and not the Read object and its credentials) are sent to worker processes.
+
+    Parameters
+    ----------
+    product : str
+        ICESat-2 data product of the file.
+    file : str
+        Full path to ICESat-2 data file (local or s3 url).
+    groups_list : list of strings
+        List of full paths to data variables within the file.
+    chunks : int, str, or dict, default None
+        Dask chunk sizes for the data variables. If None, the data are read into memory.
+    subset : dict, default None
+        Spatial and/or temporal filters, as returned by `_get_subset`.
+    s3fs : s3fs.S3FileSystem, default None
+        Authenticated filesystem to open s3 files with (see `EarthdataAuthMixin.s3fs`).
+        If None, a new one is created for each s3 file.
+    cache : DatasetCache, default None
+        Cache to reuse the Dataset from, or store it in once it is created.
+
+    Returns
+    -------
+    Xarray Dataset
+    """
+
+    if cache is not None:
+        key = _conversion_cache_key(product, file, groups_list, subset, s3fs)
+        is2ds = cache.get(key, chunks)
+        if is2ds is not None:
+            return is2ds
+        is2ds = _load_single_file(product, file, groups_list, subset=subset, s3fs=s3fs)
+        cache.set(key, is2ds)
+        if chunks is None:
+            return is2ds
+        # lazily open the stored copy, so it is read as the data are needed
+        cached = cache.get(key, chunks)
+        return is2ds.chunk(chunks) if cached is None else cached
+
+    if file.startswith("s3"):
+        # If path is an s3 path use an s3fs filesystem to reference the file
+        if s3fs is None:
+            s3fs = earthaccess.get_s3fs_session(daac="NSIDC")
+        s3file = s3fs.open(file, "rb")
+        if chunks is not None:
+            # the file must stay open for the dask arrays to be read later
+            return Read._build_single_file_dataset(
+                product, s3file, groups_list, chunks, subset
+            )
+        with s3file:
+            return Read._build_single_file_dataset(
+                product, s3file, groups_list, subset=subset
+            )
+
+    return Read._build_single_file_dataset(product, file, groups_list, chunks, subset)
+
+
+def _get_out_obj_type(out_obj_type):
+    """
+    Return the class of the objects `Read.load` creates, given as a class or a name.
+
+    Parameters
+    ----------
+    out_obj_type : object, string, or None
+        xarray.Dataset ("xarray", the default if None), pandas.DataFrame ("pandas"),
+        geopandas.GeoDataFrame ("geopandas"), or pyarrow.Table ("arrow").
+    """
+
+    names = {
+        "xarray": xr.Dataset,
+        "pandas": pd.DataFrame,
+        "geopandas": gpd.GeoDataFrame,
+    }
+
+    if out_obj_type is None:
+        return xr.Dataset
+    elif out_obj_type in ("arrow", "pyarrow") or (
+        getattr(out_obj_type, "__module__", "").startswith("pyarrow")
+        and getattr(out_obj_type, "__name__", None) == "Table"
+    ):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "Reading data into Arrow tables requires the pyarrow package. "
+                "Please install it (e.g. `pip install pyarrow`)."
+            )
+        return pa.Table
+    elif isinstance(out_obj_type, str) and out_obj_type in names:
+        return names[out_obj_type]
+    elif any(out_obj_type is cls for cls in names.values()):
+        return out_obj_type
+
+    raise ValueError(
+        f"{out_obj_type} is not a supported output object type. Please use one of "
+        "xarray.Dataset, pandas.DataFrame, geopandas.GeoDataFrame, or pyarrow.Table "
+        "(or their names: 'xarray', 'pandas', 'geopandas', 'arrow')."
+    )
+
+
+def _read_h5_column(dset, indexer=None):
+    """
+    Read (part of) an HDF5 variable into a numpy array, decoding its fill values,
+    scaling, and times the same way as `Read._read_single_grp`.
+
+    Parameters
+    ----------
+    dset : h5py.Dataset
+        Variable to read.
+    indexer : slice or numpy array, default None
+        Indices along the first dimension to read, as returned by `_subset_indexer`.
+        If None, the whole variable is read.
+    """
+
+    if indexer is None:
+        data = dset[()]
+    elif isinstance(indexer, slice):
+        data = dset[indexer]
+    elif indexer.size == 0:
+        data = dset[0:0]
+    else:
+        # read the covering hyperslab at once instead of the scattered elements
+        data = dset[indexer[0] : indexer[-1] + 1][indexer - indexer[0]]
+
+    attrs = {
+        key: value.decode() if isinstance(value, bytes) else value
+        for key, value in dset.attrs.items()
+        if key in ("_FillValue", "scale_factor", "add_offset", "units", "calendar")
+    }
+    var = xr.Variable([f"dim_{i}" for i in range(np.ndim(data))], data, attrs)
+    return xr.decode_cf(xr.Dataset({"var": var}))["var"].values
+
+
+def _load_single_table(product, file, groups_list, subset=None, s3fs=None):
+    """
+    Open a single local or s3 file and create its table (see `_load_single_file`).
+
+    Returns
+    -------
+    pandas DataFrame
+    """
+
+    if file.startswith("s3"):
+        if s3fs is None:
+            s3fs = earthaccess.get_s3fs_session(daac="NSIDC")
+        with s3fs.open(file, "rb") as s3file:
+            return Read._build_single_file_table(product, s3file, groups_list, subset)
+
+    return Read._build_single_file_table(product, file, groups_list, subset)
+
+
+def _combine_tables(all_dfs, out_obj_type):
+    """
+    Concatenate the per-granule tables and convert them to the output object type.
+
+    Parameters
+    ----------
+    all_dfs : list of pandas DataFrames
+        One DataFrame per granule, as returned by `Read._build_single_file_table`.
+    out_obj_type : class
+        pandas.DataFrame, geopandas.GeoDataFrame, or pyarrow.Table.
+    """
+
+    # variables missing from some of the groups or granules are filled with NaN
+    df = pd.concat(all_dfs, ignore_index=True) if all_dfs else pd.DataFrame()
+
+    if out_obj_type is gpd.GeoDataFrame and df.empty:
+        return gpd.GeoDataFrame(df, geometry=[], crs="EPSG:4326")
+    elif out_obj_type is gpd.GeoDataFrame:
+        for lat_name, lon_name in _LAT_LON_NAMES:
+            if lat_name in df and lon_name in df:
+                return gpd.GeoDataFrame(
+                    df,
+                    geometry=gpd.points_from_xy(df[lon_name], df[lat_name]),
+                    crs="EPSG:4326",
+                )
+        raise ValueError(
+            "Creating a GeoDataFrame requires latitude and longitude variables. "
+            "Please add them to the wanted variables."
+        )
+    elif out_obj_type is not pd.DataFrame:
+        return out_obj_type.from_pandas(df, preserve_index=False)
+    return df
+
+
+def _has_unique_gran_idx(all_dss):
+    """
+    Check whether each Dataset holds a single granule with a granule index
+    that is unique among the Datasets.
+    """
+
+    if not all(ds.sizes.get("gran_idx") == 1 for ds in all_dss):
+        return False
+    gran_idxs = [ds.gran_idx.values[0] for ds in all_dss]
+    return len(set(gran_idxs)) == len(gran_idxs)
+
+
+def _concat_by_gran_idx(all_dss):
+    """
+    Concatenate per-granule Datasets along their (unique) granule index.
+
+    Because icepyx already gives every granule a unique `gran_idx`, the order of the
+    granules and the shared photon_idx coordinate can be computed directly, rather
+    than inferred by comparing the coordinate values of every Dataset
+    (as `xarray.combine_by_coords` does).
+
+    Parameters
+    ----------
+    all_dss : list of Xarray Datasets
+        One Dataset per granule, each with a `gran_idx` dimension of length 1.
+
+    Returns
+    -------
+    Xarray Dataset
+    """
+
+    order = np.argsort([ds.gran_idx.values[0] for ds in all_dss], kind="stable")
+
+    if all("photon_idx" in ds.dims for ds in all_dss):
+        # align every granule to the full set of photon indices up front,
+        # so the concatenation does not need to re-align them
+        photon_idx = np.unique(np.concatenate([ds.photon_idx.values for ds in all_dss]))
+        sorted_dss = [all_dss[i].reindex(photon_idx=photon_idx) for i in order]
+    else:
+        sorted_dss = [all_dss[i] for i in order]
+
+    return xr.concat(
+        sorted_dss,
+        dim="gran_idx",
+        data_vars="minimal",
+        coords="different",
+        compat="equals",
+        join="outer",
+        combine_attrs="drop_conflicts",
+    )
+
+
+def _combine_granules(all_dss, lazy=False):
+    """
+    Combine the per-granule Datasets into a single Dataset.
+
+    Parameters
+    ----------
+    all_dss : list of Xarray Datasets
+        One Dataset per granule, as returned by `Read._build_single_file_dataset`.
+    lazy : boolean, default False
+        Whether the Datasets are backed by open files, which are closed when the
+        combined Dataset is closed.
+
+    Returns
+    -------
+    Xarray Dataset, or the input list of Datasets if they could not be combined.
+    """
+
+    if len(all_dss) == 1:
+        return all_dss[0]
+    else:
+        try:
+            if _has_unique_gran_idx(all_dss):
+                merged_dss = _concat_by_gran_idx(all_dss)
+            else:
+                merged_dss = xr.combine_by_coords(all_dss, data_vars="minimal")
+            if lazy is True:
+                # closing the merged dataset closes all of the granule files
+                merged_dss.set_close(
+                    functools.partial(_close_all, [ds.close for ds in all_dss])
+                )
+            return merged_dss
+        except ValueError as ve:
+            warnings.warn(
+                "Your inputs could not be automatically merged "
+                f"due to the following error: {ve}\n"
+                "icepyx will return a list of Xarray DataSets (one per granule) "
+                "which you can combine together manually instead",
+                stacklevel=3,
+            )
+            return all_dss
+
+
+def _flatten_granule(ds):
+    """
+    Convert a granule Dataset into a table-like Dataset with one row per observation.
+
+    The (gran_idx, spot, photon_idx) dimensions are stacked into a single `obs`
+    dimension, the per-granule and per-track variables are repeated for each
+    observation, and the padding added where ground tracks have different lengths
+    is dropped, so the result can be written to tabular or appendable stores.
+
+    Parameters
+    ----------
+    ds : Xarray Dataset
+        A single granule's Dataset, as returned by `Read._build_single_file_dataset`.
+
+    Returns
+    -------
+    Xarray Dataset with the single dimension `obs`.
+    """
+
+    along_track = [
+        name for name, var in ds.data_vars.items() if "photon_idx" in var.dims
+    ]
+    flat = ds.stack(obs=("gran_idx", "spot", "photon_idx")).reset_index("obs")
+    # padding is missing in all of the along-track variables
+    has_data = np.zeros(flat.sizes["obs"], dtype=bool)
+    for name in along_track:
+        has_data |= flat[name].notnull().values
+    flat = flat.isel(obs=has_data)
+
+    # variable-length strings, so values of different lengths can be appended
+    for name, var in flat.variables.items():
+        if var.dtype.kind == "U":
+            flat[name] = var.astype(object)
+    return flat.transpose("obs")
+
+
 def _confirm_proceed():
     """
     Ask the user if they wish to proceed with processing. If 'y', or 'yes', then continue. Any
@@ -175,14 +699,33 @@ class Read(EarthdataAuthMixin):
         3) a [glob string](https://docs.python.org/3/library/glob.html).
         The List must be a list of strings, each of which is the path of a single file.
 
+        The data_source can also be a `GranuleCatalog`, in which case the files
+        in the catalog matching the spatial_extent and date_range are read.
+
     glob_kwargs : dict, default {}
         Additional arguments to be passed into the
         [glob.glob()](https://docs.python.org/3/library/glob.html#glob.glob)function
 
-    out_obj_type : object, default xarray.Dataset
-        The desired format for the data to be read in.
-        Currently, only xarray.Dataset objects (default) are available.
-        Please ask us how to help enable usage of other data objects!
+    out_obj_type : object or string, default xarray.Dataset
+        The desired format for the data to be read in by `load` and `iter_granules`:
+        xarray.Dataset ("xarray"), pandas.DataFrame ("pandas"),
+        geopandas.GeoDataFrame ("geopandas", with a point geometry for each row),
+        or pyarrow.Table ("arrow", requires the pyarrow package).
+        Tables have one row per along-track entry (e.g. segment or photon) with
+        gran_idx, spot, cycle_number, and rgt columns, and are read directly from
+        the files, so they do not hold the padding of the Dataset's
+        gran_idx x spot x photon_idx arrays.
+        Tables are only available for Level 2 and 3a products.
+
+    spatial_extent : Spatial object, list of coordinates, or string, default None
+        Only read the granules in a `GranuleCatalog` data_source with a ground track
+        intersecting this spatial extent (see `catalog.GranuleCatalog.query`).
+        To also remove the data outside of the extent from each granule,
+        pass it to `load` as well.
+
+    date_range : Temporal object, list, or dict, default None
+        Only read the granules in a `GranuleCatalog` data_source
+        overlapping this date range.
 
     Returns
     -------
@@ -207,6 +750,13 @@ class Read(EarthdataAuthMixin):
     ... ]
     >>> ipx.Read(list_of_files) # doctest: +SKIP
 
+    Reading the data into a GeoDataFrame
+    >>> ipx.Read('/path/to/data/', out_obj_type="geopandas") # doctest: +SKIP
+
+    Reading the files in a granule catalog that cover an area
+    >>> catalog = ipx.GranuleCatalog('/path/to/catalog.db') # doctest: +SKIP
+    >>> ipx.Read(catalog, spatial_extent=[-55, 68, -48, 71]) # doctest: +SKIP
+
     """
 
     # ----------------------------------------------------------------------
@@ -217,23 +767,52 @@ class Read(EarthdataAuthMixin):
         data_source,
         glob_kwargs={},
         out_obj_type=None,  # xr.Dataset,
+        spatial_extent=None,
+        date_range=None,
     ):
         # initialize authentication properties
         EarthdataAuthMixin.__init__(self)
 
-        self._filelist = _parse_source(data_source, glob_kwargs)
+        if not isinstance(data_source, GranuleCatalog) and (
+            spatial_extent is not None or date_range is not None
+        ):
+            raise TypeError(
+                "spatial_extent and date_range can only be used to select the files of "
+                "a GranuleCatalog. To subset the data, pass them to `load` instead."
+            )
 
-        # Create a dictionary of the products as read from the metadata
+        self._filelist = _parse_source(
+            data_source,
+            glob_kwargs,
+            spatial_extent=spatial_extent,
+            date_range=date_range,
+        )
+
+        # Create a dictionary of the products as read from the file names or metadata
         product_dict = {}
+        unparsed_files = []
         self.is_s3 = [False] * len(self._filelist)
         for i, file_ in enumerate(self._filelist):
             # If the path is an s3 path set the respective element of self.is_s3 to True
             if file_.startswith("s3"):
                 self.is_s3[i] = True
-                auth = self.auth
+            # standard granule file names include the product,
+            # so only files with other names need to be opened
+            parsed = is2ref._parse_granule_filename(file_)
+            if parsed is None:
+                unparsed_files.append(file_)
             else:
-                auth = None
-            product_dict[file_] = is2ref.extract_product(file_, auth=auth)
+                product_dict[file_] = parsed[0]
+
+        if unparsed_files:
+            s3fs = self.s3fs if any(self.is_s3) else None
+            # reading the file metadata is I/O bound, so read the files concurrently
+            with _get_pool_executor("thread")() as pool:
+                products = pool.map(
+                    functools.partial(is2ref.extract_product, s3fs=s3fs),
+                    unparsed_files,
+                )
+                product_dict.update(zip(unparsed_files, products))
 
         # Raise an error if there are both s3 and non-s3 paths present
         if len(set(self.is_s3)) > 1:
@@ -264,12 +843,15 @@ class Read(EarthdataAuthMixin):
         # Assign the identified product to the property
         self._product = all_products[0]
 
-        if out_obj_type is not None:
-            print(
-                "Output object type will be an xarray DataSet - "
-                "no other output types are implemented yet"
+        self._out_obj = _get_out_obj_type(out_obj_type)
+        if self._out_obj is not xr.Dataset and self._product in [
+            *_GRIDDED_PRODUCTS,
+            "ATL11",
+        ]:
+            raise ValueError(
+                f"Reading {self._product} data into tables is not available. "
+                "Please use out_obj_type=xarray.Dataset."
             )
-        self._out_obj = xr.Dataset
 
     # ----------------------------------------------------------------------
     # Properties
@@ -304,7 +886,9 @@ class Read(EarthdataAuthMixin):
             )
 
         if not hasattr(self, "_read_vars"):
-            self._read_vars = Variables(path=self.filelist[0])
+            # share the login (and s3 filesystem) if the files are in s3
+            auth = self.auth if self.is_s3 else None
+            self._read_vars = Variables(path=self.filelist[0], auth=auth)
         return self._read_vars
 
     @property
@@ -329,6 +913,10 @@ class Read(EarthdataAuthMixin):
         """
         Add the new variables in the group to the dataset template.
 
+        Ground track, pair track, and profile groups are formatted with `_format_track_grp`
+        and merged individually; `_build_single_file_dataset` instead collects all of
+        the track groups in a file and merges them at once with `_merge_track_grps`.
+
         Parameters
         ----------
         is2ds : Xarray dataset
@@ -380,95 +968,161 @@ class Read(EarthdataAuthMixin):
                 is2ds = _make_np_datetime(is2ds, "data_end_utc")
 
         else:
-            track_str, spot_dim_name, spot_var_name = _get_track_type_str(grp_path)
+            try:
+                first_photon_idx = np.max(is2ds.photon_idx).item() + 1
+            except AttributeError:
+                first_photon_idx = 0
+
+            ds = Read._format_track_grp(
+                is2ds,
+                ds,
+                grp_path,
+                _PathIndex(list_of_dict_vals(wanted_dict)),
+                first_photon_idx,
+            )
+            is2ds = Read._merge_track_grps(is2ds, [ds])
 
-            # get the spot number if relevant
-            if spot_dim_name == "spot":
-                spot = is2ref.gt2spot(track_str, is2ds.sc_orient.values[0])
-            else:
-                spot = track_str
+            return is2ds, ds
 
-            grp_spec_vars = [
-                k
-                for k, v in wanted_dict.items()
-                if any(f"{grp_path}/{k}" in x for x in v)
-            ]
+        return is2ds, ds[grp_spec_vars]
 
-            # handle delta_times with 1 or more dimensions
-            idx_range = range(len(ds.delta_time.data))
-            try:
-                photon_ids = (
-                    idx_range
-                    + np.full_like(idx_range, np.max(is2ds.photon_idx), dtype="int64")
-                    + 1
-                )
-            except AttributeError:
-                photon_ids = range(len(ds.delta_time.data))
+    @staticmethod
+    def _format_track_grp(is2ds, ds, grp_path, wanted_index, first_photon_idx=0):
+        """
+        Give the wanted variables in a ground track, pair track, or profile group
+        the dimensions and coordinates needed to merge them into the dataset template.
+
+        Parameters
+        ----------
+        is2ds : Xarray dataset
+            Template dataset the group will be added to.
+            Must already contain the orbit_info variables (e.g. sc_orient).
+        ds : Xarray dataset
+            Dataset containing the group to add
+        grp_path : str
+            hdf5 group path read into ds
+        wanted_index : _PathIndex
+            Index of the wanted variable paths.
+        first_photon_idx : int, default 0
+            The photon_idx of the first entry in the group, so that the photon indices
+            of all groups in the file are unique.
+
+        Returns
+        -------
+        Xarray Dataset with the wanted variables from the group.
+        """
 
-            hold_delta_times = ds.delta_time.data
+        track_str, spot_dim_name, spot_var_name = _get_track_type_str(grp_path)
+
+        # get the spot number if relevant
+        if spot_dim_name == "spot":
+            spot = is2ref.gt2spot(track_str, is2ds.sc_orient.values[0])
+        else:
+            spot = track_str
+
+        grp_spec_vars = wanted_index.group_vars(grp_path)
+
+        # handle delta_times with 1 or more dimensions
+        photon_ids = (
+            np.arange(len(ds.delta_time.data), dtype="int64") + first_photon_idx
+        )
+
+        hold_delta_times = ds.delta_time.data
+        ds = (
+            ds.reset_coords(drop=False)
+            .expand_dims(dim=[spot_dim_name, "gran_idx"])
+            .assign_coords(
+                {
+                    spot_dim_name: (spot_dim_name, [spot]),
+                    "photon_idx": ("delta_time", photon_ids),
+                }
+            )
+            .assign({spot_var_name: (("gran_idx", spot_dim_name), [[track_str]])})
+            .swap_dims({"delta_time": "photon_idx"})
+        )
+
+        # handle cases where the delta time is 2d due to multiple cycles in that group
+        if spot_dim_name == "pair_track" and np.ndim(hold_delta_times) > 1:
+            ds = ds.assign_coords(
+                {"delta_time": (("photon_idx", "cycle_number"), hold_delta_times)}
+            )
+
+        # for ATL11
+        if "ref_pt" in ds.coords:
             ds = (
-                ds.reset_coords(drop=False)
-                .expand_dims(dim=[spot_dim_name, "gran_idx"])
+                ds.drop_indexes(["ref_pt", "photon_idx"])
+                .drop(["ref_pt", "photon_idx"])
+                .swap_dims({"ref_pt": "photon_idx"})
                 .assign_coords(
-                    {
-                        spot_dim_name: (spot_dim_name, [spot]),
-                        "photon_idx": ("delta_time", photon_ids),
-                    }
+                    ref_pt=("photon_idx", ds.ref_pt.data),
+                    photon_idx=ds.photon_idx.data,
                 )
-                .assign({spot_var_name: (("gran_idx", spot_dim_name), [[track_str]])})
-                .swap_dims({"delta_time": "photon_idx"})
             )
 
-            # handle cases where the delta time is 2d due to multiple cycles in that group
-            if spot_dim_name == "pair_track" and np.ndim(hold_delta_times) > 1:
+            # for the subgoups where there is 1d delta time data,
+            # make sure that the cycle number is still a coordinate for merging
+            try:
                 ds = ds.assign_coords(
-                    {"delta_time": (("photon_idx", "cycle_number"), hold_delta_times)}
+                    {
+                        "cycle_number": (
+                            "photon_idx",
+                            ds.cycle_number["photon_idx"].data,
+                        )
+                    }
                 )
+                ds["cycle_number"] = ds.cycle_number.astype(np.uint8)
+            except KeyError:
+                pass
 
-            # for ATL11
-            if "ref_pt" in ds.coords:
-                ds = (
-                    ds.drop_indexes(["ref_pt", "photon_idx"])
-                    .drop(["ref_pt", "photon_idx"])
-                    .swap_dims({"ref_pt": "photon_idx"})
-                    .assign_coords(
-                        ref_pt=("photon_idx", ds.ref_pt.data),
-                        photon_idx=ds.photon_idx.data,
-                    )
-                )
+        grp_spec_vars.extend([spot_var_name, "photon_idx"])
 
-                # for the subgoups where there is 1d delta time data,
-                # make sure that the cycle number is still a coordinate for merging
-                try:
-                    ds = ds.assign_coords(
-                        {
-                            "cycle_number": (
-                                "photon_idx",
-                                ds.cycle_number["photon_idx"].data,
-                            )
-                        }
-                    )
-                    ds["cycle_number"] = ds.cycle_number.astype(np.uint8)
-                except KeyError:
-                    pass
+        return ds[grp_spec_vars]
+
+    @staticmethod
+    def _merge_track_grps(is2ds, track_dss):
+        """
+        Merge formatted ground track, pair track, or profile groups into the dataset
+        template in a single step.
 
-            grp_spec_vars.extend([spot_var_name, "photon_idx"])
+        Parameters
+        ----------
+        is2ds : Xarray dataset
+            Template dataset to add the groups to.
+        track_dss : list of Xarray datasets
+            Groups formatted by `_format_track_grp` (with any nested variables added).
 
-            is2ds = is2ds.merge(
-                ds[grp_spec_vars], join="outer", combine_attrs="drop_conflicts"
-            )
+        Returns
+        -------
+        Xarray Dataset with all of the groups added.
+        """
 
-            # re-cast some dtypes to make array smaller
-            is2ds[spot_var_name] = is2ds[spot_var_name].astype(str)
-            try:
-                is2ds[spot_dim_name] = is2ds[spot_dim_name].astype(np.uint8)
-            except ValueError:
-                pass
+        if not track_dss:
+            return is2ds
 
-        return is2ds, ds[grp_spec_vars]
+        # merging all of the groups at once avoids copying the accumulating dataset
+        # for every group, which scales quadratically with the number of groups
+        is2ds = xr.merge(
+            [is2ds, *track_dss], join="outer", combine_attrs="drop_conflicts"
+        )
+
+        # re-cast some dtypes to make array smaller
+        for spot_dim_name, spot_var_name in [
+            ("spot", "gt"),
+            ("profile", "prof"),
+            ("pair_track", "pt"),
+        ]:
+            if spot_var_name in is2ds:
+                is2ds[spot_var_name] = is2ds[spot_var_name].astype(str)
+            if spot_dim_name in is2ds.dims:
+                try:
+                    is2ds[spot_dim_name] = is2ds[spot_dim_name].astype(np.uint8)
+                except ValueError:
+                    pass
+
+        return is2ds
 
     @staticmethod
-    def _combine_nested_vars(is2ds, ds, grp_path, wanted_dict):
+    def _combine_nested_vars(is2ds, ds, grp_path, wanted_index):
         """
         Add the deeply nested variables to a dataset with appropriate coordinate information.
 
@@ -480,20 +1134,15 @@ class Read(EarthdataAuthMixin):
             Dataset containing improper dimensions for the variables being added
         grp_path : str
             hdf5 group path read into ds
-        wanted_dict : dict
-            Dictionary with variable names as keys and a list of group +
-            variable paths containing those variables as values.
+        wanted_index : _PathIndex
+            Index of the wanted variable paths.
 
         Returns
         -------
         Xarray Dataset with variables from the ds variable group added.
         """
 
-        # Dev Goal: improve this type of iterating to minimize amount of looping required.
-        # Would a path handling library be useful here?
-        grp_spec_vars = [
-            k for k, v in wanted_dict.items() if any(f"{grp_path}/{k}" in x for x in v)
-        ]
+        grp_spec_vars = wanted_index.group_vars(grp_path)
 
         # # Use this to handle issues specific to group paths that are more nested
         # tiers = len(wanted_groups_tiered)
@@ -522,30 +1171,12 @@ class Read(EarthdataAuthMixin):
 
         return is2ds
 
-    def load(self):
+    def _get_groups_list(self):
         """
-        Create a single Xarray Dataset containing the data from one or more
-        files and/or ground tracks.
-        Uses icepyx's ICESat-2 data product awareness and Xarray's `combine_by_coords` function.
-
-        All items in the wanted variables list will be loaded from the files into memory.
-        If you do not provide a wanted variables list, a default one will be created for you.
+        Get the full paths of the wanted variables to read from each file, including
+        the variables icepyx needs to merge the granules into a single Dataset.
         """
 
-        # todo:
-        # some checks that the file has the required variables?
-        # maybe give user some options here about merging parameters?
-        # add a check that wanted variables exists, and create them with defaults if possible (and let the user know)
-        # write tests for the functions!
-
-        # Notes: intake wants an entire group, not an individual variable
-        # (which makes sense if we're using its smarts to set up lat, lon, etc)
-        # so to get a combined dataset, we need to keep track of spots under the hood,
-        # open each group, and then combine them into one xarray where the spots are IDed somehow
-        # (or only the strong ones are returned)
-        # this means we need to get/track from each dataset we open some of the metadata,
-        # which we include as mandatory variables when constructing the wanted list
-
         if not self.vars.wanted:
             raise AttributeError(
                 "No variables listed in self.vars.wanted. Please use the Variables class "
@@ -584,41 +1215,406 @@ class Read(EarthdataAuthMixin):
         except AttributeError:
             pass
 
-        all_dss = []
+        return groups_list
 
-        for file in self.filelist:
-            if file.startswith("s3"):
-                # If path is an s3 path create an s3fs filesystem to reference the file
-                # TODO would it be better to be able to generate an s3fs session from the Mixin?
-                s3 = earthaccess.get_s3fs_session(daac="NSIDC")
-                file = s3.open(file, "rb")
-
-            all_dss.append(
-                self._build_single_file_dataset(file, groups_list)
-            )  # wanted_groups, vgrp.keys()))
-
-            # Closing the file prevents further operations on the dataset
-            # from s3fs.core import S3File
-            # if isinstance(file, S3File):
-            #     file.close()
-
-        if len(all_dss) == 1:
-            return all_dss[0]
+    def load(
+        self,
+        workers=None,
+        executor=None,
+        lazy=False,
+        chunks=None,
+        spatial_extent=None,
+        date_range=None,
+        cache=False,
+    ):
+        """
+        Create a single Xarray Dataset containing the data from one or more
+        files and/or ground tracks.
+        Uses icepyx's ICESat-2 data product awareness to combine the granules
+        along their granule index (`gran_idx`).
+
+        All items in the wanted variables list will be loaded from the files into memory.
+        If you do not provide a wanted variables list, a default one will be created for you.
+
+        Parameters
+        ----------
+        workers : int, default None
+            Number of granules to read concurrently.
+            If None or 1, the files are read one after another.
+        executor : {"process", "thread"}, default None
+            Whether to read the granules using a pool of processes or of threads.
+            Only used when `workers` is greater than 1.
+            If None, processes are used for local files and threads for s3 files
+            (so that all workers share the existing Earthdata login) or lazy loads.
+        lazy : boolean, default False
+            Return a Dataset backed by dask arrays instead of reading the data into memory.
+            Variables are only read from the files when they are computed
+            (e.g. after `.sel`, `.where`, or a reduction), so only the needed data is read.
+        chunks : int, str, or dict, default None
+            Dask chunk sizes to use when `lazy=True`, as accepted by `xarray.open_dataset`.
+            Dictionary keys are dimension names of the returned Dataset (e.g. "photon_idx").
+            By default, each variable gets one chunk per granule per ground track.
+        spatial_extent : Spatial object, list of coordinates, or string, default None
+            Only read the data within this spatial extent, given as an
+            `icepyx.core.spatial.Spatial` object or any input accepted by `ipx.Query`
+            (a bounding box, polygon, or geospatial polygon file).
+            The latitudes and longitudes of each ground track are read first,
+            and only the matching part of each wanted variable is then read.
+            Ground track groups without latitude and longitude variables are read whole.
+            Only available for Level 2 and 3a products.
+        date_range : Temporal object, list, or dict, default None
+            Only read the data within this date range, given as an
+            `icepyx.core.temporal.Temporal` object or any `date_range` input
+            accepted by `ipx.Query`. Filtering uses each ground track's delta_time.
+        cache : boolean or DatasetCache, default False
+            Store each granule's Dataset on disk once it is created, and reuse it in later
+            loads of the same (unchanged) file with the same wanted variables,
+            spatial extent and date range, instead of reading and converting the file again.
+            If True, a `icepyx.core.cache.DatasetCache` with the default location and
+            disk budget is used; pass a DatasetCache to set these yourself.
+
+        Returns
+        -------
+        Xarray Dataset, or the `out_obj_type` the Read object was created with
+            When `lazy=True`, call the Dataset's `close()` method to close the
+            granule files once you are done with the data.
+            If `spatial_extent` or `date_range` are given, ground tracks and granules
+            with no data within them are left out.
+
+        Examples
+        --------
+        >>> reader = ipx.Read('/path/to/data/') # doctest: +SKIP
+        >>> reader.vars.append(var_list=['h_li', 'latitude', 'longitude']) # doctest: +SKIP
+        >>> ds = reader.load(workers=8) # doctest: +SKIP
+
+        Lazily load the data, reading only what is needed for a computation
+
+        >>> ds = reader.load(lazy=True, chunks={"photon_idx": 100000}) # doctest: +SKIP
+        >>> ds.h_li.mean().compute() # doctest: +SKIP
+
+        Only read the data within an area and date range of interest
+
+        >>> ds = reader.load(
+        ...     spatial_extent=[-55, 68, -48, 71], date_range=['2019-02-20', '2019-02-28']
+        ... ) # doctest: +SKIP
+
+        Keep the converted granules on disk, making later loads of them faster
+
+        >>> ds = reader.load(cache=True) # doctest: +SKIP
+        """
+
+        # todo:
+        # some checks that the file has the required variables?
+        # maybe give user some options here about merging parameters?
+        # add a check that wanted variables exists, and create them with defaults if possible (and let the user know)
+        # write tests for the functions!
+
+        # Notes: intake wants an entire group, not an individual variable
+        # (which makes sense if we're using its smarts to set up lat, lon, etc)
+        # so to get a combined dataset, we need to keep track of spots under the hood,
+        # open each group, and then combine them into one xarray where the spots are IDed somehow
+        # (or only the strong ones are returned)
+        # this means we need to get/track from each dataset we open some of the metadata,
+        # which we include as mandatory variables when constructing the wanted list
+
+        groups_list = self._get_groups_list()
+
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError("workers must be a positive integer or None")
+
+        if self._out_obj is not xr.Dataset and (lazy or cache is not False):
+            raise ValueError(
+                "lazy and cache are only available when reading into an xarray Dataset "
+                "(see the out_obj_type argument of Read)"
+            )
+
+        if lazy is False and chunks is not None:
+            raise ValueError("chunks can only be specified when lazy=True")
+        elif lazy is True:
+            if executor == "process":
+                raise ValueError(
+                    "Lazily loaded granules keep their files open, so they cannot be "
+                    "read by a process pool. Please use executor='thread'."
+                )
+            executor = "thread"
+            if chunks is None:
+                # a single chunk per variable in each group (i.e. per granule and beam)
+                chunks = -1
+
+        subset = _get_subset(spatial_extent, date_range)
+
+        if cache is True:
+            cache = DatasetCache()
+        elif cache is False:
+            cache = None
+        elif not isinstance(cache, DatasetCache):
+            raise TypeError("cache must be a boolean or a DatasetCache")
+
+        if self._out_obj is xr.Dataset:
+            load_file = functools.partial(
+                _load_single_file,
+                self.product,
+                groups_list=groups_list,
+                chunks=chunks,
+                subset=subset,
+                s3fs=self.s3fs if self.is_s3 else None,
+                cache=cache,
+            )
         else:
-            try:
-                merged_dss = xr.combine_by_coords(all_dss, data_vars="minimal")
-                return merged_dss
-            except ValueError as ve:
+            load_file = functools.partial(
+                _load_single_table,
+                self.product,
+                groups_list=groups_list,
+                subset=subset,
+                s3fs=self.s3fs if self.is_s3 else None,
+            )
+
+        if workers is None or workers == 1:
+            all_dss = [load_file(file) for file in self.filelist]
+        else:
+            if executor is None:
+                executor = "thread" if self.is_s3 else "process"
+            # each granule is independent, so build the per-file datasets concurrently;
+            # map returns the results in filelist order, keeping the merge deterministic
+            pool_executor = _get_pool_executor(executor)
+            with pool_executor(max_workers=workers) as pool:
+                all_dss = list(
+                    pool.map(
+                        load_file,
+                        self.filelist,
+                        chunksize=max(1, len(self.filelist) // (4 * workers)),
+                    )
+                )
+
+        if self._out_obj is not xr.Dataset:
+            all_dfs = [df for df in all_dss if len(df)]
+            if subset is not None and not all_dfs:
+                warnings.warn(
+                    "None of your granules contain data within the given "
+                    "spatial extent and/or date range, so an empty table is returned",
+                    UserWarning,
+                    stacklevel=2,
+                )
+            return _combine_tables(all_dfs, self._out_obj)
+
+        if subset is not None:
+            # leave out the granules with no data in the spatial/temporal extent
+            for ds in all_dss:
+                if "photon_idx" not in ds.dims:
+                    ds.close()
+            all_dss = [ds for ds in all_dss if "photon_idx" in ds.dims]
+            if not all_dss:
                 warnings.warn(
-                    "Your inputs could not be automatically merged using "
-                    f"xarray.combine_by_coords due to the following error: {ve}\n"
-                    "icepyx will return a list of Xarray DataSets (one per granule) "
-                    "which you can combine together manually instead",
+                    "None of your granules contain data within the given "
+                    "spatial extent and/or date range, so an empty Dataset is returned",
+                    UserWarning,
                     stacklevel=2,
                 )
-                return all_dss
+                return xr.Dataset()
 
-    def _build_dataset_template(self, file):
+        return _combine_granules(all_dss, lazy=lazy)
+
+    def iter_granules(self, batch_size=1):
+        """
+        Iterate through the files, yielding one Xarray Dataset per granule
+        (or per batch of granules) at a time.
+        If the Read object was created with another `out_obj_type`,
+        a table of that type is yielded instead.
+
+        Each Dataset is created the same way as by `load`, but only the current
+        granule(s) are held in memory and their files are closed before they are yielded.
+        This keeps memory use flat regardless of the number of files,
+        for example when reducing each granule to a few statistics.
+
+        Parameters
+        ----------
+        batch_size : int, default 1
+            Number of granules to read and combine into each yielded Dataset.
+
+        Yields
+        ------
+        Xarray Dataset
+            If the granules in a batch cannot be combined, a list of Datasets
+            (one per granule) is yielded instead.
+
+        Examples
+        --------
+        >>> reader = ipx.Read('/path/to/data/') # doctest: +SKIP
+        >>> reader.vars.append(var_list=['h_li', 'latitude', 'longitude']) # doctest: +SKIP
+        >>> means = [ds.h_li.mean().item() for ds in reader.iter_granules()] # doctest: +SKIP
+        """
+
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        groups_list = self._get_groups_list()
+        s3fs = self.s3fs if self.is_s3 else None
+
+        for i in range(0, len(self.filelist), batch_size):
+            if self._out_obj is not xr.Dataset:
+                yield _combine_tables(
+                    [
+                        _load_single_table(self.product, file, groups_list, s3fs=s3fs)
+                        for file in self.filelist[i : i + batch_size]
+                    ],
+                    self._out_obj,
+                )
+                continue
+
+            batch_dss = [
+                _load_single_file(self.product, file, groups_list, s3fs=s3fs)
+                for file in self.filelist[i : i + batch_size]
+            ]
+            is2ds = _combine_granules(batch_dss)
+            # drop the references to the batch so it can be freed once the caller is done
+            del batch_dss
+            yield is2ds
+            del is2ds
+
+    def _iter_flat_granules(self):
+        """
+        Iterate through the files, yielding each file name and its data as a
+        table-like Dataset with one row per observation (see `_flatten_granule`).
+        """
+
+        groups_list = self._get_groups_list()
+        s3fs = self.s3fs if self.is_s3 else None
+
+        for file in self.filelist:
+            ds = _load_single_file(self.product, file, groups_list, s3fs=s3fs)
+            if "photon_idx" in ds.dims:
+                yield file, _flatten_granule(ds)
+
+    def to_parquet(
+        self, path, partition_by=("cycle_number", "rgt", "spot"), append=False
+    ):
+        """
+        Write the data to a partitioned Parquet dataset with one row per observation,
+        one granule at a time.
+
+        Each granule is read the same way as by `iter_granules` and written to
+        Hive-style partition directories (e.g. `cycle_number=2/rgt=910/spot=1/`),
+        so the combined Dataset is never held in memory and downstream tools
+        (e.g. `pandas.read_parquet`, pyarrow, dask, or DuckDB) can read only the
+        partitions and columns they need. Requires the `pyarrow` package.
+
+        Parameters
+        ----------
+        path : string
+            Directory to write the dataset to.
+        partition_by : list of strings, default ("cycle_number", "rgt", "spot")
+            Names of the variables to partition the data by.
+            Use an empty list to write the data without partitioning.
+        append : boolean, default False
+            Add the granules to an existing dataset. Each granule is written to its
+            own files (named after the granule), so writing a granule again
+            replaces its data rather than duplicating it.
+            If False, a FileExistsError is raised if `path` already contains data.
+
+        Examples
+        --------
+        >>> reader = ipx.Read('/path/to/data/') # doctest: +SKIP
+        >>> reader.vars.append(var_list=['h_li', 'latitude', 'longitude']) # doctest: +SKIP
+        >>> reader.to_parquet('/path/to/atl06.parquet') # doctest: +SKIP
+        >>> pd.read_parquet(
+        ...     '/path/to/atl06.parquet', columns=['h_li'], filters=[('rgt', '==', 910)]
+        ... ) # doctest: +SKIP
+        """
+
+        try:
+            import pyarrow as pa
+            import pyarrow.dataset as pads
+        except ImportError:
+            raise ImportError(
+                "Writing Parquet files requires the pyarrow package. "
+                "Please install it (e.g. `pip install pyarrow`)."
+            )
+
+        fs, root = fsspec.core.url_to_fs(os.fspath(path))
+        if not append and fs.exists(root) and fs.ls(root):
+            raise FileExistsError(
+                f"{path} already contains data. Use append=True to add to it."
+            )
+
+        partition_by = list(partition_by)
+        for file, flat in self._iter_flat_granules():
+            missing = set(partition_by) - set(flat.variables)
+            if missing:
+                raise ValueError(
+                    f"Cannot partition by {sorted(missing)}, "
+                    "which are not variables of the data."
+                )
+            table = pa.Table.from_pandas(
+                flat.to_dataframe().reset_index(drop=True), preserve_index=False
+            )
+            basename = os.path.splitext(os.path.basename(file))[0]
+            pads.write_dataset(
+                table,
+                root,
+                format="parquet",
+                partitioning=partition_by or None,
+                partitioning_flavor="hive" if partition_by else None,
+                basename_template=basename + "-{i}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+                filesystem=fs,
+            )
+
+    def to_zarr(self, store, append=False, chunk_size=ZARR_CHUNK_SIZE):
+        """
+        Write the data to a Zarr store with one row per observation,
+        one granule at a time.
+
+        Each granule is read the same way as by `iter_granules` and appended along
+        the `obs` dimension of the store (see `_flatten_granule`),
+        so the combined Dataset is never held in memory.
+        The per-granule and per-track variables (e.g. `cycle_number`, `rgt`, `spot`)
+        are stored for each observation, so the store can be filtered on them.
+        Requires the `zarr` package.
+
+        Parameters
+        ----------
+        store : string or path-like
+            Local path or URL (e.g. "s3://bucket/atl06.zarr") of the store.
+        append : boolean, default False
+            Append the granules to an existing store (with the same variables).
+            Granules that are already in the store are appended again.
+            If False, a FileExistsError is raised if the store already exists.
+        chunk_size : int, default ZARR_CHUNK_SIZE
+            Number of observations per (compressed) chunk of each variable.
+            Only used when the store is created.
+
+        Examples
+        --------
+        >>> reader = ipx.Read('/path/to/data/') # doctest: +SKIP
+        >>> reader.vars.append(var_list=['h_li', 'latitude', 'longitude']) # doctest: +SKIP
+        >>> reader.to_zarr('/path/to/atl06.zarr') # doctest: +SKIP
+        >>> ds = xr.open_zarr('/path/to/atl06.zarr') # doctest: +SKIP
+        """
+
+        try:
+            import zarr  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "Writing Zarr stores requires the zarr package. "
+                "Please install it (e.g. `pip install zarr`)."
+            )
+
+        fs, root = fsspec.core.url_to_fs(os.fspath(store))
+        exists = fs.exists(root)
+        if exists and not append:
+            raise FileExistsError(
+                f"{store} already exists. Use append=True to add to it."
+            )
+        for _, flat in self._iter_flat_granules():
+            if exists:
+                flat.to_zarr(store, mode="a", append_dim="obs")
+            else:
+                encoding = {name: {"chunks": (chunk_size,)} for name in flat.variables}
+                flat.to_zarr(store, mode="w-", encoding=encoding)
+                exists = True
+
+    @staticmethod
+    def _build_dataset_template(product, file):
         """
         Create the Xarray dataset object templated for the data to be read in.
 
@@ -630,23 +1626,46 @@ class Read(EarthdataAuthMixin):
                 "gran_idx": [np.uint64(999999)],
                 "source_file": (["gran_idx"], [file]),
             },
-            attrs={"data_product": self.product},
+            attrs={"data_product": product},
         )
         return is2ds
 
-    def _read_single_grp(self, file, grp_path):
+    @staticmethod
+    def _open_file(file):
         """
-        For a given file and variable group path, construct an xarray Dataset.
+        Open an ICESat-2 data file so that all of its groups can be read
+        from a single file handle.
 
         Parameters
         ----------
-        file : str
-            Full path to ICESat-2 data file.
+        file : str or file-like object
+            Full path to ICESat-2 data file or an open (e.g. s3fs) file object.
+
+        Returns
+        -------
+        h5netcdf.File
+        """
+        import h5netcdf
+
+        return h5netcdf.File(file, "r", phony_dims="access")
+
+    @staticmethod
+    def _read_single_grp(h5f, grp_path, chunks=None):
+        """
+        For a given open file and variable group path, construct an xarray Dataset.
+
+        Parameters
+        ----------
+        h5f : h5netcdf.File
+            Open ICESat-2 data file, as returned by `_open_file`.
             Currently tested for locally downloaded files;
             untested but hopefully works for s3 stored cloud files.
         grp_path : str
             Full string to a variable group.
             E.g. 'gt1l/land_ice_segments'
+        chunks : int, str, or dict, default None
+            Dask chunk sizes for the variables in the group.
+            If None, the variables are not backed by dask arrays.
 
         Returns
         -------
@@ -654,20 +1673,33 @@ class Read(EarthdataAuthMixin):
 
         """
 
+        if grp_path in ["orbit_info", "ancillary_data"]:
+            # granule-level metadata is small and needed to build the dataset
+            chunks = None
+        elif isinstance(chunks, dict):
+            # variables are indexed by delta_time until they are added to the dataset
+            chunks = {
+                "delta_time" if dim == "photon_idx" else dim: size
+                for dim, size in chunks.items()
+            }
+
         return xr.open_dataset(
-            file,
-            group=grp_path,
-            engine="h5netcdf",
-            backend_kwargs={"phony_dims": "access"},
+            xr.backends.H5NetCDFStore(h5f, group=grp_path), chunks=chunks
         )
 
-    def _build_single_file_dataset(self, file, groups_list):
+    @staticmethod
+    def _build_single_file_dataset(
+        product, file, groups_list, chunks=None, subset=None
+    ):
         """
         Create a single xarray dataset with all of the wanted variables/groups
         from the wanted var list for a single data file/url.
 
         Parameters
         ----------
+        product : str
+            ICESat-2 data product of the file.
+
         file : str
             Full path to ICESat-2 data file.
             Currently tested for locally downloaded files;
@@ -678,6 +1710,18 @@ class Read(EarthdataAuthMixin):
             e.g. ['orbit_info/sc_orient', 'gt1l/land_ice_segments/h_li',
             'gt1l/land_ice_segments/latitude', 'gt1l/land_ice_segments/longitude']
 
+        chunks : int, str, or dict, default None
+            Dask chunk sizes for the data variables.
+            If None, the data are read into memory and the file is closed.
+            Otherwise, the file (and `file`, if it is an open file object) is left open
+            so the dask arrays can be read from it later, and is closed by the
+            returned Dataset's `close()` method.
+
+        subset : dict, default None
+            Spatial and/or temporal filters, as returned by `_get_subset`,
+            applied to each ground track group before its variables are read.
+            Only supported for Level 2 and 3a products.
+
         Returns
         -------
         Xarray Dataset
@@ -687,105 +1731,287 @@ class Read(EarthdataAuthMixin):
             groups_list, tiered=True, tiered_vars=True
         )
 
-        # DEVNOTE: elif does not actually apply wanted variable list,
-        # and has not been tested for merging multiple files into one ds
-        # of a gridded product
-        # TODO: all products need to be tested, and quicklook products added or explicitly excluded
-        # consider looking for netcdf file extension instead of using product
-        # Level 3b, gridded (netcdf): ATL14, 15, 16, 17, 18, 19, 20, 21
-        if self.product in [
-            "ATL14",
-            "ATL15",
-            "ATL16",
-            "ATL17",
-            "ATL18",
-            "ATL19",
-            "ATL20",
-            "ATL21",
-            "ATL23",
-        ]:
-            wanted_grouponly_set = set(wanted_groups_tiered[0])
-            wanted_groups_list = sorted(wanted_grouponly_set)
-            if len(wanted_groups_list) == 1:
-                is2ds = self._read_single_grp(file, grp_path=wanted_groups_list[0])
-            else:
-                is2ds = self._build_dataset_template(file)
-                while wanted_groups_list:
-                    ds = self._read_single_grp(file, grp_path=wanted_groups_list[0])
-                    wanted_groups_list = wanted_groups_list[1:]
-                    is2ds = is2ds.merge(
-                        ds, join="outer", combine_attrs="drop_conflicts"
+        # open the file once and read every wanted group from the same handle,
+        # rather than re-parsing the file metadata for each group
+        h5f = Read._open_file(file)
+        try:
+            # DEVNOTE: elif does not actually apply wanted variable list,
+            # and has not been tested for merging multiple files into one ds
+            # of a gridded product
+            # TODO: all products need to be tested, and quicklook products added or explicitly excluded
+            # consider looking for netcdf file extension instead of using product
+            # Level 3b, gridded (netcdf): ATL14, 15, 16, 17, 18, 19, 20, 21
+            if product in _GRIDDED_PRODUCTS:
+                if subset is not None:
+                    raise ValueError(
+                        f"Spatial and temporal filtering is not available for {product}."
                     )
-                    if hasattr(is2ds, "description"):
-                        is2ds.attrs["description"] = (
-                            "Group-level data descriptions were removed during Dataset creation."
+                wanted_grouponly_set = set(wanted_groups_tiered[0])
+                wanted_groups_list = sorted(wanted_grouponly_set)
+                if len(wanted_groups_list) == 1:
+                    is2ds = Read._read_single_grp(h5f, wanted_groups_list[0], chunks)
+                else:
+                    is2ds = Read._build_dataset_template(product, file)
+                    while wanted_groups_list:
+                        ds = Read._read_single_grp(h5f, wanted_groups_list[0], chunks)
+                        wanted_groups_list = wanted_groups_list[1:]
+                        is2ds = is2ds.merge(
+                            ds, join="outer", combine_attrs="drop_conflicts"
                         )
+                        if hasattr(is2ds, "description"):
+                            is2ds.attrs["description"] = (
+                                "Group-level data descriptions were removed during Dataset creation."
+                            )
 
-        # Level 3b, hdf5: ATL11
-        elif self.product in ["ATL11"]:
-            is2ds = self._build_dataset_template(file)
+            # Level 3b, hdf5: ATL11
+            elif product in ["ATL11"]:
+                if subset is not None:
+                    raise ValueError(
+                        f"Spatial and temporal filtering is not available for {product}."
+                    )
+                is2ds = Read._build_dataset_template(product, file)
 
-            # returns the wanted groups as a single list of full group path strings
-            wanted_dict, wanted_groups = Variables.parse_var_list(
-                groups_list, tiered=False
-            )
-            wanted_groups_set = set(wanted_groups)
+                # returns the wanted groups as a single list of full group path strings
+                wanted_dict, wanted_groups = Variables.parse_var_list(
+                    groups_list, tiered=False
+                )
+                wanted_index = _PathIndex(groups_list)
+                wanted_groups_set = set(wanted_groups)
+
+                # orbit_info is used automatically as the first group path
+                # so the info is available for the rest of the groups
+                # wanted_groups_set.remove("orbit_info")
+                wanted_groups_set.remove("ancillary_data")
+                # Note: the sorting is critical for datasets with highly nested groups
+                wanted_groups_list = ["ancillary_data"] + sorted(wanted_groups_set)
+
+                # collect the formatted track groups and merge them all at once
+                track_dss = []
+                next_photon_idx = 0
+                while wanted_groups_list:
+                    # print(wanted_groups_list)
+                    grp_path = wanted_groups_list[0]
+                    wanted_groups_list = wanted_groups_list[1:]
+                    ds = Read._read_single_grp(h5f, grp_path, chunks)
+                    if grp_path in ["orbit_info", "ancillary_data"]:
+                        is2ds, ds = Read._add_vars_to_ds(
+                            is2ds, ds, grp_path, wanted_groups_tiered, wanted_dict
+                        )
+                    else:
+                        ds = Read._format_track_grp(
+                            is2ds, ds, grp_path, wanted_index, next_photon_idx
+                        )
+                        next_photon_idx += ds.sizes["photon_idx"]
+                        track_dss.append(ds)
 
-            # orbit_info is used automatically as the first group path
-            # so the info is available for the rest of the groups
-            # wanted_groups_set.remove("orbit_info")
-            wanted_groups_set.remove("ancillary_data")
-            # Note: the sorting is critical for datasets with highly nested groups
-            wanted_groups_list = ["ancillary_data"] + sorted(wanted_groups_set)
+                is2ds = Read._merge_track_grps(is2ds, track_dss)
 
-            while wanted_groups_list:
-                # print(wanted_groups_list)
-                grp_path = wanted_groups_list[0]
-                wanted_groups_list = wanted_groups_list[1:]
-                ds = self._read_single_grp(file, grp_path)
-                is2ds, ds = Read._add_vars_to_ds(
-                    is2ds, ds, grp_path, wanted_groups_tiered, wanted_dict
+            # Level 2 and 3a Products: ATL03, 06, 07, 08, 09, 10, 12, 13
+            else:
+                is2ds = Read._build_dataset_template(product, file)
+
+                # returns the wanted groups as a single list of full group path strings
+                wanted_dict, wanted_groups = Variables.parse_var_list(
+                    groups_list, tiered=False
+                )
+                wanted_index = _PathIndex(groups_list)
+                wanted_groups_set = set(wanted_groups)
+                # orbit_info is used automatically as the first group path
+                # so the info is available for the rest of the groups
+                wanted_groups_set.remove("orbit_info")
+                wanted_groups_set.remove("ancillary_data")
+                # Note: the sorting is critical for datasets with highly nested groups
+                wanted_groups_list = ["orbit_info", "ancillary_data"] + sorted(
+                    wanted_groups_set
                 )
 
-            return is2ds
+                # collect the formatted track groups and merge them all at once
+                track_dss = []
+                next_photon_idx = 0
+                while wanted_groups_list:
+                    grp_path = wanted_groups_list[0]
+                    wanted_groups_list = wanted_groups_list[1:]
+                    ds = Read._read_single_grp(h5f, grp_path, chunks)
+                    if grp_path in ["orbit_info", "ancillary_data"]:
+                        is2ds, ds = Read._add_vars_to_ds(
+                            is2ds, ds, grp_path, wanted_groups_tiered, wanted_dict
+                        )
+                        continue
+
+                    # if there are any deeper nested variables,
+                    # get those so they have actual coordinates and add them
+                    # this may apply to (at a minimum): ATL06, ATL08
+                    nested_grp_paths = [
+                        grp_path2
+                        for grp_path2 in wanted_groups_list
+                        if grp_path in grp_path2
+                    ]
+                    for grp_path2 in nested_grp_paths:
+                        wanted_groups_list.remove(grp_path2)
+
+                    # select the wanted part of the ground track before reading it,
+                    # and skip ground tracks with no data in the spatial/temporal extent
+                    indexer = None
+                    if subset is not None:
+                        indexer = _subset_indexer(ds, subset)
+                        if indexer is not None:
+                            ds = ds.isel(delta_time=indexer)
+                            if ds.sizes["delta_time"] == 0:
+                                continue
+
+                    ds = Read._format_track_grp(
+                        is2ds, ds, grp_path, wanted_index, next_photon_idx
+                    )
+                    next_photon_idx += ds.sizes["photon_idx"]
+
+                    for grp_path2 in nested_grp_paths:
+                        sub_ds = Read._read_single_grp(h5f, grp_path2, chunks)
+                        if indexer is not None:
+                            sub_ds = sub_ds.isel(delta_time=indexer)
+                        ds = Read._combine_nested_vars(
+                            ds, sub_ds, grp_path2, wanted_index
+                        )
+                    track_dss.append(ds)
 
-        # Level 2 and 3a Products: ATL03, 06, 07, 08, 09, 10, 12, 13
+                is2ds = Read._merge_track_grps(is2ds, track_dss)
+        except Exception:
+            h5f.close()
+            raise
+
+        if chunks is None:
+            # read the data into memory before the file handle is closed
+            is2ds = is2ds.load()
+            h5f.close()
         else:
-            is2ds = self._build_dataset_template(file)
+            # the file stays open for the dask arrays, until the dataset is closed
+            closers = [h5f.close]
+            if hasattr(file, "close"):
+                closers.append(file.close)
+            is2ds.set_close(functools.partial(_close_all, closers))
 
-            # returns the wanted groups as a single list of full group path strings
-            wanted_dict, wanted_groups = Variables.parse_var_list(
-                groups_list, tiered=False
-            )
-            wanted_groups_set = set(wanted_groups)
-            # orbit_info is used automatically as the first group path
-            # so the info is available for the rest of the groups
-            wanted_groups_set.remove("orbit_info")
-            wanted_groups_set.remove("ancillary_data")
-            # Note: the sorting is critical for datasets with highly nested groups
-            wanted_groups_list = ["orbit_info", "ancillary_data"] + sorted(
-                wanted_groups_set
-            )
+        return is2ds
 
-            while wanted_groups_list:
-                grp_path = wanted_groups_list[0]
-                wanted_groups_list = wanted_groups_list[1:]
-                ds = self._read_single_grp(file, grp_path)
-                is2ds, ds = Read._add_vars_to_ds(
-                    is2ds, ds, grp_path, wanted_groups_tiered, wanted_dict
-                )
+    @staticmethod
+    def _build_single_file_table(product, file, groups_list, subset=None):
+        """
+        Create a table with one row per along-track entry (e.g. segment or photon)
+        of the wanted variables in a single data file/url.
 
-                # if there are any deeper nested variables,
-                # get those so they have actual coordinates and add them
-                # this may apply to (at a minimum): ATL06, ATL08
-                if any(grp_path in grp_path2 for grp_path2 in wanted_groups_list):
-                    for grp_path2 in wanted_groups_list:
-                        if grp_path in grp_path2:
-                            sub_ds = self._read_single_grp(file, grp_path2)
-                            ds = Read._combine_nested_vars(
-                                ds, sub_ds, grp_path2, wanted_dict
-                            )
-                            wanted_groups_list.remove(grp_path2)
-                    is2ds = is2ds.merge(ds, join="outer", combine_attrs="no_conflicts")
+        Each ground track group is read directly into columns, along with its
+        gran_idx, spot, gt (or profile/pair track), photon_idx, and delta_time
+        (as in `_build_single_file_dataset`) and the granule-level variables
+        (e.g. cycle_number and rgt), so no padding is added between the tracks.
+        Variables in different groups of a ground track are in separate rows.
+        Only available for Level 2 and 3a products.
 
-        return is2ds
+        Parameters
+        ----------
+        product : str
+            ICESat-2 data product of the file.
+        file : str or file-like object
+            Full path to ICESat-2 data file or an open (e.g. s3fs) file object.
+        groups_list : list of strings
+            List of full paths to data variables within the file.
+        subset : dict, default None
+            Spatial and/or temporal filters, as returned by `_get_subset`,
+            applied to each ground track group before its variables are read.
+
+        Returns
+        -------
+        pandas DataFrame
+        """
+
+        wanted_dict, wanted_groups = Variables.parse_var_list(groups_list, tiered=False)
+        wanted_index = _PathIndex(groups_list)
+        wanted_groups_list = sorted(
+            set(wanted_groups) - {"orbit_info", "ancillary_data"}
+        )
+
+        with h5py.File(file, "r") as h5f:
+            # granule-level variables are repeated in every row
+            granule_cols = {}
+            for grp_path in ["orbit_info", "ancillary_data"]:
+                for var in wanted_index.group_vars(grp_path):
+                    value = _read_h5_column(h5f[grp_path][var])
+                    granule_cols[var] = value[0] if np.ndim(value) else value
+            for var in ["data_start_utc", "data_end_utc"]:
+                if var in granule_cols:
+                    value = granule_cols[var]
+                    value = value.decode() if isinstance(value, bytes) else str(value)
+                    granule_cols[var] = np.datetime64(value.rstrip("Z"), "ns")
+            # the same granule index as `_add_vars_to_ds` gives the Dataset (which is
+            # decremented once the ancillary_data group is added), so they can be joined
+            granule_cols["gran_idx"] = np.uint64(
+                f"{granule_cols['rgt']:04d}{granule_cols['cycle_number']:02d}"
+            ) - np.uint64(1)
+
+            track_dfs = []
+            next_photon_idx = 0
+            while wanted_groups_list:
+                grp_path = wanted_groups_list.pop(0)
+                nested_grp_paths = [
+                    grp_path2
+                    for grp_path2 in wanted_groups_list
+                    if grp_path in grp_path2
+                ]
+                for grp_path2 in nested_grp_paths:
+                    wanted_groups_list.remove(grp_path2)
+
+                grp = h5f[grp_path]
+                indexer = None
+                if subset is not None:
+                    # only the variables needed for the filters are read first
+                    filter_ds = xr.Dataset(
+                        {
+                            name: ("delta_time", _read_h5_column(grp[name]))
+                            for name in [
+                                "delta_time",
+                                *(name for pair in _LAT_LON_NAMES for name in pair),
+                            ]
+                            if name in grp
+                        }
+                    )
+                    indexer = _subset_indexer(filter_ds, subset)
+                    if isinstance(indexer, slice) and indexer.start == indexer.stop:
+                        continue
+
+                columns = {"delta_time": _read_h5_column(grp["delta_time"], indexer)}
+                for path, grp_vars in [
+                    (grp_path, wanted_index.group_vars(grp_path))
+                ] + [
+                    (path, wanted_index.group_vars(path)) for path in nested_grp_paths
+                ]:
+                    for var in grp_vars:
+                        values = _read_h5_column(h5f[path][var], indexer)
+                        if values.ndim == 1:
+                            columns[var] = values
+                        else:
+                            # e.g. one column per surface type for ATL03 signal_conf_ph
+                            for i in range(values.shape[1]):
+                                columns[f"{var}_{i}"] = values[:, i]
+
+                n_rows = len(columns["delta_time"])
+                track_str, spot_dim_name, spot_var_name = _get_track_type_str(grp_path)
+                if spot_dim_name == "spot":
+                    spot = np.uint8(
+                        is2ref.gt2spot(track_str, granule_cols["sc_orient"])
+                    )
+                else:
+                    spot = track_str
+                track_cols = {
+                    "gran_idx": granule_cols["gran_idx"],
+                    spot_dim_name: spot,
+                    spot_var_name: track_str,
+                    "photon_idx": np.arange(n_rows, dtype="int64") + next_photon_idx,
+                }
+                next_photon_idx += n_rows
+
+                track_df = pd.DataFrame({**track_cols, **columns})
+                for var, value in granule_cols.items():
+                    if var != "gran_idx":
+                        track_df[var] = value
+                track_dfs.append(track_df)
+
+        if not track_dfs:
+            return pd.DataFrame()
+        return pd.concat(track_dfs, ignore_index=True)
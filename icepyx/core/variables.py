@@ -5,6 +5,7 @@ import numpy as np
 import requests
 
 from icepyx.core.auth import EarthdataAuthMixin
+from icepyx.core.cache import FileCache
 import icepyx.core.is2ref as is2ref
 import icepyx.core.validate_inputs as val
 
@@ -20,6 +21,136 @@ def list_of_dict_vals(input_dict):
     return wanted_list
 
 
+def _file_layout(h5f, product, version):
+    """
+    Create a fingerprint of the group layout of an open ICESat-2 file, made of its
+    product, version, and the names of its top two levels of groups
+    (e.g. the ground tracks present and their subgroups).
+
+    Files with the same fingerprint contain the same variables.
+    """
+    import h5py
+
+    groups = []
+    for name, node in h5f.items():
+        if isinstance(node, h5py.Group):
+            groups.append(name)
+            groups.extend(
+                f"{name}/{subname}"
+                for subname, subnode in node.items()
+                if isinstance(subnode, h5py.Group)
+            )
+
+    return json.dumps([product, version, sorted(groups)])
+
+
+class _PathIndex:
+    """
+    Prefix tree (trie) over a list of variable paths, built once so the variables
+    in a group, the paths under a group, and the paths containing a keyword
+    can be looked up without scanning every path.
+
+    Parameters
+    ----------
+    paths : list of strings
+        Full variable paths (e.g. 'gt1l/land_ice_segments/h_li').
+
+    Examples
+    --------
+    >>> index = _PathIndex(['orbit_info/sc_orient', 'gt1l/land_ice_segments/h_li',
+    ...     'gt1l/land_ice_segments/fit_statistics/h_mean'])
+    >>> index.group_vars('gt1l/land_ice_segments')
+    ['h_li']
+    >>> index.paths_under('gt1l')
+    ['gt1l/land_ice_segments/h_li', 'gt1l/land_ice_segments/fit_statistics/h_mean']
+    >>> index.paths_with_keyword('fit_statistics')
+    ['gt1l/land_ice_segments/fit_statistics/h_mean']
+    """
+
+    def __init__(self, paths):
+        # each node is a tuple of (subgroups, variables) dictionaries,
+        # keyed by subgroup name and variable name, respectively
+        self._root = ({}, {})
+        # variable names and all of their paths (as in `Variables.parse_var_list`)
+        self.var_paths = {}
+        # path components (group and variable names) and the paths containing them
+        self._keyword_paths = {}
+        # group names at any level and the depths (number of groups) of the paths
+        self._groups = set()
+        self._depths = set()
+
+        for path in paths:
+            self._add(path)
+
+    def _add(self, path):
+        *grps, var = path.split("/")
+
+        node = self._root
+        for grp in grps:
+            node = node[0].setdefault(grp, ({}, {}))
+        node[1].setdefault(var, path)
+
+        self.var_paths.setdefault(var, []).append(path)
+        for kw in grps + [var]:
+            self._keyword_paths.setdefault(kw, {})[path] = None
+        self._groups.update(grps)
+        if grps:
+            self._depths.add(len(grps))
+
+    def _get_node(self, grp_path):
+        node = self._root
+        for grp in grp_path.split("/") if grp_path else []:
+            try:
+                node = node[0][grp]
+            except KeyError:
+                return None
+        return node
+
+    def group_vars(self, grp_path):
+        """
+        Return the names of the variables directly within a group.
+        """
+        node = self._get_node(grp_path)
+        return [] if node is None else list(node[1])
+
+    def paths_under(self, grp_path):
+        """
+        Return the paths of all variables within a group and its subgroups.
+        """
+        node = self._get_node(grp_path)
+        paths = []
+        nodes = [] if node is None else [node]
+        while nodes:
+            grps, variables = nodes.pop()
+            paths.extend(variables.values())
+            nodes.extend(reversed(grps.values()))
+        return paths
+
+    def paths_with_keyword(self, keyword):
+        """
+        Return the paths containing a group or variable name (keyword) at any level.
+        """
+        return list(self._keyword_paths.get(keyword, {}))
+
+    def has_keyword(self, keyword):
+        """
+        Return whether any path contains a group or variable name (keyword).
+        """
+        return keyword in self._keyword_paths
+
+    @property
+    def group_keywords(self):
+        """
+        Sorted array of the group names at any level, as returned for the
+        keyword_list and beam_list inputs by `Variables.avail(options=True)`.
+        """
+        keywords = set(self._groups)
+        # paths shallower than the deepest one are padded with "none" by parse_var_list
+        if len(self._depths) > 1:
+            keywords.add("none")
+        return np.unique(np.array(sorted(keywords)))
+
+
 # REFACTOR: class needs better docstrings
 # DevNote: currently this class is not tested
 class Variables(EarthdataAuthMixin):
@@ -71,11 +202,11 @@ class Variables(EarthdataAuthMixin):
         if path:
             self._path = val.check_s3bucket(path)
 
-            # Set up auth
-            auth = self.auth if self._path.startswith("s3") else None
+            # Use the (shared) authenticated filesystem for s3 files
+            s3fs = self.s3fs if self._path.startswith("s3") else None
             # Read the product and version from the file
-            self._product = is2ref.extract_product(self._path, auth=auth)
-            self._version = is2ref.extract_version(self._path, auth=auth)
+            self._product = is2ref.extract_product(self._path, s3fs=s3fs)
+            self._version = is2ref.extract_version(self._path, s3fs=s3fs)
         elif product:
             # Check for valid product string
             self._product = is2ref._validate_product(product)
@@ -98,6 +229,15 @@ class Variables(EarthdataAuthMixin):
     def path(self):
         return self._path if self._path else None
 
+    @property
+    def _path_index(self):
+        """
+        Prefix tree index of the available variable paths, built once per object.
+        """
+        if getattr(self, "_avail_index", None) is None:
+            self._avail_index = _PathIndex(self.avail())
+        return self._avail_index
+
     @property
     def product(self):
         return self._product
@@ -110,6 +250,11 @@ class Variables(EarthdataAuthMixin):
         """
         Get the list of available variables and variable paths from the input data product
 
+        The list is cached on disk (see `icepyx.core.cache`), per product and version
+        or, when the variables are read from a file, per file group layout,
+        so it only needs to be downloaded or read from a file once.
+        Set the $ICEPYX_CACHE_TTL environment variable to 0 to disable the cache.
+
         Examples
         --------
         >>> reg_a = ipx.Query('ATL06',[-55, 68, -48, 71],['2019-02-20','2019-02-28'], version='5') # doctest: +SKIP
@@ -126,44 +271,59 @@ class Variables(EarthdataAuthMixin):
 
         if not hasattr(self, "_avail") or self._avail is None:
             if not hasattr(self, "path") or self.path.startswith("s3"):
-                try:
-                    url = "https://raw.githubusercontent.com/icesat2py/is2_test_data/refs/heads/main/is2_test_data/data/is2variables.json"
-                    response = requests.get(url, headers={"Accept": "application/json"})
-                    response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-                    vars_dict = json.loads(response.content)
-                except requests.HTTPError as e:
-                    raise e
-
-                try:
-                    self._avail = vars_dict[self.product]
-
-                except KeyError:
-                    print(
-                        f"{self.product} does not have a list of available variables."
-                    )
+                cache = FileCache("variables")
+                cache_key = f"{self.product}_{self.version}"
+                self._avail = cache.get(cache_key)
+
+                if self._avail is None:
+                    try:
+                        url = "https://raw.githubusercontent.com/icesat2py/is2_test_data/refs/heads/main/is2_test_data/data/is2variables.json"
+                        response = requests.get(
+                            url, headers={"Accept": "application/json"}
+                        )
+                        response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+                        vars_dict = json.loads(response.content)
+                    except requests.HTTPError as e:
+                        raise e
+
+                    try:
+                        self._avail = vars_dict[self.product]
+                        cache.set(cache_key, self._avail)
+
+                    except KeyError:
+                        print(
+                            f"{self.product} does not have a list of available variables."
+                        )
 
             else:
                 # If a path was given, use that file to read the variables
                 import h5py
 
-                self._avail = []
-
-                def visitor_func(name, node):
-                    if isinstance(node, h5py.Group):
-                        # node is a Group
-                        pass
-                    else:
-                        # node is a Dataset
-                        self._avail.append(name)
-
                 with h5py.File(self.path, "r") as h5f:
-                    h5f.visititems(visitor_func)
+                    # files with the same group layout have the same variables,
+                    # so the (slow) walk through every group only needs to happen once
+                    cache = FileCache("variables")
+                    cache_key = _file_layout(h5f, self.product, self.version)
+                    self._avail = cache.get(cache_key)
+
+                    if self._avail is None:
+                        self._avail = []
+
+                        def visitor_func(name, node):
+                            if isinstance(node, h5py.Group):
+                                # node is a Group
+                                pass
+                            else:
+                                # node is a Dataset
+                                self._avail.append(name)
+
+                        h5f.visititems(visitor_func)
+                        cache.set(cache_key, self._avail)
 
         if options is True:
-            vgrp, paths = self.parse_var_list(self._avail)
-            allpaths = []
-            [allpaths.extend(np.unique(np.array(paths[p]))) for p in range(len(paths))]
-            allpaths = np.unique(allpaths)
+            # copy the lists so the index is not changed along with the returned values
+            vgrp = {k: list(v) for k, v in self._path_index.var_paths.items()}
+            allpaths = self._path_index.group_keywords
             if internal is False:
                 print("var_list inputs: " + ", ".join(vgrp.keys()))
                 print("keyword_list and beam_list inputs: " + ", ".join(allpaths))
@@ -340,11 +500,12 @@ class Variables(EarthdataAuthMixin):
 
         # check if keywords, if specified, are available for the product
         if keyword_list is not None:
+            allpaths_set = set(allpaths)
             for kw in keyword_list:
                 #                 assert kw in allpaths, "Invalid keyword. Please select from: " + ', '.join(allpaths)
 
                 # DevGoal: update here to not include profiles/beams in the allpaths list
-                if kw not in allpaths:
+                if kw not in allpaths_set:
                     err_msg_kw = "Invalid keyword: " + kw + ". "
                     err_msg_kw = err_msg_kw + "Please select from this list: "
                     err_msg_kw = err_msg_kw + ", ".join(np.unique(np.array(allpaths)))
@@ -396,28 +557,27 @@ class Variables(EarthdataAuthMixin):
         Iterate through the list of paths for each variable in sum_varlist. Add the paths that have matches
         to combined_list the dictionary of requested variables.
         """
-        combined_list = self._get_combined_list(beam_list, keyword_list)
+        index = self._path_index
+
+        def paths_with_any(keywords):
+            return {path for kw in keywords for path in index.paths_with_keyword(kw)}
+
+        # look up the paths containing the keywords once, rather than splitting
+        # and scanning every path of every variable for each keyword
+        if beam_list is not None and keyword_list is not None:
+            matching_paths = paths_with_any(beam_list) & paths_with_any(keyword_list)
+        else:
+            matching_paths = paths_with_any(
+                self._get_combined_list(beam_list, keyword_list)
+            )
 
         for vkey in sum_varlist:
             for vpath in vgrp[vkey]:
-                vpath_kws = vpath.split("/")
-
-                try:
-                    for bkw in beam_list:
-                        if bkw in vpath_kws:
-                            for kw in keyword_list:
-                                if kw in vpath_kws:
-                                    if vkey not in req_vars:
-                                        req_vars[vkey] = []
-                                    if vpath not in req_vars[vkey]:
-                                        req_vars[vkey].append(vpath)
-                except TypeError:
-                    for kw in combined_list:
-                        if kw in vpath_kws:
-                            if vkey not in req_vars:
-                                req_vars[vkey] = []
-                            if vpath not in req_vars[vkey]:
-                                req_vars[vkey].append(vpath)
+                if vpath in matching_paths:
+                    if vkey not in req_vars:
+                        req_vars[vkey] = []
+                    if vpath not in req_vars[vkey]:
+                        req_vars[vkey].append(vpath)
         return req_vars
 
     # DevGoal: we can ultimately add an "interactive" trigger that will open the not-yet-made widget. Otherwise, it will use the var_list passed by the user/defaults
@@ -6,13 +6,15 @@ import pytest
 
 # PURPOSE: mock environmental variables
 @pytest.fixture(scope="session", autouse=True)
-def mock_settings_env_vars():
+def mock_settings_env_vars(tmp_path_factory):
     with mock.patch.dict(
         "os.environ",
         {
             "EARTHDATA_USERNAME": "icepyx_devteam",
             "EARTHDATA_PASSWORD": "fake_earthdata_password",
             "EARTHDATA_EMAIL": "icepyx.dev@gmail.com",
+            # keep values cached during testing out of the user's cache directory
+            "ICEPYX_CACHE_DIR": str(tmp_path_factory.mktemp("icepyx_cache")),
         },
     ):
         yield
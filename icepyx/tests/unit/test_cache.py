@@ -0,0 +1,142 @@
+import os
+import time
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from icepyx.core.cache import DatasetCache, FileCache, cache_dir, default_ttl
+
+
+def test_cache_dir_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    assert cache_dir() == str(tmp_path)
+
+
+def test_cache_dir_xdg(monkeypatch, tmp_path):
+    monkeypatch.delenv("ICEPYX_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert cache_dir() == os.path.join(str(tmp_path), "icepyx")
+
+
+def test_default_ttl_env(monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_TTL", "60")
+    assert default_ttl() == 60
+
+
+def test_default_ttl_bad_env(monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_TTL", "one week")
+    with pytest.raises(ValueError, match="ICEPYX_CACHE_TTL"):
+        default_ttl()
+
+
+def test_set_get(tmp_path, monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    cache = FileCache("test")
+    assert cache.get("ATL06_006") is None
+
+    cache.set("ATL06_006", ["orbit_info/sc_orient", "gt1l/land_ice_segments/h_li"])
+    assert FileCache("test").get("ATL06_006") == [
+        "orbit_info/sc_orient",
+        "gt1l/land_ice_segments/h_li",
+    ]
+    assert FileCache("other").get("ATL06_006") is None
+
+
+def test_expired(tmp_path, monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    cache = FileCache("test", ttl=60)
+    cache.set("key", {"a": 1})
+    assert cache.get("key") == {"a": 1}
+
+    old = time.time() - 120
+    os.utime(cache._path("key"), (old, old))
+    assert cache.get("key") is None
+
+
+def test_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("ICEPYX_CACHE_TTL", "0")
+    cache = FileCache("test")
+    assert not cache.enabled
+    cache.set("key", 1)
+    assert cache.get("key") is None
+    assert not os.path.exists(os.path.join(str(tmp_path), "test"))
+
+
+def test_corrupted(tmp_path, monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    cache = FileCache("test")
+    cache.set("key", 1)
+    with open(cache._path("key"), "w") as f:
+        f.write("{not json")
+    assert cache.get("key") is None
+
+
+def test_clear(tmp_path, monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    cache = FileCache("test")
+    cache.set("key1", 1)
+    cache.set("key2", 2)
+    cache.clear()
+    assert cache.get("key1") is None
+    assert cache.get("key2") is None
+
+
+def make_dataset(n):
+    return xr.Dataset(
+        {"h_li": ("photon_idx", np.arange(n, dtype=np.float32))},
+        coords={"gt": "gt1l"},
+        attrs={"data_product": "ATL06"},
+    )
+
+
+def test_dataset_cache_set_get(tmp_path, monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    cache = DatasetCache()
+    assert cache.get("key") is None
+
+    ds = make_dataset(10)
+    cache.set("key", ds)
+    xr.testing.assert_identical(DatasetCache().get("key"), ds)
+    assert DatasetCache("other").get("key") is None
+
+    lazy = cache.get("key", chunks=-1)
+    assert lazy.h_li.chunks is not None
+    xr.testing.assert_identical(lazy.compute(), ds)
+    lazy.close()
+
+    cache.clear()
+    assert cache.get("key") is None
+    assert cache.size == 0
+
+
+def test_dataset_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    cache = DatasetCache(max_bytes=10**9)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.set(key, make_dataset(10000))
+        old = time.time() - 100 + i
+        os.utime(cache._path(key), (old, old))
+    # reading "a" makes "b" the least recently used
+    assert cache.get("a") is not None
+
+    cache.max_bytes = cache.size - 1
+    cache.set("d", make_dataset(10))
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ["a", "c", "d"])
+    assert cache.size <= cache.max_bytes
+
+
+def test_dataset_cache_corrupted(tmp_path, monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    cache = DatasetCache()
+    cache.set("key", make_dataset(10))
+    with open(cache._path("key"), "w") as f:
+        f.write("not netCDF")
+    assert cache.get("key") is None
+
+
+def test_dataset_cache_bad_max_bytes():
+    with pytest.raises(ValueError, match="max_bytes"):
+        DatasetCache(max_bytes=-1)
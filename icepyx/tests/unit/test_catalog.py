@@ -0,0 +1,188 @@
+import datetime as dt
+
+import h5py
+import numpy as np
+import pytest
+
+from icepyx.core.catalog import GranuleCatalog
+import icepyx.core.read as read
+
+
+def make_granule(path, lat, lon, start, rgt=910, cycle=2):
+    """
+    Write a minimal ATL06-like granule with two ground tracks.
+    """
+    with h5py.File(path, "w") as f:
+        f.attrs["short_name"] = b"ATL06"
+        f.create_group("METADATA/DatasetIdentification").attrs["VersionID"] = b"006"
+        f["orbit_info/rgt"] = np.array([rgt], dtype=np.int16)
+        f["orbit_info/cycle_number"] = np.array([cycle], dtype=np.int8)
+        end = start + dt.timedelta(minutes=5)
+        f["ancillary_data/data_start_utc"] = np.array(
+            [start.isoformat().encode() + b"Z"]
+        )
+        f["ancillary_data/data_end_utc"] = np.array([end.isoformat().encode() + b"Z"])
+        for i, gt in enumerate(["gt1l", "gt2l"]):
+            grp = f.create_group(f"{gt}/land_ice_segments")
+            grp["latitude"] = np.linspace(*lat, 2000)
+            grp["longitude"] = np.linspace(*lon, 2000) + 0.1 * i
+    return str(path)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    data = tmp_path / "data"
+    (data / "2019").mkdir(parents=True)
+    make_granule(
+        data / "processed_ATL06_20190226005526_09100205_006_01.h5",
+        (-70, -69),
+        (-50, -49),
+        dt.datetime(2019, 2, 26, 0, 55, 26),
+    )
+    make_granule(
+        data / "2019" / "ATL06_20190601005526_09100305_006_01.h5",
+        (68, 71),
+        (-55, -48),
+        dt.datetime(2019, 6, 1, 0, 55, 26),
+        cycle=3,
+    )
+    # a file without the standard name, crossing the antimeridian
+    make_granule(
+        data / "2019" / "renamed.h5",
+        (-75, -74),
+        (179, 181),
+        dt.datetime(2019, 3, 1),
+        rgt=1000,
+    )
+    (data / "notes.txt").write_text("not a granule")
+    return data
+
+
+def paths(data_dir, *names):
+    return sorted(str(data_dir / name) for name in names)
+
+
+def test_scan(data_dir, tmp_path):
+    db_path = tmp_path / "catalog.db"
+    catalog = GranuleCatalog(db_path)
+    summary = catalog.scan(data_dir, workers=1)
+    assert summary == {"added": 3, "updated": 0, "removed": 0, "failed": 0}
+    assert len(catalog) == 3
+    # unchanged files are not read again
+    summary = catalog.scan(data_dir)
+    assert summary == {"added": 0, "updated": 0, "removed": 0, "failed": 0}
+    catalog.close()
+
+    with GranuleCatalog(db_path) as catalog:
+        assert catalog.files == paths(
+            data_dir,
+            "2019/ATL06_20190601005526_09100305_006_01.h5",
+            "2019/renamed.h5",
+            "processed_ATL06_20190226005526_09100205_006_01.h5",
+        )
+        row = catalog._conn.execute(
+            "SELECT product, version, cycle, rgt, region, start_time FROM granules "
+            "WHERE path LIKE '%renamed.h5'"
+        ).fetchone()
+        assert row == (
+            "ATL06",
+            "006",
+            2,
+            1000,
+            None,
+            dt.datetime(2019, 3, 1, tzinfo=dt.timezone.utc).timestamp(),
+        )
+
+
+def test_rescan(data_dir, tmp_path):
+    with GranuleCatalog(tmp_path / "catalog.db") as catalog:
+        catalog.scan(data_dir, workers=2)
+        renamed = str(data_dir / "2019" / "renamed.h5")
+        assert catalog.query(date_range=["2020-02-01", "2020-04-01"]) == []
+
+        # rewrite one granule with different contents, delete another, and add one
+        make_granule(renamed, (-75, -74), (179, 181), dt.datetime(2020, 3, 1))
+        (data_dir / "2019" / "ATL06_20190601005526_09100305_006_01.h5").unlink()
+        make_granule(
+            data_dir / "ATL06_20200101005526_09100605_006_01.h5",
+            (68, 71),
+            (-55, -48),
+            dt.datetime(2020, 1, 1, 0, 55, 26),
+            cycle=6,
+        )
+        (data_dir / "broken.h5").write_text("not a granule")
+
+        with pytest.warns(UserWarning, match="1 files could not be read"):
+            summary = catalog.scan(data_dir, workers=2)
+        assert summary == {"added": 1, "updated": 1, "removed": 1, "failed": 1}
+        assert catalog.files == paths(
+            data_dir,
+            "2019/renamed.h5",
+            "ATL06_20200101005526_09100605_006_01.h5",
+            "processed_ATL06_20190226005526_09100205_006_01.h5",
+        )
+        assert catalog.query(date_range=["2020-02-01", "2020-04-01"]) == [renamed]
+
+        # files outside the scanned directory are kept
+        other = tmp_path / "other"
+        other.mkdir()
+        assert catalog.scan(other)["removed"] == 0
+        assert len(catalog) == 3
+
+
+@pytest.mark.parametrize(
+    "kwargs, names",
+    [
+        (
+            {"spatial_extent": [-51, -71, -48, -68]},
+            ["processed_ATL06_20190226005526_09100205_006_01.h5"],
+        ),
+        # a box between the two ground tracks
+        ({"spatial_extent": [-49.48, -69.5, -49.42, -69.49]}, []),
+        ({"spatial_extent": [178, -76, -178, -73]}, ["2019/renamed.h5"]),
+        (
+            {"date_range": ["2019-02-01", "2019-03-01"]},
+            [
+                "2019/renamed.h5",
+                "processed_ATL06_20190226005526_09100205_006_01.h5",
+            ],
+        ),
+        (
+            {
+                "spatial_extent": [-60, 60, -40, 80],
+                "date_range": ["2019-02-01", "2019-03-01"],
+            },
+            [],
+        ),
+        (
+            {"product": "atl06", "version": "6"},
+            [
+                "2019/ATL06_20190601005526_09100305_006_01.h5",
+                "2019/renamed.h5",
+                "processed_ATL06_20190226005526_09100205_006_01.h5",
+            ],
+        ),
+    ],
+)
+def test_query(data_dir, tmp_path, kwargs, names):
+    with GranuleCatalog(tmp_path / "catalog.db") as catalog:
+        catalog.scan(data_dir)
+        assert catalog.query(**kwargs) == paths(data_dir, *names)
+
+
+def test_read_from_catalog(data_dir, tmp_path):
+    with GranuleCatalog(tmp_path / "catalog.db") as catalog:
+        catalog.scan(data_dir)
+        reader = read.Read(catalog, spatial_extent=[-60, 60, -40, 80])
+        assert reader.filelist == paths(
+            data_dir, "2019/ATL06_20190601005526_09100305_006_01.h5"
+        )
+        assert reader.product == "ATL06"
+
+        with pytest.raises(KeyError, match="No files found"):
+            read.Read(catalog, spatial_extent=[10, 10, 20, 20])
+
+
+def test_read_extent_without_catalog(data_dir):
+    with pytest.raises(TypeError, match="GranuleCatalog"):
+        read.Read(str(data_dir), spatial_extent=[10, 10, 20, 20])
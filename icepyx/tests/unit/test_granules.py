@@ -1,12 +1,23 @@
+import datetime as dt
+import io
+import json
+import os
 import re
+import zipfile
 
+import fsspec
+import pandas as pd
 import pytest
+import requests
+from requests.compat import unquote
 import responses
+import shapely
 
 import icepyx as ipx
 from icepyx.core import granules as granules
 from icepyx.core.exceptions import NsidcQueryError
 from icepyx.core.granules import Granules as Granules
+from icepyx.core.urls import DOWNLOAD_BASE_URL, ORDER_BASE_URL
 
 # @pytest.fixture
 # def reg_a():
@@ -639,3 +650,493 @@ def test_avail_granule_CMR_error():
         CMRparams = {"temporal": "badinput"}
         reqparams = {"version": "003", "short_name": "ATL08", "page_size": 1}
         Granules().get_avail(CMRparams=CMRparams, reqparams=reqparams)
+
+
+def fake_cmr_granules():
+    """
+    Granules starting every 7 hours, each lasting 1 hour (so some span midnight).
+    """
+    start = dt.datetime(2019, 2, 20, 2)
+    return [
+        {
+            "producer_granule_id": f"ATL06_{i:02d}.h5",
+            "time_start": (start + dt.timedelta(hours=7 * i)).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            ),
+            "time_end": (start + dt.timedelta(hours=7 * i + 1)).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            ),
+        }
+        for i in range(25)
+    ]
+
+
+def fake_cmr_search(request):
+    """
+    Return the granules overlapping the temporal search range, one page at a time.
+    """
+    params = dict(p.split("=", 1) for p in request.url.split("?", 1)[1].split("&"))
+    start, end = unquote(params["temporal"]).split(",")
+    hits = [
+        gran
+        for gran in fake_cmr_granules()
+        if gran["time_start"] <= end and gran["time_end"] >= start
+    ]
+
+    page_size = int(params["page_size"])
+    page = int(request.headers.get("CMR-Search-After", 0))
+    headers = {"CMR-Hits": str(len(hits)), "CMR-Search-After": str(page + 1)}
+    body = {"feed": {"entry": hits[page * page_size : (page + 1) * page_size]}}
+    return (200, headers, json.dumps(body))
+
+
+@responses.activate
+@pytest.mark.parametrize("workers", [2, 3, 8])
+def test_avail_granules_concurrent_matches_serial(workers):
+    responses.add_callback(
+        responses.GET,
+        re.compile(re.escape("https://cmr.earthdata.nasa.gov/search/granules") + r".*"),
+        callback=fake_cmr_search,
+    )
+    CMRparams = {"temporal": "2019-02-20T00:00:00Z,2019-02-27T23:59:59Z"}
+    reqparams = {"version": "006", "short_name": "ATL06", "page_size": 4}
+
+    serial = Granules()
+    serial.get_avail(CMRparams=CMRparams, reqparams=reqparams)
+    concurrent = Granules()
+    concurrent.get_avail(CMRparams=CMRparams, reqparams=reqparams, workers=workers)
+
+    assert len(serial.avail) == 25
+    assert concurrent.avail == serial.avail
+
+
+def test_avail_granules_bad_workers():
+    with pytest.raises(ValueError, match="workers must be a positive integer"):
+        Granules().get_avail(CMRparams={}, reqparams={}, workers=0)
+
+
+@pytest.mark.parametrize(
+    "temporal, n_windows, exp",
+    [
+        (
+            "2019-02-20T00:00:00Z,2019-02-22T23:59:59Z",
+            3,
+            [
+                "2019-02-20T00:00:00Z,2019-02-20T23:59:59Z",
+                "2019-02-21T00:00:00Z,2019-02-21T23:59:59Z",
+                "2019-02-22T00:00:00Z,2019-02-22T23:59:59Z",
+            ],
+        ),
+        (
+            "2019-02-20T00:00:00Z,2019-02-20T00:00:01Z",
+            4,
+            [
+                "2019-02-20T00:00:00Z,2019-02-20T00:00:00Z",
+                "2019-02-20T00:00:01Z,2019-02-20T00:00:01Z",
+            ],
+        ),
+        ("badinput", 4, ["badinput"]),
+    ],
+)
+def test_split_temporal(temporal, n_windows, exp):
+    assert granules._split_temporal(temporal, n_windows) == exp
+
+
+@responses.activate
+@pytest.mark.parametrize("ttl, cached", [(None, False), ("3600", True)])
+def test_avail_granules_cache(monkeypatch, tmp_path, ttl, cached):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    if ttl is not None:
+        monkeypatch.setenv("ICEPYX_CMR_GRANULES_TTL", ttl)
+    responses.add_callback(
+        responses.GET,
+        re.compile(re.escape("https://cmr.earthdata.nasa.gov/search/granules") + r".*"),
+        callback=fake_cmr_search,
+    )
+    CMRparams = {"temporal": "2019-02-20T00:00:00Z,2019-02-27T23:59:59Z"}
+    reqparams = {"version": "006", "short_name": "ATL06", "page_size": 10}
+
+    first = Granules()
+    first.get_avail(CMRparams=CMRparams, reqparams=reqparams)
+    n_calls = len(responses.calls)
+
+    second = Granules()
+    second.get_avail(CMRparams=CMRparams, reqparams=reqparams)
+    assert second.avail == first.avail
+    assert len(responses.calls) == (n_calls if cached else 2 * n_calls)
+
+    # a refresh always searches again
+    n_calls = len(responses.calls)
+    third = Granules()
+    third.get_avail(CMRparams=CMRparams, reqparams=reqparams, refresh=True)
+    assert third.avail == first.avail
+    assert len(responses.calls) > n_calls
+
+
+@pytest.fixture
+def cmr_grans():
+    return [
+        {
+            "producer_granule_id": "ATL06_20190221121851_08410203_006_01.h5",
+            "granule_size": "40.5",
+            "time_start": "2019-02-21T12:18:51.000Z",
+            "time_end": "2019-02-21T12:24:16.000Z",
+            "polygons": [["68 -55 68 -48 71 -48 71 -55 68 -55"]],
+            "links": [
+                {"href": "https://data.nsidc.earthdatacloud.nasa.gov/ATL06_1.h5"},
+                {"href": "s3://nsidc-cumulus-prod-protected/ATL06_1.h5"},
+                {"href": "s3://nsidc-cumulus-prod-protected/ATL06_1_part2.h5"},
+                {"href": "s3://nsidc-cumulus-prod-protected/ATL06_1.iso.xml"},
+            ],
+        },
+        {
+            "producer_granule_id": "ATL06_20190222010344_08490205_006_01.h5",
+            "granule_size": "60.25",
+            "time_start": "2019-02-22T01:03:44.000Z",
+            "time_end": "2019-02-22T01:09:12.000Z",
+            "polygons": [
+                ["-70 -50 -70 -49 -69 -49 -69 -50 -70 -50"],
+                ["-72 -50 -72 -49 -71 -49 -71 -50 -72 -50"],
+            ],
+        },
+    ]
+
+
+def test_catalog_from_json(cmr_grans):
+    catalog = granules._catalog_from_json(cmr_grans)
+
+    assert catalog["id"].tolist() == [
+        "ATL06_20190221121851_08410203_006_01.h5",
+        "ATL06_20190222010344_08490205_006_01.h5",
+    ]
+    assert catalog["size"].tolist() == [40.5, 60.25]
+    assert catalog["cycle"].tolist() == [2, 2]
+    assert catalog["rgt"].tolist() == [841, 849]
+    assert catalog["region"].tolist() == [3, 5]
+    assert catalog["start_time"][1] == pd.Timestamp("2019-02-22T01:03:44Z")
+    assert catalog["s3_url"][0] == "s3://nsidc-cumulus-prod-protected/ATL06_1.h5"
+    assert catalog["https_url"][0].startswith("https://data.nsidc")
+    assert catalog["s3_url"][1] is None
+    assert len(catalog["s3_urls"][0]) == 2
+    assert catalog["s3_urls"][1] == []
+
+    assert catalog["footprint"][0].equals(shapely.box(-55, 68, -48, 71))
+    assert isinstance(catalog["footprint"][1], shapely.MultiPolygon)
+    assert catalog["footprint"][1].bounds == (-50, -72, -49, -69)
+
+
+def test_gran_IDs_catalog_matches_json(cmr_grans):
+    kwargs = {"ids": True, "cycles": True, "tracks": True, "dates": True, "cloud": True}
+    exp = [
+        [
+            "ATL06_20190221121851_08410203_006_01.h5",
+            "ATL06_20190222010344_08490205_006_01.h5",
+        ],
+        ["02", "02"],
+        ["0841", "0849"],
+        ["2019-02-21", "2019-02-22"],
+        [
+            "s3://nsidc-cumulus-prod-protected/ATL06_1.h5",
+            "s3://nsidc-cumulus-prod-protected/ATL06_1_part2.h5",
+        ],
+    ]
+
+    assert granules.gran_IDs(cmr_grans, **kwargs) == exp
+    assert granules.gran_IDs(granules._catalog_from_json(cmr_grans), **kwargs) == exp
+
+
+def test_info_catalog(cmr_grans):
+    exp = {
+        "Number of available granules": 2,
+        "Average size of granules (MB)": 50.375,
+        "Total size of all granules (MB)": 100.75,
+    }
+    assert granules.info(cmr_grans) == exp
+    assert granules.info(granules._catalog_from_json(cmr_grans)) == exp
+
+
+def test_catalog_rebuilt_with_avail(cmr_grans):
+    grans = Granules()
+    grans.avail = cmr_grans
+    assert len(grans.catalog) == 2
+    grans.avail = cmr_grans[:1]
+    assert len(grans.catalog) == 1
+
+
+def test_footprints_intersecting():
+    footprints = [
+        shapely.box(-55, 68, -48, 71),
+        shapely.box(-30, 62, -10, 70),
+        None,
+        shapely.box(170, -75, 179, -70),
+    ]
+    # the bounding box of the L-shaped region overlaps the second footprint,
+    # but the region itself does not
+    region = shapely.Polygon(
+        [(-60, 60), (-60, 75), (0, 75), (0, 72), (-40, 72), (-40, 60)]
+    )
+
+    exp = [True, False, True, False]
+    assert granules._footprints_intersecting(footprints, region).tolist() == exp
+
+
+def test_footprints_intersecting_xdateline():
+    footprints = [shapely.box(170, -75, 179, -70), shapely.box(-179, -75, -170, -70)]
+    region = shapely.box(175, -80, 185, -60)
+
+    assert granules._footprints_intersecting(footprints, region).tolist() == [
+        True,
+        True,
+    ]
+
+
+def test_filter_by_footprint(cmr_grans, capsys):
+    grans = Granules()
+    grans.avail = cmr_grans
+    assert len(grans.catalog) == 2
+
+    n_removed = grans.filter_by_footprint(ipx.core.spatial.Spatial([-56, 67, -50, 70]))
+
+    assert n_removed == 1
+    assert "Removed 1 of 2 granules" in capsys.readouterr().out
+    assert grans.avail == cmr_grans[:1]
+    assert grans.catalog["id"].tolist() == [cmr_grans[0]["producer_granule_id"]]
+
+    assert grans.filter_by_footprint(shapely.box(-60, 60, -40, 75)) == 0
+    assert grans.avail == cmr_grans[:1]
+
+
+@responses.activate
+def test_place_order_submits_all_pages_before_polling(tmp_path, monkeypatch):
+    def fake_get_avail(self, CMRparams, reqparams):
+        self.avail = [{"producer_granule_id": f"ATL06_{i}.h5"} for i in range(3)]
+
+    def fake_order(request):
+        page_num = request.params["page_num"]
+        body = f"<eesi><order><orderId>500{page_num}</orderId></order></eesi>"
+        return (200, {}, body)
+
+    def status_xml(status, info=""):
+        return (
+            f"<eesi><requestStatus><status>{status}</status></requestStatus>"
+            f"<processInfo><info>{info}</info></processInfo></eesi>"
+        )
+
+    responses.add_callback(responses.GET, ORDER_BASE_URL, callback=fake_order)
+    responses.get(f"{ORDER_BASE_URL}/5001", body=status_xml("pending"))
+    responses.get(f"{ORDER_BASE_URL}/5001", body=status_xml("complete", "done"))
+    responses.get(f"{ORDER_BASE_URL}/5002", body=status_xml("failed", "no data"))
+
+    sleeps = []
+    monkeypatch.setattr(granules.time, "sleep", sleeps.append)
+    monkeypatch.setattr(Granules, "get_avail", fake_get_avail)
+    monkeypatch.chdir(tmp_path)
+
+    grans = Granules()
+    grans._session = requests.Session()
+    reqparams = {"short_name": "ATL06", "version": "006", "page_size": 2}
+    orderIDs = grans.place_order(
+        {}, {**reqparams, "page_num": 0}, {}, verbose=False, subset=False
+    )
+
+    assert orderIDs == ["5001"]
+    assert sleeps == [granules.ORDER_POLL_DELAY]
+
+    # both pages are ordered before the status of either order is requested
+    pages = [call.request.params.get("page_num") for call in responses.calls]
+    assert pages[:2] == ["1", "2"]
+    assert pages[2:] == [None, None, None]
+
+    with open(tmp_path / ".order_restart") as fid:
+        journal = json.load(fid)
+    assert journal == {
+        "orderIDs": ["5001"],
+        "orders": {"5001": "complete", "5002": "failed"},
+    }
+
+
+def fake_order_zip(order):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr(f"{order}/processed_ATL06_{order}.h5", f"data {order}")
+    return buf.getvalue()
+
+
+@responses.activate
+def test_download_streams_orders(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "data"
+    for order in ["5001", "5002", "5003"]:
+        responses.get(f"{DOWNLOAD_BASE_URL}/{order}.zip", body=fake_order_zip(order))
+
+    grans = Granules()
+    grans._session = requests.Session()
+    grans.orderIDs = ["5001", "5002", "5003"]
+    # 5001 was downloaded before the download was interrupted
+    out.mkdir()
+    with open(out / granules.DOWNLOAD_JOURNAL, "w") as fid:
+        json.dump({"orders": {"5001": "downloaded"}}, fid)
+    grans.download(False, str(out), restart=True, workers=2)
+
+    assert sorted(os.listdir(out)) == [
+        "processed_ATL06_5002.h5",
+        "processed_ATL06_5003.h5",
+    ]
+    assert (out / "processed_ATL06_5003.h5").read_text() == "data 5003"
+    assert len(responses.calls) == 2
+    assert not os.path.exists(out / granules.DOWNLOAD_JOURNAL)
+
+
+def test_download_bad_workers():
+    grans = Granules()
+    grans.orderIDs = ["5001"]
+    with pytest.raises(ValueError, match="workers"):
+        grans.download(False, ".", workers=0)
+
+
+def test_bandwidth_limiter(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(granules.time, "sleep", sleeps.append)
+    monkeypatch.setattr(granules.time, "monotonic", lambda: 10.0)
+
+    limiter = granules._BandwidthLimiter(100)
+    limiter.wait(100)
+    limiter.wait(50)
+
+    assert sleeps == [1.0, 1.5]
+
+
+@responses.activate
+def test_download_resumes_partial_file(tmp_path):
+    content = fake_order_zip("5001")
+    url = f"{DOWNLOAD_BASE_URL}/5001.zip"
+
+    def fake_range_get(request):
+        start = int(request.headers["Range"].split("=")[1].rstrip("-"))
+        headers = {"Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}"}
+        return (206, headers, content[start:])
+
+    responses.add_callback(responses.GET, url, callback=fake_range_get)
+    part_fn = tmp_path / "5001.zip.part"
+    part_fn.write_bytes(content[:20])
+
+    grans = Granules()
+    grans._session = requests.Session()
+    grans._download_file(url, str(part_fn))
+
+    assert responses.calls[0].request.headers["Range"] == "bytes=20-"
+    assert part_fn.read_bytes() == content
+
+
+@responses.activate
+def test_download_corrupted_order(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    out = tmp_path / "data"
+    responses.get(f"{DOWNLOAD_BASE_URL}/5001.zip", body=b"not a zip file")
+    responses.get(f"{DOWNLOAD_BASE_URL}/5002.zip", body=fake_order_zip("5002"))
+
+    grans = Granules()
+    grans._session = requests.Session()
+    grans.orderIDs = ["5001", "5002"]
+    grans.download(False, str(out))
+
+    # the corrupted order is downloaded again before giving up
+    assert len(responses.calls) == granules.DOWNLOAD_RETRIES + 2
+    assert sorted(os.listdir(out)) == [
+        granules.DOWNLOAD_JOURNAL,
+        "processed_ATL06_5002.h5",
+    ]
+    with open(out / granules.DOWNLOAD_JOURNAL) as fid:
+        assert json.load(fid) == {"orders": {"5001": "failed", "5002": "downloaded"}}
+
+
+def test_local_granules(tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "processed_ATL06_20190221121851_08410203_006_01.h5").write_text("a")
+    (tmp_path / "sub" / "ATL06_20190222010344_08490205_006_01.h5").write_text("abc")
+    (tmp_path / "notes.txt").write_text("not a granule")
+
+    assert granules._local_granules(tmp_path) == {
+        "ATL06_20190221121851_08410203_006_01.h5": None,
+        "ATL06_20190222010344_08490205_006_01.h5": 3,
+    }
+
+
+def test_remove_existing(cmr_grans, tmp_path, capsys):
+    (tmp_path / "processed_ATL06_20190221121851_08410203_006_01.h5").write_text("a")
+    # a partially written copy of the second granule
+    full_fn = tmp_path / "ATL06_20190222010344_08490205_006_01.h5"
+    full_fn.write_text("abc")
+
+    grans = Granules()
+    grans.avail = cmr_grans
+
+    assert grans.remove_existing(tmp_path) == [cmr_grans[0]["producer_granule_id"]]
+    assert "Skipping 1 of 2 granules" in capsys.readouterr().out
+    assert grans.avail == cmr_grans[1:]
+    assert grans.catalog["id"].tolist() == [cmr_grans[1]["producer_granule_id"]]
+
+    with open(full_fn, "wb") as f:
+        f.truncate(int(60.25 * 1024**2))
+    assert grans.remove_existing(tmp_path) == [cmr_grans[1]["producer_granule_id"]]
+    assert grans.avail == []
+
+
+def test_download_s3(tmp_path, monkeypatch):
+    fs = fsspec.filesystem("memory")
+    contents = {
+        "s3://bucket/ATL06_1.h5": bytes(range(256)) * 41,
+        "s3://bucket/ATL06_2.h5": b"small",
+    }
+    for url, content in contents.items():
+        fs.pipe(url, content)
+    monkeypatch.setattr(Granules, "s3fs", property(lambda self: fs))
+    monkeypatch.setattr(granules, "S3_PART_SIZE", 1000)
+
+    grans = Granules()
+    grans.avail = [
+        {"producer_granule_id": url.split("/")[-1], "links": [{"href": url}]}
+        for url in contents
+    ] + [{"producer_granule_id": "ATL06_3.h5"}]
+    filenames = grans.download_s3(str(tmp_path), workers=4)
+
+    assert filenames == [str(tmp_path / "ATL06_1.h5"), str(tmp_path / "ATL06_2.h5")]
+    for url, fn in zip(contents, filenames):
+        with open(fn, "rb") as f:
+            assert f.read() == contents[url]
+    assert sorted(os.listdir(tmp_path)) == ["ATL06_1.h5", "ATL06_2.h5"]
+
+
+class FakeAuth:
+    def __init__(self, username):
+        self.username = username
+        self.n_requests = 0
+
+    def get_s3_credentials(self, daac):
+        self.n_requests += 1
+        return {
+            "accessKeyId": f"{self.username}{self.n_requests}",
+            "secretAccessKey": "secret",
+            "sessionToken": "token",
+        }
+
+
+def test_s3fs_shared_and_refreshed():
+    auth = FakeAuth("test_s3fs_user")
+    grans = Granules()
+    grans._auth = auth
+    other = Granules()
+    other._auth = FakeAuth("test_s3fs_user")
+
+    fs = grans.s3fs
+    assert fs.key == "test_s3fs_user1"
+    # objects logged in as the same user share the credentials and filesystem
+    assert other.s3fs is fs
+    assert other.s3login_credentials is grans.s3login_credentials
+    assert auth.n_requests == 1
+
+    # the credentials are replaced before they expire
+    grans._s3._initial_ts -= dt.timedelta(minutes=56)
+    new_fs = grans.s3fs
+    assert new_fs is not fs
+    assert new_fs.key == "test_s3fs_user2"
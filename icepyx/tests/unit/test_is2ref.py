@@ -1,4 +1,5 @@
 import pytest
+import responses
 
 import icepyx.core.is2ref as is2ref
 
@@ -291,6 +292,30 @@ def test_atl23_product():
 
 
 ########## about_product ##########
+
+
+@responses.activate
+def test_about_product_cached(monkeypatch, tmp_path):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    feed = {"feed": {"entry": [{"version_id": "005"}, {"version_id": "006"}]}}
+    responses.add(
+        responses.GET,
+        "https://cmr.earthdata.nasa.gov/search/collections.json",
+        json=feed,
+    )
+
+    assert is2ref.about_product("ATL06") == feed
+    assert is2ref.latest_version("ATL06") == "006"
+    assert len(responses.calls) == 1
+
+    assert is2ref.about_product("ATL06", refresh=True) == feed
+    assert len(responses.calls) == 2
+
+    monkeypatch.setenv("ICEPYX_CMR_COLLECTIONS_TTL", "0")
+    is2ref.about_product("ATL06")
+    assert len(responses.calls) == 3
+
+
 # Note: requires internet connection
 # could the github flat data option be used here? https://octo.github.com/projects/flat-data
 # def test_product_info():
@@ -620,3 +645,28 @@ def test_gt2spot_sc_orient_0():
     obs = is2ref.gt2spot("gt3r", 0)
     expected = 6
     assert obs == expected
+
+
+########## _parse_granule_filename ##########
+
+
+@pytest.mark.parametrize(
+    "filepath, expect",
+    [
+        ("ATL06_20190226005526_09100205_006_02.h5", ("ATL06", "006")),
+        (
+            "/path/to/processed_ATL03_20191130221008_09930503_006_01.h5",
+            ("ATL03", "006"),
+        ),
+        (
+            "s3://nsidc-cumulus-prod-protected/ATLAS/ATL07/006/2019/11/30/"
+            "ATL07-01_20191130001455_09810501_006_01.h5",
+            ("ATL07", "006"),
+        ),
+        ("ATL14_A1_0325_100m_004_05.nc", None),
+        ("ATL99_20190226005526_09100205_006_02.h5", None),
+        ("my_renamed_file.h5", None),
+    ],
+)
+def test_parse_granule_filename(filepath, expect):
+    assert is2ref._parse_granule_filename(filepath) == expect
@@ -1,8 +1,87 @@
+import concurrent.futures
+import datetime as dt
+import os
+import shutil
+
+import geopandas as gpd
+import h5py
+import numpy as np
+import pandas as pd
 import pytest
+import xarray as xr
 
 import icepyx.core.read as read
 
 
+def make_atl06_file(path, rgt, cycle, n_segs=20, seed=0):
+    """
+    Write a small ATL06-like granule with the groups and metadata icepyx needs to read it.
+    """
+    rng = np.random.default_rng(seed)
+    kwargs = {"engine": "h5netcdf", "mode": "a"}
+
+    xr.Dataset(
+        {
+            "sc_orient": ("sc_orient_time", np.array([1], dtype=np.int8)),
+            "cycle_number": ("orbit_idx", np.array([cycle], dtype=np.int8)),
+            "rgt": ("orbit_idx", np.array([rgt], dtype=np.int16)),
+        },
+        coords={"sc_orient_time": [1.0]},
+    ).to_netcdf(path, group="orbit_info", engine="h5netcdf", mode="w")
+    xr.Dataset(
+        {
+            "atlas_sdp_gps_epoch": ("anc_idx", [1.198e9]),
+            "data_start_utc": ("anc_idx", np.array([b"2019-02-26T00:55:26.000000Z"])),
+            "data_end_utc": ("anc_idx", np.array([b"2019-02-26T01:00:26.000000Z"])),
+        }
+    ).to_netcdf(path, group="ancillary_data", **kwargs)
+
+    for gt in ["gt1l", "gt2r"]:
+        delta_time = np.sort(rng.uniform(0, 100, n_segs))
+        xr.Dataset(
+            {"h_li": ("delta_time", rng.normal(1000, 5, n_segs).astype(np.float32))},
+            coords={
+                "delta_time": delta_time,
+                "latitude": ("delta_time", np.linspace(-70, -69, n_segs)),
+                "longitude": ("delta_time", np.linspace(-50, -49, n_segs)),
+            },
+        ).to_netcdf(path, group=f"{gt}/land_ice_segments", **kwargs)
+        xr.Dataset(
+            {"h_mean": ("delta_time", rng.normal(1000, 5, n_segs).astype(np.float32))},
+            coords={"delta_time": delta_time},
+        ).to_netcdf(path, group=f"{gt}/land_ice_segments/fit_statistics", **kwargs)
+
+    with h5py.File(path, "a") as f:
+        f.attrs["short_name"] = b"ATL06"
+        grp = f.create_group("METADATA/DatasetIdentification")
+        grp.attrs["VersionID"] = b"006"
+
+    return path
+
+
+@pytest.fixture(scope="module")
+def atl06_files(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("atl06")
+    return [
+        make_atl06_file(
+            os.path.join(data_dir, f"processed_ATL06_{fn}_006_01.h5"), *orbit, seed=i
+        )
+        for i, (fn, orbit) in enumerate(
+            [
+                ("20190226005526_09100205", (910, 2)),
+                ("20190301005526_09580205", (958, 2)),
+                ("20190601005526_09100305", (910, 3)),
+            ]
+        )
+    ]
+
+
+def get_reader(source):
+    reader = read.Read(source)
+    reader.vars.append(var_list=["h_li", "latitude", "longitude", "h_mean"])
+    return reader
+
+
 # note isdir will issue a TypeError if a tuple is passed
 def test_parse_source_bad_input_type():
     ermesg = (
@@ -103,3 +182,457 @@ def test_get_track_type_str(
         exp_spot_dim_name,
         exp_spot_var_name,
     )
+
+
+@pytest.mark.parametrize(
+    "executor, expect",
+    [
+        ("process", concurrent.futures.ProcessPoolExecutor),
+        ("thread", concurrent.futures.ThreadPoolExecutor),
+    ],
+)
+def test_get_pool_executor(executor, expect):
+    assert read._get_pool_executor(executor) is expect
+
+
+def test_get_pool_executor_bad_input():
+    ermesg = "Invalid executor: dask. Please select from this list: process, thread"
+    with pytest.raises(ValueError, match=ermesg):
+        read._get_pool_executor("dask")
+
+
+@pytest.mark.parametrize(
+    "grp_path",
+    [
+        "orbit_info",
+        "ancillary_data",
+        "gt1l/land_ice_segments",
+        "gt1l/land_ice_segments/fit_statistics",
+    ],
+)
+def test_read_single_grp_matches_per_group_open(atl06_files, grp_path):
+    reader = read.Read(atl06_files[0])
+    with reader._open_file(atl06_files[0]) as h5f:
+        obs = reader._read_single_grp(h5f, grp_path).load()
+    exp = xr.open_dataset(
+        atl06_files[0],
+        group=grp_path,
+        engine="h5netcdf",
+        backend_kwargs={"phony_dims": "access"},
+    )
+    xr.testing.assert_identical(obs, exp)
+    exp.close()
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_load_matches_serial(atl06_files, executor):
+    serial = get_reader(atl06_files).load()
+    parallel = get_reader(atl06_files).load(workers=2, executor=executor)
+    xr.testing.assert_identical(parallel, serial)
+
+
+@pytest.mark.parametrize("workers", [0, -2, 1.5])
+def test_load_bad_workers(atl06_files, workers):
+    ermesg = "workers must be a positive integer or None"
+    with pytest.raises(ValueError, match=ermesg):
+        get_reader(atl06_files).load(workers=workers)
+
+
+def test_lazy_load(atl06_files):
+    import dask.array
+
+    ds = get_reader(atl06_files[0]).load(lazy=True, chunks={"photon_idx": 5})
+
+    for var in ["h_li", "h_mean", "latitude", "longitude"]:
+        assert isinstance(ds[var].data, dask.array.Array)
+    # orbit_info and ancillary_data variables are read eagerly
+    for var in ["sc_orient", "cycle_number", "rgt", "data_start_utc"]:
+        assert isinstance(ds[var].data, np.ndarray)
+    # chunks are given by output dimension but applied to delta_time when reading
+    assert set(ds.h_li.chunksizes["photon_idx"]) == {5}
+
+    xr.testing.assert_identical(ds.compute(), get_reader(atl06_files[0]).load())
+
+    # closing the dataset closes the granule file
+    ds.close()
+    with pytest.raises(ValueError):
+        ds.h_li.compute()
+
+
+def test_lazy_load_multiple_files(atl06_files):
+    lazy = get_reader(atl06_files).load(lazy=True, workers=2)
+    xr.testing.assert_identical(lazy.compute(), get_reader(atl06_files).load())
+    lazy.close()
+
+
+def test_load_cache(atl06_files, tmp_path, monkeypatch):
+    monkeypatch.setenv("ICEPYX_CACHE_DIR", str(tmp_path))
+    expect = get_reader(atl06_files).load()
+    xr.testing.assert_identical(get_reader(atl06_files).load(cache=True), expect)
+    assert len(os.listdir(tmp_path / "datasets")) == 3
+
+    # later loads do not read the granule files
+    def fail(*args, **kwargs):
+        raise AssertionError("the granule file was read")
+
+    with monkeypatch.context() as m:
+        m.setattr(read.Read, "_build_single_file_dataset", fail)
+        xr.testing.assert_identical(get_reader(atl06_files).load(cache=True), expect)
+        with get_reader(atl06_files).load(cache=True, lazy=True) as ds:
+            xr.testing.assert_identical(ds.compute(), expect)
+        with pytest.raises(AssertionError, match="was read"):
+            # a different set of wanted variables
+            reader = read.Read(atl06_files)
+            reader.vars.append(var_list=["h_li"])
+            reader.load(cache=True)
+
+
+def test_load_cache_key(atl06_files, tmp_path):
+    file = shutil.copy(atl06_files[0], tmp_path)
+    groups_list = ["orbit_info", "gt1l/land_ice_segments"]
+    key = read._conversion_cache_key("ATL06", file, groups_list)
+    assert key == read._conversion_cache_key("ATL06", file, groups_list[::-1])
+    subset = read._get_subset(date_range=["2019-02-20", "2019-02-28"])
+    assert key != read._conversion_cache_key("ATL06", file, groups_list, subset)
+    # a modified file
+    stat = os.stat(file)
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert key != read._conversion_cache_key("ATL06", file, groups_list)
+
+
+def test_load_bad_cache(atl06_files):
+    with pytest.raises(TypeError, match="cache must be"):
+        get_reader(atl06_files).load(cache="yes")
+
+
+def test_load_chunks_without_lazy(atl06_files):
+    ermesg = "chunks can only be specified when lazy=True"
+    with pytest.raises(ValueError, match=ermesg):
+        get_reader(atl06_files).load(chunks={"photon_idx": 5})
+
+
+def test_lazy_load_process_executor(atl06_files):
+    ermesg = "Please use executor='thread'"
+    with pytest.raises(ValueError, match=ermesg):
+        get_reader(atl06_files).load(lazy=True, workers=2, executor="process")
+
+
+@pytest.mark.parametrize("batch_size, n_yielded", [(1, 3), (2, 2), (3, 1)])
+def test_iter_granules(atl06_files, batch_size, n_yielded):
+    reader = get_reader(atl06_files)
+    granules = list(reader.iter_granules(batch_size=batch_size))
+    assert len(granules) == n_yielded
+    if batch_size == 1:
+        for file, ds in zip(atl06_files, granules):
+            xr.testing.assert_identical(ds, get_reader(file).load())
+    else:
+        gran_idxs = np.concatenate([ds.gran_idx.values for ds in granules])
+        np.testing.assert_array_equal(
+            np.sort(gran_idxs), get_reader(atl06_files).load().gran_idx.values
+        )
+
+
+def test_iter_granules_bad_batch_size(atl06_files):
+    with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+        next(get_reader(atl06_files).iter_granules(batch_size=0))
+
+
+def test_flatten_granule(atl06_files):
+    ds = get_reader(atl06_files[0]).load()
+    flat = read._flatten_granule(ds)
+    assert set(flat.dims) == {"obs"}
+    # one row per (non-padding) observation of each ground track
+    assert flat.sizes["obs"] == int(ds.h_li.notnull().sum())
+    assert {"gran_idx", "spot", "photon_idx", "cycle_number", "rgt"} <= set(
+        flat.variables
+    )
+
+
+@pytest.mark.parametrize("partition_by", [["cycle_number", "rgt", "spot"], []])
+def test_to_parquet(atl06_files, tmp_path, partition_by):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    out = tmp_path / "atl06.parquet"
+    get_reader(atl06_files[:2]).to_parquet(out, partition_by=partition_by)
+    with pytest.raises(FileExistsError):
+        get_reader(atl06_files[2]).to_parquet(out, partition_by=partition_by)
+    get_reader(atl06_files[2]).to_parquet(out, partition_by=partition_by, append=True)
+    # writing a granule again replaces its rows
+    get_reader(atl06_files[0]).to_parquet(out, partition_by=partition_by, append=True)
+
+    df = pd.read_parquet(out)
+    expect = read._flatten_granule(get_reader(atl06_files).load())
+    assert len(df) == expect.sizes["obs"]
+    df = df.sort_values(["gran_idx", "spot", "photon_idx"])
+    np.testing.assert_allclose(
+        df.h_li.values, expect.sortby(["gran_idx", "spot", "photon_idx"]).h_li.values
+    )
+
+    if partition_by:
+        df = pd.read_parquet(out, columns=["h_li"], filters=[("rgt", "==", 958)])
+        assert len(df) == int(get_reader(atl06_files[1]).load().h_li.notnull().sum())
+
+
+def test_to_parquet_bad_partition(atl06_files, tmp_path):
+    pytest.importorskip("pyarrow")
+    with pytest.raises(ValueError, match="Cannot partition by"):
+        get_reader(atl06_files[0]).to_parquet(tmp_path / "out", partition_by=["beam"])
+
+
+def test_to_zarr(atl06_files, tmp_path):
+    pytest.importorskip("zarr")
+    store = tmp_path / "atl06.zarr"
+    get_reader(atl06_files[:2]).to_zarr(store, chunk_size=50)
+    get_reader(atl06_files[2]).to_zarr(store, append=True)
+
+    ds = xr.open_zarr(store)
+    expect = read._flatten_granule(get_reader(atl06_files).load())
+    assert ds.sizes["obs"] == expect.sizes["obs"]
+    assert set(np.unique(ds.rgt.values)) == {910, 958}
+
+
+def test_merge_track_grps_matches_sequential_merge(atl06_files):
+    reader = get_reader(atl06_files[0])
+    groups_list = reader._get_groups_list()
+    wanted_dict, _ = read.Variables.parse_var_list(groups_list, tiered=False)
+    _, wanted_groups_tiered = read.Variables.parse_var_list(
+        groups_list, tiered=True, tiered_vars=True
+    )
+    track_grps = ["gt1l/land_ice_segments", "gt2r/land_ice_segments"]
+
+    with reader._open_file(atl06_files[0]) as h5f:
+        template = reader._build_dataset_template("ATL06", atl06_files[0])
+        for grp_path in ["orbit_info", "ancillary_data"]:
+            template, _ = reader._add_vars_to_ds(
+                template,
+                reader._read_single_grp(h5f, grp_path),
+                grp_path,
+                wanted_groups_tiered,
+                wanted_dict,
+            )
+
+        sequential = template
+        for grp_path in track_grps:
+            sequential, _ = reader._add_vars_to_ds(
+                sequential,
+                reader._read_single_grp(h5f, grp_path),
+                grp_path,
+                wanted_groups_tiered,
+                wanted_dict,
+            )
+
+        track_dss = []
+        first_photon_idx = 0
+        for grp_path in track_grps:
+            ds = reader._format_track_grp(
+                template,
+                reader._read_single_grp(h5f, grp_path),
+                grp_path,
+                read._PathIndex(groups_list),
+                first_photon_idx,
+            )
+            first_photon_idx += ds.sizes["photon_idx"]
+            track_dss.append(ds)
+        batched = reader._merge_track_grps(template, track_dss)
+
+        xr.testing.assert_identical(batched.load(), sequential.load())
+
+
+def test_concat_by_gran_idx_matches_combine_by_coords(atl06_files):
+    all_dss = [get_reader(file).load() for file in atl06_files]
+    assert read._has_unique_gran_idx(all_dss)
+
+    concatenated = read._combine_granules(all_dss)
+    combined = xr.combine_by_coords(all_dss, data_vars="minimal")
+    xr.testing.assert_identical(concatenated, combined)
+
+
+def test_has_unique_gran_idx_duplicates(atl06_files):
+    ds = get_reader(atl06_files[0]).load()
+    assert not read._has_unique_gran_idx([ds, ds.copy()])
+
+
+@pytest.mark.parametrize(
+    "spatial_extent, date_range",
+    [
+        ([-50, -70, -49.5, -69.6], None),
+        ([(-50, -70), (-49.5, -70), (-49.5, -69.6), (-50, -69.6), (-50, -70)], None),
+        (None, [dt.datetime(2018, 1, 1, 0, 0, 0), dt.datetime(2018, 1, 1, 0, 0, 50)]),
+        (
+            [-50, -70, -49.5, -69.6],
+            [dt.datetime(2018, 1, 1, 0, 0, 0), dt.datetime(2018, 1, 1, 0, 0, 50)],
+        ),
+    ],
+)
+def test_load_subset(atl06_files, spatial_extent, date_range):
+    full = get_reader(atl06_files).load()
+    subset = get_reader(atl06_files).load(
+        spatial_extent=spatial_extent, date_range=date_range
+    )
+
+    keep = full.latitude.notnull()
+    if spatial_extent is not None:
+        keep &= (full.latitude <= -69.6) & (full.longitude <= -49.5)
+    if date_range is not None:
+        # the test files' delta_times are not decoded, so are seconds since 2018-01-01
+        keep &= full.delta_time <= 50
+
+    assert 0 < subset.latitude.count() < full.latitude.count()
+    assert subset.latitude.count() == keep.sum()
+    np.testing.assert_array_equal(
+        np.sort(subset.h_mean.values[subset.h_mean.notnull()]),
+        np.sort(full.h_mean.values[keep]),
+    )
+
+
+def test_load_subset_no_data(atl06_files):
+    with pytest.warns(UserWarning, match="None of your granules contain data"):
+        ds = get_reader(atl06_files).load(spatial_extent=[10, 10, 20, 20])
+    xr.testing.assert_identical(ds, xr.Dataset())
+
+
+@pytest.mark.parametrize(
+    "lat, expect",
+    [
+        ([-71, -70, -69, -68], slice(1, 3)),
+        ([-70, -68, -69, -68], np.array([0, 2])),
+        ([-72, -71, -68, -67], slice(0, 0)),
+    ],
+)
+def test_subset_indexer(lat, expect):
+    ds = xr.Dataset(
+        coords={
+            "delta_time": np.arange(4.0),
+            "latitude": ("delta_time", lat),
+            "longitude": ("delta_time", [-50.0] * 4),
+        }
+    )
+    subset = read._get_subset(spatial_extent=[-51, -70, -49, -69])
+    indexer = read._subset_indexer(ds, subset)
+    if isinstance(expect, slice):
+        assert indexer == expect
+    else:
+        np.testing.assert_array_equal(indexer, expect)
+
+
+def test_read_product_from_filename(atl06_files, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("the file metadata should not be read")
+
+    monkeypatch.setattr(read.is2ref, "extract_product", fail)
+    assert read.Read(atl06_files).product == "ATL06"
+
+
+def test_read_product_from_metadata(atl06_files, tmp_path):
+    renamed = shutil.copy(atl06_files[0], tmp_path / "renamed.h5")
+    reader = read.Read([atl06_files[1], str(renamed)])
+    assert reader.product == "ATL06"
+
+
+def flat_dataset(source, **kwargs):
+    ds = get_reader(source).load(**kwargs)
+    flat = read._flatten_granule(ds).to_dataframe()
+    return flat.sort_values(["gran_idx", "spot", "photon_idx"]).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("out_obj_type", ["pandas", pd.DataFrame])
+def test_load_table_matches_dataset(atl06_files, out_obj_type):
+    reader = read.Read(atl06_files, out_obj_type=out_obj_type)
+    reader.vars.append(var_list=["h_li", "latitude", "longitude", "h_mean"])
+    df = reader.load()
+    assert type(df) is pd.DataFrame
+
+    expect = flat_dataset(atl06_files)
+    df = df.sort_values(["gran_idx", "spot", "photon_idx"]).reset_index(drop=True)
+    for column in [
+        "gran_idx",
+        "spot",
+        "gt",
+        "photon_idx",
+        "delta_time",
+        "h_li",
+        "h_mean",
+        "latitude",
+        "cycle_number",
+        "rgt",
+        "data_start_utc",
+    ]:
+        np.testing.assert_array_equal(df[column].to_numpy(), expect[column].to_numpy())
+        assert df[column].dtype.kind == expect[column].dtype.kind
+
+
+def test_load_geodataframe(atl06_files):
+    reader = read.Read(atl06_files[0], out_obj_type="geopandas")
+    reader.vars.append(var_list=["h_li", "latitude", "longitude"])
+    gdf = reader.load(workers=2, executor="thread")
+    assert isinstance(gdf, gpd.GeoDataFrame)
+    assert gdf.crs == "EPSG:4326"
+    np.testing.assert_array_equal(gdf.geometry.x, gdf.longitude)
+    np.testing.assert_array_equal(gdf.geometry.y, gdf.latitude)
+
+    reader = read.Read(atl06_files[0], out_obj_type="geopandas")
+    reader.vars.append(var_list=["h_li"])
+    with pytest.raises(ValueError, match="requires latitude and longitude"):
+        reader.load()
+
+
+def test_load_arrow(atl06_files):
+    pa = pytest.importorskip("pyarrow")
+    reader = read.Read(atl06_files, out_obj_type=pa.Table)
+    reader.vars.append(var_list=["h_li", "latitude", "longitude", "h_mean"])
+    table = reader.load()
+    assert isinstance(table, pa.Table)
+    assert table.num_rows == len(flat_dataset(atl06_files))
+    assert table.schema.field("gran_idx").type == pa.uint64()
+
+
+def test_load_table_subset(atl06_files):
+    reader = read.Read(atl06_files, out_obj_type="pandas")
+    reader.vars.append(var_list=["h_li", "latitude", "longitude", "h_mean"])
+    kwargs = {
+        "spatial_extent": [-50, -70, -49.5, -69.6],
+        "date_range": [dt.datetime(2018, 1, 1), dt.datetime(2018, 1, 1, 0, 0, 50)],
+    }
+    df = reader.load(**kwargs)
+    expect = flat_dataset(atl06_files, **kwargs)
+    assert len(df) == len(expect)
+    np.testing.assert_array_equal(
+        np.sort(df.h_li.to_numpy()), np.sort(expect.h_li.to_numpy())
+    )
+
+    with pytest.warns(UserWarning, match="empty table"):
+        df = reader.load(spatial_extent=[0, 0, 1, 1])
+    assert df.empty
+
+
+def test_iter_granules_table(atl06_files):
+    reader = read.Read(atl06_files, out_obj_type="pandas")
+    reader.vars.append(var_list=["h_li", "latitude", "longitude"])
+    dfs = list(reader.iter_granules(batch_size=2))
+    assert [df.gran_idx.nunique() for df in dfs] == [2, 1]
+
+
+def test_read_h5_column(tmp_path):
+    with h5py.File(tmp_path / "test.h5", "w") as f:
+        dset = f.create_dataset("h_li", data=np.array([1, 3.4e38, 3, 4], dtype="f4"))
+        dset.attrs["_FillValue"] = np.float32(3.4e38)
+        np.testing.assert_array_equal(
+            read._read_h5_column(dset), np.array([1, np.nan, 3, 4], dtype="f4")
+        )
+        np.testing.assert_array_equal(
+            read._read_h5_column(dset, slice(2, 4)), np.array([3, 4], dtype="f4")
+        )
+        np.testing.assert_array_equal(
+            read._read_h5_column(dset, np.array([0, 3])), np.array([1, 4], dtype="f4")
+        )
+
+
+@pytest.mark.parametrize(
+    "out_obj_type, kwargs",
+    [("parquet", {}), ("pandas", {"lazy": True}), ("pandas", {"cache": True})],
+)
+def test_load_table_bad_input(atl06_files, out_obj_type, kwargs):
+    with pytest.raises(ValueError):
+        reader = read.Read(atl06_files, out_obj_type=out_obj_type)
+        reader.vars.append(var_list=["h_li"])
+        reader.load(**kwargs)
@@ -1,3 +1,7 @@
+import h5py
+import numpy as np
+import pytest
+
 import icepyx.core.variables as variables
 
 
@@ -22,3 +26,115 @@ def test_list_of_dict_vals():
     ]
 
     assert obs == exp
+
+
+def make_file(path, beams):
+    with h5py.File(path, "w") as f:
+        f.attrs["short_name"] = b"ATL06"
+        f.create_group("METADATA/DatasetIdentification").attrs["VersionID"] = b"006"
+        f.create_dataset("orbit_info/sc_orient", data=[1])
+        for gt in beams:
+            f.create_dataset(f"{gt}/land_ice_segments/h_li", data=[1.0])
+    return str(path)
+
+
+def test_avail_from_file_cached(tmp_path, monkeypatch):
+    first = variables.Variables(path=make_file(tmp_path / "a.h5", ["gt1l", "gt2l"]))
+    assert sorted(first.avail()) == [
+        "gt1l/land_ice_segments/h_li",
+        "gt2l/land_ice_segments/h_li",
+        "orbit_info/sc_orient",
+    ]
+
+    # a file with the same layout uses the cached list without walking the file
+    def fail(*args, **kwargs):
+        raise AssertionError("the file should not be walked")
+
+    monkeypatch.setattr(h5py.Group, "visititems", fail)
+    second = variables.Variables(path=make_file(tmp_path / "b.h5", ["gt1l", "gt2l"]))
+    assert second.avail() == first.avail()
+
+    # a file with a different layout is walked
+    third = variables.Variables(path=make_file(tmp_path / "c.h5", ["gt1l"]))
+    with pytest.raises(AssertionError, match="should not be walked"):
+        third.avail()
+
+
+@pytest.fixture
+def atl06_paths():
+    paths = [
+        "ancillary_data/atlas_sdp_gps_epoch",
+        "ancillary_data/land_ice/dt_hist",
+        "orbit_info/sc_orient",
+    ]
+    for gt in ["gt1l", "gt1r", "gt2l"]:
+        paths.extend(f"{gt}/land_ice_segments/{v}" for v in ["h_li", "latitude"])
+        paths.extend(
+            f"{gt}/land_ice_segments/fit_statistics/{v}" for v in ["h_mean", "h_li"]
+        )
+    return paths
+
+
+def test_path_index_lookups(atl06_paths):
+    index = variables._PathIndex(atl06_paths)
+
+    assert index.group_vars("gt1r/land_ice_segments") == ["h_li", "latitude"]
+    assert index.group_vars("gt1r/land_ice_segments/fit_statistics") == [
+        "h_mean",
+        "h_li",
+    ]
+    assert index.group_vars("gt3r/land_ice_segments") == []
+    assert index.paths_under("ancillary_data") == [
+        "ancillary_data/atlas_sdp_gps_epoch",
+        "ancillary_data/land_ice/dt_hist",
+    ]
+    assert index.paths_with_keyword("fit_statistics") == [
+        f"{gt}/land_ice_segments/fit_statistics/{v}"
+        for gt in ["gt1l", "gt1r", "gt2l"]
+        for v in ["h_mean", "h_li"]
+    ]
+    assert index.has_keyword("gt2l")
+    assert not index.has_keyword("gt3r")
+
+
+def test_path_index_matches_parse_var_list(atl06_paths):
+    index = variables._PathIndex(atl06_paths)
+    vgrp, paths = variables.Variables.parse_var_list(atl06_paths)
+
+    assert index.var_paths == vgrp
+    allpaths = np.unique(np.concatenate([np.unique(p) for p in paths]))
+    np.testing.assert_array_equal(index.group_keywords, allpaths)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"beam_list": ["gt1l"]},
+        {"keyword_list": ["fit_statistics"]},
+        {"beam_list": ["gt1l", "gt2l"], "keyword_list": ["fit_statistics"]},
+        {"var_list": ["h_li"], "beam_list": ["gt1r"]},
+        {"var_list": ["h_li", "dt_hist"], "keyword_list": ["ancillary_data"]},
+    ],
+)
+def test_append_with_path_index(atl06_paths, kwargs):
+    vars = variables.Variables.__new__(variables.Variables)
+    vars._avail = atl06_paths
+    vars._product = "ATL06"
+    vars.wanted = None
+    vars.append(**kwargs)
+
+    # the paths of each variable that contain (all) the requested beams/keywords
+    var_list = kwargs.get("var_list")
+    exp = {}
+    for path in atl06_paths:
+        kws = path.split("/")
+        if var_list is not None and kws[-1] not in var_list:
+            continue
+        if all(
+            any(kw in kws for kw in kwargs[arg])
+            for arg in ["beam_list", "keyword_list"]
+            if arg in kwargs
+        ):
+            exp.setdefault(kws[-1], []).append(path)
+
+    assert vars.wanted == exp